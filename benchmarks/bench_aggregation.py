@@ -0,0 +1,85 @@
+# benchmarks/bench_aggregation.py
+"""Compare the fused aggregation pass against the per-analysis loops.
+
+Usage: python -m benchmarks.bench_aggregation --papers 1000000
+"""
+import argparse
+from typing import Any, Dict, List
+
+from scholar_analyzer.aggregation import PaperAggregator
+from scholar_analyzer.table import PaperTable
+from .common import best_of, make_papers
+
+
+def legacy_analysis(papers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The original ``_perform_analysis``: one full scan per result."""
+    yearly_counts = {}
+    for paper in papers:
+        year = paper.get('year')
+        if year:
+            yearly_counts[year] = yearly_counts.get(year, 0) + 1
+
+    citation_ranges = {
+        '0': 0, '1-10': 0, '11-50': 0,
+        '51-100': 0, '101-500': 0, '500+': 0
+    }
+    for paper in papers:
+        citations = paper.get('citations', 0)
+        if citations == 0:
+            citation_ranges['0'] += 1
+        elif citations <= 10:
+            citation_ranges['1-10'] += 1
+        elif citations <= 50:
+            citation_ranges['11-50'] += 1
+        elif citations <= 100:
+            citation_ranges['51-100'] += 1
+        elif citations <= 500:
+            citation_ranges['101-500'] += 1
+        else:
+            citation_ranges['500+'] += 1
+
+    venue_counts = {}
+    for paper in papers:
+        venue = paper.get('venue')
+        if venue:
+            venue_counts[venue] = venue_counts.get(venue, 0) + 1
+
+    return {
+        "yearly_data": dict(sorted(yearly_counts.items())),
+        "citation_data": citation_ranges,
+        "venue_data": dict(sorted(venue_counts.items(), key=lambda x: x[1], reverse=True)),
+        "metrics": {
+            "total_papers": len(papers),
+            "total_citations": sum(p.get("citations", 0) for p in papers),
+            "unique_venues": len(set(p.get("venue", "") for p in papers))
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    papers = make_papers(args.papers)
+
+    legacy_time, legacy = best_of(lambda: legacy_analysis(papers), args.repeat)
+    fused_time, fused = best_of(
+        lambda: PaperAggregator.from_papers(papers).results(), args.repeat)
+
+    table = PaperTable.from_papers(papers)
+    columnar_time, columnar = best_of(
+        lambda: PaperAggregator.from_table(table).results(), args.repeat)
+
+    assert fused == legacy, "fused aggregation diverged from the legacy loops"
+    assert columnar == legacy, "columnar aggregation diverged from the legacy loops"
+
+    print(f"papers:   {args.papers}")
+    print(f"legacy:   {legacy_time:.3f}s")
+    print(f"fused:    {fused_time:.3f}s ({legacy_time / fused_time:.2f}x)")
+    print(f"columnar: {columnar_time:.3f}s ({legacy_time / columnar_time:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
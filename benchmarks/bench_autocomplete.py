@@ -0,0 +1,58 @@
+# benchmarks/bench_autocomplete.py
+"""Latency of AuthorPrefixIndex.suggest for typed prefixes.
+
+Usage: python -m benchmarks.bench_autocomplete --authors 500000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from scholar_analyzer.autocomplete import AuthorPrefixIndex
+
+FIRST = ['james', 'maria', 'wei', 'anna', 'david', 'li', 'sara', 'john', 'yuki', 'omar']
+
+
+def make_names(n: int, seed: int = 0):
+    """Names of a common first name and a random surname, Zipf paper counts."""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    surnames = [''.join(letters[rng.integers(0, 26, rng.integers(4, 10))]) for _ in range(n)]
+    names = [f"{FIRST[i % len(FIRST)].title()} {surname.title()}"
+             for i, surname in enumerate(surnames)]
+    return names, rng.zipf(1.8, n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--authors', type=int, default=500000)
+    parser.add_argument('--queries', type=int, default=20000)
+    args = parser.parse_args()
+
+    names, counts = make_names(args.authors)
+    start = time.perf_counter()
+    index = AuthorPrefixIndex.from_names(names, counts)
+    build_time = time.perf_counter() - start
+
+    # Every prefix a user would type on the way to a random author.
+    rng = np.random.default_rng(1)
+    prefixes = []
+    while len(prefixes) < args.queries:
+        name = names[rng.integers(len(names))].lower()
+        prefixes.extend(name[:length] for length in range(1, len(name) + 1))
+
+    latencies = []
+    for prefix in prefixes[:args.queries]:
+        start = time.perf_counter()
+        index.suggest(prefix)
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies) * 1000
+
+    print(f"authors: {args.authors} ({len(index)} keys, {len(index._heavy)} heavy prefixes)")
+    print(f"build:   {build_time:.2f}s")
+    print(f"suggest: p50 {np.percentile(latencies, 50):.3f} ms, "
+          f"p99 {np.percentile(latencies, 99):.3f} ms, max {latencies.max():.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# benchmarks/bench_clustering.py
+"""Compare full and mini-batch k-means in ScholarStatistics.performClustering.
+
+Usage: python -m benchmarks.bench_clustering --papers 5000000 --clusters 8
+"""
+import argparse
+import time
+import tracemalloc
+
+from scholar_analyzer.static.js.modules.statistics import ScholarStatistics
+from .common import synthetic_table
+
+FEATURES = ['citations', 'year', 'author_count', 'venue_size', 'venue_citations']
+
+
+def run(statistics, method, clusters):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = statistics.performClustering(FEATURES, n_clusters=clusters,
+                                          method=method, seed=0)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=1000000)
+    parser.add_argument('--clusters', type=int, default=8)
+    args = parser.parse_args()
+
+    statistics = ScholarStatistics.from_table(synthetic_table(args.papers))
+    statistics.columns  # build the feature columns outside the timings
+
+    print(f"papers: {args.papers}, clusters: {args.clusters}")
+    for method in ('kmeans', 'minibatch'):
+        elapsed, peak, result = run(statistics, method, args.clusters)
+        print(f"{method:>9}: {elapsed:.2f}s, peak {peak / 2**20:.0f} MB, "
+              f"inertia {result['inertia']:.4g}, "
+              f"silhouette {result['silhouette_score']:.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_corpus.py
+"""Opening an ingested corpus directory against parsing the same papers as JSON.
+
+Usage: python -m benchmarks.bench_corpus --papers 5000000 --json-papers 200000
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.corpus import load_corpus, save_corpus
+from scholar_analyzer.table import StringColumn
+from .common import best_of, make_papers, synthetic_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=5000000)
+    parser.add_argument('--authors', type=int, default=1000000)
+    parser.add_argument('--json-papers', type=int, default=200000,
+                        help='Papers in the JSON file timed for comparison')
+    args = parser.parse_args()
+
+    table = synthetic_table(args.papers, n_authors=args.authors)
+    table.titles = StringColumn.from_strings(
+        f"A study of topic {i} with a title of typical length" for i in range(args.papers))
+
+    directory = tempfile.mkdtemp()
+    try:
+        corpus = os.path.join(directory, 'corpus')
+        start = time.perf_counter()
+        save_corpus(table, corpus)
+        saved = time.perf_counter() - start
+        opened, (loaded, _) = best_of(lambda: load_corpus(corpus))
+        assert len(loaded) == args.papers
+        analyzer_open, _ = best_of(lambda: ScholarAnalyzer.from_file(corpus))
+
+        source = os.path.join(directory, 'papers.json')
+        with open(source, 'w') as f:
+            json.dump({"papers": make_papers(args.json_papers)}, f)
+        parsed, _ = best_of(lambda: ScholarAnalyzer.from_file(source), repeat=1)
+    finally:
+        shutil.rmtree(directory)
+
+    per_paper = parsed / args.json_papers
+    print(f"papers: {args.papers}, distinct authors: {len(table.authors)}")
+    print(f"save corpus:     {saved:6.2f} s")
+    print(f"open corpus:     {opened:6.2f} s (analyzer: {analyzer_open:.2f} s)")
+    print(f"parse json:      {parsed:6.2f} s for {args.json_papers} papers, "
+          f"~{per_paper * args.papers:.0f} s for {args.papers}")
+
+
+if __name__ == '__main__':
+    main()
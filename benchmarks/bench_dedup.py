@@ -0,0 +1,89 @@
+# benchmarks/bench_dedup.py
+"""Near-duplicate detection with Deduplicator on a corpus with planted duplicates.
+
+Usage: python -m benchmarks.bench_dedup --papers 2000000 --duplicates 0.1
+"""
+import argparse
+import time
+
+import numpy as np
+
+from scholar_analyzer.dedup import Deduplicator
+from scholar_analyzer.table import StringColumn
+
+from .common import synthetic_table
+
+
+def make_titles(n: int, duplicates: float, seed: int = 0):
+    """Random 6-10 word titles; a ``duplicates`` fraction are noisy copies.
+
+    Copies differ from their original in case, punctuation or one dropped
+    character, as when the same paper arrives from two sources.  Returns
+    the titles and the row each title was copied from (itself if none).
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    vocabulary = [''.join(rng.choice(letters, rng.integers(3, 11))) for _ in range(20000)]
+    lengths = rng.integers(6, 11, n)
+    words = rng.integers(0, len(vocabulary), int(lengths.sum())).tolist()
+    titles, position = [], 0
+    for length in lengths.tolist():
+        titles.append(' '.join(vocabulary[w] for w in words[position:position + length]))
+        position += length
+
+    source = np.arange(n)
+    copies = np.flatnonzero(rng.random(n) < duplicates)
+    copies = copies[copies > 0]
+    for row, original in zip(copies.tolist(), rng.integers(0, copies).tolist()):
+        source[row] = source[original]
+    for row, kind in zip(copies.tolist(), rng.integers(0, 3, len(copies)).tolist()):
+        title = titles[source[row]]
+        if kind == 0:
+            title = title.title() + '.'
+        elif kind == 1:
+            title = title.replace(' ', ': ', 1)
+        else:
+            cut = len(title) // 2
+            title = title[:cut] + title[cut + 1:]
+        titles[row] = title
+    return titles, source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=2000000)
+    parser.add_argument('--duplicates', type=float, default=0.1)
+    args = parser.parse_args()
+
+    table = synthetic_table(args.papers)
+    titles, source = make_titles(args.papers, args.duplicates)
+    table.titles = StringColumn.from_strings(titles)
+    table.years[:] = table.years[source]
+    # Copies keep their original's venue, the evidence besides the title
+    # a real duplicate carries.
+    table.venue_ids[:] = table.venue_ids[source]
+
+    dedup = Deduplicator()
+    start = time.perf_counter()
+    signatures, present = dedup.signatures(table)
+    signature_time = time.perf_counter() - start
+    start = time.perf_counter()
+    into = dedup.find_duplicates(table)
+    find_time = time.perf_counter() - start
+    start = time.perf_counter()
+    removed = dedup.merge(table, into)
+    merge_time = time.perf_counter() - start
+
+    planted = int(np.sum(source != np.arange(args.papers)))
+    found = into != np.arange(args.papers)
+    correct = int(np.sum(found & (into == source)))
+    print(f"papers: {args.papers}, planted duplicates: {planted}")
+    print(f"signatures:      {signature_time:.1f}s")
+    print(f"find_duplicates: {find_time:.1f}s (signatures included)")
+    print(f"merge:           {merge_time:.1f}s, {removed} removed")
+    print(f"recall {correct / max(planted, 1):.4f}, "
+          f"false merges {int(found.sum()) - correct}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_filters.py
+"""Compare FilterIndex lookups and FilterPlan with list-comprehension filtering.
+
+Usage: python -m benchmarks.bench_filters --papers 2000000
+"""
+import argparse
+import time
+
+from scholar_analyzer.filter_index import FilterIndex, FilterPlan, intersect
+from .common import best_of, synthetic_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=2000000)
+    args = parser.parse_args()
+
+    table = synthetic_table(args.papers)
+    records = table.to_records()
+    index = FilterIndex(table)
+
+    start = time.perf_counter()
+    index.year_range(2000, 2000)
+    index.citation_range(0, 0)
+    index.venues(['Venue 1'])
+    index.authors(['Author 1'])
+    build_time = time.perf_counter() - start
+
+    compound = {'year_range': {'start': 2000, 'end': 2015}, 'citations': {'min': 2},
+                'authors': ['Author 3', 'Author 4']}
+    queries = {
+        'year 2010-2011': (lambda: index.year_range(2010, 2011),
+                           lambda: [p for p in records if 2010 <= p.get('year', 0) <= 2011]),
+        'citations >= 500': (lambda: index.citation_range(500),
+                             lambda: [p for p in records if p['citations'] >= 500]),
+        'venue': (lambda: index.venues(['Venue 7']),
+                  lambda: [p for p in records if p.get('venue') == 'Venue 7']),
+        'author': (lambda: index.authors(['Author 7']),
+                   lambda: [p for p in records if 'Author 7' in p['authors']]),
+        'venue and years': (lambda: intersect(index.venues(['Venue 7']),
+                                              index.year_range(2010, 2011)),
+                            lambda: [p for p in records if p.get('venue') == 'Venue 7'
+                                     and 2010 <= p.get('year', 0) <= 2011]),
+        'planned compound': (lambda: FilterPlan.from_config(index, compound).rows(),
+                             lambda: [p for p in records if 2000 <= p.get('year', 0) <= 2015
+                                      and p['citations'] >= 2 and
+                                      ('Author 3' in p['authors'] or 'Author 4' in p['authors'])]),
+        'dense compound': (lambda: FilterPlan.from_config(
+                               index, {'year_range': {'start': 1990, 'end': 2020},
+                                       'citations': {'min': 1}}).rows(),
+                           lambda: [p for p in records if 1990 <= p.get('year', 0) <= 2020
+                                    and p['citations'] >= 1]),
+    }
+
+    print(f"papers: {args.papers}, index build: {build_time:.2f}s")
+    for name, (indexed, scan) in queries.items():
+        indexed_time, rows = best_of(indexed)
+        scan_time, _ = best_of(scan, repeat=1)
+        print(f"{name:>18}: {len(rows):>7} rows, index {indexed_time * 1000:7.2f} ms, "
+              f"scan {scan_time * 1000:7.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
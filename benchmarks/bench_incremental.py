@@ -0,0 +1,49 @@
+# benchmarks/bench_incremental.py
+"""Compare incremental add_papers() against re-analyzing from scratch.
+
+Usage: python -m benchmarks.bench_incremental --papers 1000000 --delta 5000
+"""
+import argparse
+import time
+
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from .common import make_papers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    parser.add_argument('--delta', type=int, default=5000)
+    args = parser.parse_args()
+
+    papers = make_papers(args.papers + args.delta)
+    base, delta = papers[:args.papers], papers[args.papers:]
+
+    analyzer = ScholarAnalyzer({"papers": base})
+    analyzer._perform_analysis()
+    analyzer._collaboration_graph().upper
+
+    # Both timings cover the maintained aggregates (summary and
+    # collaboration graph), not formatting them as output.
+    start = time.perf_counter()
+    analyzer.add_papers(delta)
+    incremental = analyzer._perform_analysis()
+    incremental_pairs = analyzer._collaboration_graph().upper
+    incremental_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fresh = ScholarAnalyzer({"papers": papers})
+    full = fresh._perform_analysis()
+    full_pairs = fresh._collaboration_graph().upper
+    full_time = time.perf_counter() - start
+
+    assert incremental == full, "incremental results diverged from a full recompute"
+    assert (incremental_pairs != full_pairs).nnz == 0, "collaboration counts diverged"
+
+    print(f"papers:      {args.papers} + {args.delta}")
+    print(f"full:        {full_time:.3f}s")
+    print(f"incremental: {incremental_time:.3f}s ({full_time / incremental_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
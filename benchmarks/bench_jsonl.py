@@ -0,0 +1,40 @@
+# benchmarks/bench_jsonl.py
+"""Parallel JSON Lines loading: wall time by number of worker processes.
+
+Usage: python -m benchmarks.bench_jsonl --papers 1000000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from scholar_analyzer.jsonl import load_jsonl
+from .common import best_of, make_papers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=500000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.jsonl')
+    with os.fdopen(fd, 'w') as f:
+        for paper in make_papers(args.papers):
+            f.write(json.dumps(paper) + '\n')
+    try:
+        print(f"papers: {args.papers} ({os.path.getsize(path) / 2**20:.1f} MiB), "
+              f"{os.cpu_count()} cores")
+        baseline = None
+        for workers in args.workers:
+            elapsed, (table, _) = best_of(lambda: load_jsonl(path, workers), repeat=1)
+            assert len(table) == args.papers
+            baseline = baseline or elapsed
+            print(f"workers {workers:3d}: {elapsed:6.2f} s ({baseline / elapsed:.1f}x)")
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
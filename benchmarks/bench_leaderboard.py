@@ -0,0 +1,38 @@
+# benchmarks/bench_leaderboard.py
+"""Partial-selection leaderboards against a full sort of the scores.
+
+Usage: python -m benchmarks.bench_leaderboard --entries 2000000 --top 10
+"""
+import argparse
+
+import numpy as np
+
+from scholar_analyzer.leaderboard import leaderboard, top_k
+
+from .common import best_of
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=2000000)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    scores = rng.zipf(1.8, args.entries).astype(np.int64)
+    ties = rng.integers(0, 1000, args.entries)
+    names = [f"entry {i}" for i in range(args.entries)]
+
+    full, expected = best_of(lambda: np.lexsort((-ties, -scores))[:args.top])
+    partial, ids = best_of(lambda: top_k(scores, args.top, ties))
+    assert ids.tolist() == expected.tolist()
+    board, _ = best_of(lambda: leaderboard(names, scores, args.top, ties=ties))
+
+    print(f"entries: {args.entries}, top {args.top}")
+    print(f"full sort:   {full * 1000:.1f} ms")
+    print(f"top_k:       {partial * 1000:.1f} ms ({full / partial:.0f}x)")
+    print(f"leaderboard: {board * 1000:.1f} ms (with other bucket)")
+
+
+if __name__ == '__main__':
+    main()
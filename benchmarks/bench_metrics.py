@@ -0,0 +1,42 @@
+# benchmarks/bench_metrics.py
+"""Time and trace memory of NetworkMetrics on a synthetic co-authorship graph.
+
+Usage: python -m benchmarks.bench_metrics --authors 1000000 --papers 4000000
+"""
+import argparse
+import time
+import tracemalloc
+
+from scholar_analyzer.network import CollaborationGraph
+from scholar_analyzer.network_metrics import NetworkMetrics
+from .common import synthetic_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--authors', type=int, default=200000)
+    parser.add_argument('--papers', type=int, default=800000)
+    parser.add_argument('--samples', type=int, default=16)
+    args = parser.parse_args()
+
+    table = synthetic_table(args.papers, args.authors)
+    graph = CollaborationGraph.from_table(table)
+    graph.adjacency  # build outside the measured section
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    metrics = NetworkMetrics(graph, betweenness_samples=args.samples)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    graph_bytes = sum(m.data.nbytes + m.indices.nbytes + m.indptr.nbytes
+                      for m in (graph.upper, graph.adjacency))
+    print(f"authors:  {metrics.n_nodes}")
+    print(f"edges:    {metrics.n_edges}")
+    print(f"graph:    {graph_bytes / 2**20:.1f} MB")
+    print(f"metrics:  {elapsed:.2f}s, peak {peak / 2**20:.1f} MB extra")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_mmap.py
+"""Memory-mapped corpus: open time, chunked aggregation and filter scans against sequential reads.
+
+Usage: python -m benchmarks.bench_mmap --papers 20000000
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+from scholar_analyzer.aggregation import PaperAggregator
+from scholar_analyzer.corpus import COLUMNS, load_corpus, save_corpus
+from scholar_analyzer.filter_index import FilterScan
+from .common import best_of, synthetic_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=20000000)
+    parser.add_argument('--authors', type=int, default=1000000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        corpus = os.path.join(directory, 'corpus')
+        save_corpus(synthetic_table(args.papers, n_authors=args.authors), corpus)
+
+        opened, (table, _) = best_of(lambda: load_corpus(corpus))
+        loaded, _ = best_of(lambda: load_corpus(corpus, mmap=False), repeat=1)
+        scanned = sum(os.path.getsize(os.path.join(corpus, f'{name}.npy'))
+                      for name in ('years', 'citations', 'venue_ids'))
+        sequential, _ = best_of(lambda: [
+            np.fromfile(os.path.join(corpus, f'{name}.npy'), dtype=np.uint8).sum()
+            for name in ('years', 'citations', 'venue_ids')])
+
+        aggregated, _ = best_of(lambda: PaperAggregator.from_table(table))
+        # Heap allocated while aggregating; mapped pages are not counted.
+        tracemalloc.start()
+        PaperAggregator.from_table(table)
+        working = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+        filters = {'year_range': {'start': 2010, 'end': 2015}, 'citations': {'min': 20}}
+        filtered, rows = best_of(lambda: FilterScan.from_config(table, filters).rows())
+        corpus_bytes = sum(os.path.getsize(os.path.join(corpus, name))
+                           for name in os.listdir(corpus))
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"papers: {args.papers}, corpus: {corpus_bytes / 2**30:.2f} GiB, "
+          f"columns: {', '.join(COLUMNS)}")
+    print(f"open mapped:      {opened * 1000:8.2f} ms  (read into memory: {loaded:.2f} s)")
+    print(f"sequential read:  {sequential:8.2f} s  {scanned / sequential / 2**30:.2f} GiB/s")
+    print(f"aggregate:        {aggregated:8.2f} s  {scanned / aggregated / 2**30:.2f} GiB/s, "
+          f"peak heap {working:.0f} MiB")
+    print(f"filter scan:      {filtered:8.2f} s  {len(rows)} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_network.py
+"""Compare dict-of-name-pairs link extraction against the sparse CollaborationGraph.
+
+Usage: python -m benchmarks.bench_network --papers 200000 --consortia 20
+"""
+import argparse
+import random
+
+from scholar_analyzer.network import CollaborationGraph
+from scholar_analyzer.table import PaperTable
+from .common import best_of, make_papers
+
+
+def legacy_pairs(papers):
+    """The original per-pair dict keyed by sorted author-name tuples."""
+    collaborations = {}
+    for paper in papers:
+        authors = paper.get('authors', [])
+        for i, author1 in enumerate(authors):
+            for author2 in authors[i + 1:]:
+                key = tuple(sorted([author1, author2]))
+                collaborations[key] = collaborations.get(key, 0) + 1
+    return collaborations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    parser.add_argument('--consortia', type=int, default=20,
+                        help='number of 1,000-author papers to mix in')
+    parser.add_argument('--max-authors', type=int, default=None)
+    args = parser.parse_args()
+
+    papers = make_papers(args.papers)
+    rng = random.Random(1)
+    pool = [f"Author {i}" for i in range(50000)]
+    for i in range(args.consortia):
+        papers.append({"title": f"Consortium {i}", "authors": rng.sample(pool, 1000)})
+    table = PaperTable.from_papers(papers)
+
+    legacy_time, legacy = best_of(lambda: legacy_pairs(papers), repeat=1)
+    graph_time, graph = best_of(
+        lambda: CollaborationGraph.from_table(table, max_authors=args.max_authors).upper,
+        repeat=1)
+
+    if args.max_authors is None:
+        assert graph.nnz == len(legacy), "edge sets diverged"
+
+    print(f"papers: {args.papers} + {args.consortia} consortia")
+    print(f"edges:  {graph.nnz}")
+    print(f"legacy: {legacy_time:.3f}s")
+    print(f"sparse: {graph_time:.3f}s ({legacy_time / graph_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
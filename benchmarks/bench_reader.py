@@ -0,0 +1,60 @@
+# benchmarks/bench_reader.py
+"""Peak memory and time of loading a corpus file: json.load against streaming.
+
+Usage: python -m benchmarks.bench_reader --papers 500000
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.table import PaperTable
+from .common import make_papers
+
+
+def peak(func):
+    """Return the peak traced memory and wall time of ``func``."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, highest = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return highest, elapsed, result
+
+
+def load_whole(path):
+    with open(path) as f:
+        return PaperTable.from_papers(json.load(f)["papers"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'w') as f:
+        json.dump({"metadata": {"query": "bench"}, "papers": make_papers(args.papers)}, f)
+    try:
+        size = os.path.getsize(path)
+        whole_peak, whole_time, whole = peak(lambda: load_whole(path))
+        del whole
+        stream_peak, stream_time, analyzer = peak(lambda: ScholarAnalyzer.from_file(path))
+        assert len(analyzer.table) == args.papers
+    finally:
+        os.remove(path)
+
+    print(f"papers:      {args.papers} ({size / 2**20:.1f} MiB file)")
+    print(f"json.load:   peak {whole_peak / 2**20:8.1f} MiB, {whole_time:.2f} s")
+    print(f"streaming:   peak {stream_peak / 2**20:8.1f} MiB, {stream_time:.2f} s "
+          f"({whole_peak / stream_peak:.1f}x less memory)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# benchmarks/bench_serialization.py
+"""JSON encode/decode time of an analysis result: stdlib indent=2 against each backend.
+
+Usage: python -m benchmarks.bench_serialization --papers 200000
+"""
+import argparse
+import json
+
+from scholar_analyzer import serialization
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from .common import best_of, make_papers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    args = parser.parse_args()
+
+    analyzer = ScholarAnalyzer({"papers": make_papers(args.papers)})
+    document = {"papers": analyzer.table.to_records(),
+                "analysis": analyzer.analyze()["analysis"]}
+
+    old_dump, text = best_of(lambda: json.dumps(document, indent=2))
+    old_load, _ = best_of(lambda: json.loads(text))
+    print(f"papers: {args.papers}")
+    print(f"stdlib indent=2: dump {old_dump:6.2f} s, load {old_load:6.2f} s "
+          f"({len(text) / 2**20:.1f} MiB)")
+    for backend in serialization.BACKENDS:
+        try:
+            serialization.set_backend(backend)
+        except ImportError:
+            continue
+        dump, data = best_of(lambda: serialization.dumpb(document))
+        load, _ = best_of(lambda: serialization.loads(data))
+        print(f"{backend:>15}: dump {dump:6.2f} s, load {load:6.2f} s "
+              f"({len(data) / 2**20:.1f} MiB, {(old_dump + old_load) / (dump + load):.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
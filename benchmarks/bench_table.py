@@ -0,0 +1,47 @@
+# benchmarks/bench_table.py
+"""Compare memory held by paper dicts against the columnar PaperTable.
+
+Usage: python -m benchmarks.bench_table --papers 500000
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from scholar_analyzer.table import PaperTable
+from .common import make_papers
+
+
+def traced(func):
+    """Return the memory still allocated by ``func``'s result, and the result."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    args = parser.parse_args()
+
+    raw = json.dumps({"papers": make_papers(args.papers)})
+
+    dict_bytes, papers = traced(lambda: json.loads(raw)["papers"])
+    del papers
+    table_bytes, table = traced(
+        lambda: PaperTable.from_papers(json.loads(raw)["papers"]))
+
+    print(f"papers:      {len(table)}")
+    print(f"raw json:    {len(raw) / 2**20:8.1f} MiB")
+    print(f"dicts:       {dict_bytes / 2**20:8.1f} MiB")
+    print(f"table:       {table_bytes / 2**20:8.1f} MiB "
+          f"({dict_bytes / table_bytes:.1f}x smaller than dicts, "
+          f"{table_bytes / len(raw):.2f}x raw json)")
+
+
+if __name__ == '__main__':
+    main()
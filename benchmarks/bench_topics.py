@@ -0,0 +1,50 @@
+# benchmarks/bench_topics.py
+"""Time building a TopicIndex and summarizing it over synthetic titles.
+
+Usage: python -m benchmarks.bench_topics --papers 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from scholar_analyzer.topics import TopicIndex
+
+
+def make_titles(n: int, vocabulary: int = 20000, seed: int = 0):
+    """Titles of 5-12 Zipf-distributed words with some punctuation."""
+    rng = np.random.default_rng(seed)
+    words = np.array([f"term{i}" for i in range(vocabulary)]
+                     + ["the", "of", "and", "for", "a", "on"])
+    lengths = rng.integers(5, 13, n)
+    drawn = words[(rng.zipf(1.2, lengths.sum()) - 1) % len(words)].tolist()
+    titles, start = [], 0
+    for length in lengths.tolist():
+        titles.append(" ".join(drawn[start:start + length]).capitalize() + ":")
+        start += length
+    return titles, rng.integers(0, 200, n), rng.integers(1990, 2025, n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=1000000)
+    args = parser.parse_args()
+
+    titles, citations, years = make_titles(args.papers)
+
+    start = time.perf_counter()
+    index = TopicIndex.from_texts(titles, citations, years)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summary = index.summary(50)
+    summary_time = time.perf_counter() - start
+
+    print(f"papers:  {args.papers}")
+    print(f"terms:   {len(index.terms)} ({index.counts.nnz} postings)")
+    print(f"build:   {build_time:.2f}s")
+    print(f"summary: {summary_time:.2f}s ({len(summary['cooccurrence'])} co-occurring pairs)")
+
+
+if __name__ == '__main__':
+    main()
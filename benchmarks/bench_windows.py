@@ -0,0 +1,34 @@
+# benchmarks/bench_windows.py
+"""Time building a TimeWindowIndex and querying every window size.
+
+Usage: python -m benchmarks.bench_windows --papers 5000000
+"""
+import argparse
+import time
+
+from scholar_analyzer.time_windows import TimeWindowIndex
+from .common import synthetic_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=1000000)
+    args = parser.parse_args()
+
+    table = synthetic_table(args.papers)
+
+    start = time.perf_counter()
+    index = TimeWindowIndex.from_table(table)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    n_windows = sum(len(index.windows(size)) for size in range(1, len(index) + 1))
+    query_time = time.perf_counter() - start
+
+    print(f"papers:  {args.papers} over {len(index)} years")
+    print(f"build:   {build_time:.3f}s")
+    print(f"windows: {n_windows} across all sizes in {query_time:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
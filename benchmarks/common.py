@@ -0,0 +1,60 @@
+# benchmarks/common.py
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from scholar_analyzer.table import PaperTable, StringColumn, StringPool
+
+
+def make_papers(n: int, seed: int = 0, n_venues: int = 2000,
+                n_authors: int = 50000) -> List[Dict[str, Any]]:
+    """Generate a synthetic corpus shaped like the analyzer's input."""
+    rng = random.Random(seed)
+    venues = [f"Venue {i}" for i in range(n_venues)]
+    authors = [f"Author {i}" for i in range(n_authors)]
+    papers = []
+    for i in range(n):
+        papers.append({
+            "title": f"Paper {i}",
+            "authors": rng.sample(authors, rng.randint(1, 6)),
+            "year": rng.randint(1990, 2024),
+            "venue": rng.choice(venues) if rng.random() > 0.05 else "",
+            "citations": int(rng.paretovariate(1.2)) - 1,
+        })
+    return papers
+
+
+def best_of(func: Callable[[], Any], repeat: int = 3) -> Tuple[float, Any]:
+    """Run ``func`` ``repeat`` times and return the fastest time and last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def synthetic_table(n_papers: int, n_authors: int = 50000, n_venues: int = 2000,
+                    seed: int = 0) -> PaperTable:
+    """A ``PaperTable`` built directly from random columns.
+
+    Much faster than ``make_papers`` at millions of rows: author slots
+    follow a skewed popularity, citations a Pareto tail.  Titles are
+    empty.
+    """
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(1, 9, n_papers)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    return PaperTable(
+        titles=StringColumn.from_strings([''] * n_papers),
+        years=rng.integers(1990, 2025, n_papers).astype(np.int32),
+        citations=(rng.pareto(1.2, n_papers) * 5).astype(np.int64),
+        venue_ids=rng.integers(0, n_venues, n_papers).astype(np.int32),
+        author_offsets=offsets.astype(np.int64),
+        author_ids=(rng.zipf(1.3, offsets[-1]) % n_authors).astype(np.int32),
+        venues=StringPool([''] + [f"Venue {i}" for i in range(1, n_venues)]),
+        authors=StringPool(f"Author {i}" for i in range(n_authors)),
+    )
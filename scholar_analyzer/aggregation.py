@@ -0,0 +1,188 @@
+# scholar_analyzer/aggregation.py
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .histogram import Binning, CITATION_RANGES
+from .table import SCAN_CHUNK
+
+# Values below this are counted with ``np.bincount`` into a dense array;
+# chunks holding larger (or negative) values fall back to ``np.unique``.
+DENSE_COUNT_LIMIT = 1 << 20
+
+
+class PaperAggregator:
+    """Single-pass accumulator for the analyzer's summary results.
+
+    Yearly counts, citation buckets, venue counts and the headline metrics
+    are all derived from one visit of each paper, so a corpus is scanned
+    once instead of once per analysis.  Citations are kept as a histogram of
+    exact values; bucketing and totals are computed from its (much smaller)
+    set of distinct values when results are requested.
+    """
+
+    def __init__(self):
+        self.yearly_counts: Dict[Any, int] = {}
+        self.citation_counts: Dict[int, int] = {}
+        # Keyed by the raw venue value so that papers without a venue still
+        # count towards ``unique_venues`` the way they always have.
+        self.venue_counts: Dict[Any, int] = {}
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Dict[str, Any]]) -> "PaperAggregator":
+        """Build an aggregator from an iterable of paper records."""
+        aggregator = cls()
+        aggregator.update(papers)
+        return aggregator
+
+    @classmethod
+    def from_table(cls, table) -> "PaperAggregator":
+        """Build an aggregator from a ``PaperTable`` with vectorized counts."""
+        aggregator = cls()
+        aggregator.update_table(table)
+        return aggregator
+
+    def update(self, papers: Iterable[Dict[str, Any]]) -> "PaperAggregator":
+        """Fold papers into the running aggregates."""
+        yearly_counts = self.yearly_counts
+        citation_counts = self.citation_counts
+        venue_counts = self.venue_counts
+        yearly_get = yearly_counts.get
+        citation_get = citation_counts.get
+        venue_get = venue_counts.get
+
+        for paper in papers:
+            get = paper.get
+
+            year = get('year')
+            if year:
+                yearly_counts[year] = yearly_get(year, 0) + 1
+
+            citations = get('citations', 0) or 0
+            citation_counts[citations] = citation_get(citations, 0) + 1
+
+            venue = get('venue', '') or ''
+            venue_counts[venue] = venue_get(venue, 0) + 1
+
+        return self
+
+    def update_table(self, table, rows: Optional[np.ndarray] = None,
+                     sign: int = 1, chunk_size: int = SCAN_CHUNK) -> "PaperAggregator":
+        """Fold the rows of a ``PaperTable`` (all rows by default) into the aggregates.
+
+        Columns are read ``chunk_size`` rows at a time and each chunk is
+        reduced with one NumPy call per column, so a memory-mapped table
+        streams from disk with a bounded working set.  Python only touches
+        the distinct values that come out of the reduction.  ``sign=-1``
+        subtracts the rows instead, which is how removals are applied.
+        """
+        years, citations = _Tally(), _Tally()
+        venues = _Tally(limit=len(table.venues))
+        n = len(table) if rows is None else len(rows)
+        for start in range(0, n, chunk_size):
+            select = (slice(start, start + chunk_size) if rows is None
+                      else rows[start:start + chunk_size])
+            years.add(table.years[select])
+            citations.add(table.citations[select])
+            venues.add(table.venue_ids[select])
+
+        values, counts = years.items()
+        _merge_counts(self.yearly_counts,
+                      [value for value in values if value],
+                      [sign * count for value, count in zip(values, counts) if value])
+        values, counts = citations.items()
+        _merge_counts(self.citation_counts, values, [sign * count for count in counts])
+        values, counts = venues.items()
+        _merge_counts(self.venue_counts, [table.venues[id_] for id_ in values],
+                      [sign * count for count in counts])
+        return self
+
+    def merge(self, other: "PaperAggregator") -> "PaperAggregator":
+        """Add the counts of another aggregator, e.g. one built on a shard."""
+        for target, counts in ((self.yearly_counts, other.yearly_counts),
+                               (self.citation_counts, other.citation_counts),
+                               (self.venue_counts, other.venue_counts)):
+            _merge_counts(target, counts.keys(), counts.values())
+        return self
+
+    def citation_values(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct citation values and how many papers have each."""
+        values = np.fromiter(self.citation_counts.keys(), dtype=np.int64,
+                             count=len(self.citation_counts))
+        weights = np.fromiter(self.citation_counts.values(), dtype=np.int64,
+                              count=len(self.citation_counts))
+        return values, weights
+
+    @property
+    def total_papers(self) -> int:
+        return sum(self.venue_counts.values())
+
+    @property
+    def total_citations(self) -> int:
+        return sum(value * count for value, count in self.citation_counts.items())
+
+    def citation_distribution(self, binning: Optional[Binning] = None) -> Dict[str, int]:
+        """Bin the citation histogram (``CITATION_RANGES`` by default)."""
+        binning = binning or Binning.default()
+        return binning.histogram(*self.citation_values())
+
+    def results(self, binning: Optional[Binning] = None) -> Dict[str, Any]:
+        """Return aggregates in the shape produced by ``_perform_analysis``."""
+        venue_data = {
+            venue: count for venue, count in self.venue_counts.items() if venue
+        }
+        return {
+            "yearly_data": dict(sorted(self.yearly_counts.items())),
+            "citation_data": self.citation_distribution(binning),
+            "venue_data": dict(
+                sorted(venue_data.items(), key=lambda x: x[1], reverse=True)
+            ),
+            "metrics": {
+                "total_papers": self.total_papers,
+                "total_citations": self.total_citations,
+                "unique_venues": len(self.venue_counts)
+            }
+        }
+
+
+def _merge_counts(target: Dict[Any, int], keys, counts) -> None:
+    """Add ``counts`` for ``keys`` into the ``target`` counter dict.
+
+    Keys whose count drops to zero are removed, so removals leave the
+    counters exactly as if the papers had never been added.
+    """
+    get = target.get
+    for key, count in zip(keys, counts):
+        total = get(key, 0) + count
+        if total:
+            target[key] = total
+        else:
+            target.pop(key, None)
+
+
+class _Tally:
+    """Counts of integer values accumulated over chunks of a column."""
+
+    def __init__(self, limit: int = DENSE_COUNT_LIMIT):
+        self.limit = limit
+        self.dense = np.zeros(0, dtype=np.int64)
+        self.sparse: Dict[int, int] = {}
+
+    def add(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        if values.min() >= 0 and values.max() < self.limit:
+            counts = np.bincount(values, minlength=len(self.dense))
+            counts[:len(self.dense)] += self.dense
+            self.dense = counts
+        else:
+            values, counts = np.unique(values, return_counts=True)
+            _merge_counts(self.sparse, values.tolist(), counts.tolist())
+
+    def items(self) -> Tuple[List[int], List[int]]:
+        """Distinct values in ascending order and their counts."""
+        present = np.flatnonzero(self.dense)
+        counts = dict(zip(present.tolist(), self.dense[present].tolist()))
+        _merge_counts(counts, self.sparse.keys(), self.sparse.values())
+        values = sorted(counts)
+        return values, [counts[value] for value in values]
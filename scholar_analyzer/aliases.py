@@ -0,0 +1,304 @@
+# scholar_analyzer/aliases.py
+import os
+import re
+import tempfile
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from . import serialization
+from .table import StringPool
+
+ALIAS_FORMAT_VERSION = 1
+
+# Lowercase words that belong to the surname that follows them.
+SURNAME_PARTICLES = frozenset([
+    'van', 'von', 'der', 'den', 'de', 'del', 'della', 'di', 'da', 'dos', 'das',
+    'du', 'la', 'le', 'ten', 'ter',
+])
+
+# First names at least this long also match with one typo inside the
+# name ("Micheal" and "Michael"); shorter ones must be equal ("Jon" is
+# not "John").
+FUZZY_MIN_LENGTH = 5
+
+_TOKEN = re.compile(r"[^\W\d_]+(?:['-][^\W\d_]+)*")
+
+GivenNames = Tuple[str, ...]
+
+
+def fold(text: str) -> str:
+    """Lowercase ``text`` and strip accents, for comparing names."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def parse_name(name: str) -> Tuple[str, GivenNames]:
+    """Folded ``(surname, given names)`` of an author name.
+
+    Understands "John Smith", "Smith, John", "J. A. Smith", "Smith JA"
+    and surname particles ("Ludwig van Beethoven").  Given names are
+    full words or single-letter initials, in order.
+    """
+    if ',' in name:
+        surname_part, _, given_part = name.partition(',')
+        surname, given = _TOKEN.findall(surname_part), _TOKEN.findall(given_part)
+    else:
+        tokens = _TOKEN.findall(name)
+        if len(tokens) > 1 and all(_is_initials(token) for token in tokens[1:]):
+            surname, given = tokens[:1], tokens[1:]  # "Smith JA"
+        else:
+            split = len(tokens) - 1
+            while split > 1 and tokens[split - 1] in SURNAME_PARTICLES:
+                split -= 1
+            surname, given = tokens[split:], tokens[:split]
+
+    given_names: List[str] = []
+    for token in given:
+        if _is_initials(token):
+            given_names.extend(fold(token))
+        else:
+            given_names.append(fold(token))
+    return ' '.join(fold(token) for token in surname), tuple(given_names)
+
+
+def blocking_key(surname: str, given: GivenNames) -> Tuple[str, str]:
+    """Surname plus first initial: only names sharing it are compared."""
+    return surname, given[0][0] if given else ''
+
+
+class AuthorAliases:
+    """Persistent table mapping author name variants to a canonical name.
+
+    Names are parsed into a surname and given names and grouped into
+    blocks by surname and first initial, so "John Smith", "Smith, John"
+    and "J. Smith" meet while the number of comparisons stays close to
+    linear.  Within a block:
+
+    * full first names are equal, or one typo apart when at least
+      ``FUZZY_MIN_LENGTH`` letters long: a substitution or adjacent swap
+      that leaves the first and last letters alone, so "Maria" and
+      "Mario" or "Daniel" and "Daniela" stay apart.  A typo link is only
+      used when each name has no other such neighbour, and links never
+      chain;
+    * a differing middle initial keeps two names apart, and a name
+      without one joins the name that has one only when that is unique;
+    * initials-only names ("J. Smith") join the full name they are
+      compatible with, but only if there is exactly one.
+
+    Ambiguous names are left alone rather than guessed.  The canonical
+    name of a group is its most common full spelling.  ``aliases``
+    records every name seen, so a saved table maps names consistently
+    across runs and new variants join the groups already known.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        self.aliases: Dict[str, str] = dict(aliases or {})
+        # Canonical names by block with the number of names mapped to
+        # them, built on the first update.
+        self._anchors: Optional[Dict[Tuple[str, str], Dict[str, Tuple[GivenNames, int]]]] = None
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "AuthorAliases":
+        """Read a table written by ``save``."""
+        document = serialization.loads(Path(path).read_bytes())
+        if document.get('version') != ALIAS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported alias table version: {document.get('version')}")
+        return cls(document['aliases'])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the table as JSON, replacing ``path`` atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, 'wb') as f:
+            serialization.dump({'version': ALIAS_FORMAT_VERSION, 'aliases': self.aliases}, f,
+                               sort_keys=True)
+        os.replace(tmp, path)
+
+    def __len__(self) -> int:
+        return len(self.aliases)
+
+    def canonical(self, name: str) -> str:
+        """Canonical form of ``name`` (itself when unknown)."""
+        return self.aliases.get(name, name)
+
+    def update(self, names: Sequence[str], counts: Optional[Sequence[int]] = None) -> int:
+        """Resolve the ``names`` not yet in the table.
+
+        ``counts`` (papers per name) decide which spelling becomes
+        canonical.  Known names keep their mapping; new names join the
+        group of a known canonical name when they match it.
+
+        Returns:
+            Number of new names
+        """
+        if counts is None:
+            counts = [1] * len(names)
+        weights: Dict[str, int] = {}
+        for name, count in zip(names, counts):
+            if name and name not in self.aliases:
+                weights[name] = weights.get(name, 0) + int(count)
+        if not weights:
+            return 0
+
+        # Known canonical names take part as anchors, ranked by how many
+        # names already map to them; only blocks with new names are
+        # clustered.
+        anchors = self._anchor_blocks()
+        blocks: Dict[Tuple[str, str], Dict[GivenNames, List[str]]] = defaultdict(
+            lambda: defaultdict(list))
+        for name in weights:
+            surname, given = parse_name(name)
+            blocks[blocking_key(surname, given)][given].append(name)
+
+        for key, variants in blocks.items():
+            known = anchors.setdefault(key, {})
+            if not known and len(variants) == 1:
+                (given, alone), = variants.items()
+                if len(alone) == 1:
+                    # Most blocks hold a single new name.
+                    self.aliases[alone[0]] = alone[0]
+                    known[alone[0]] = (given, 1)
+                    continue
+            for name, (given, _) in known.items():
+                variants[given].append(name)
+            for group in _cluster_block(list(variants)):
+                members = [(name, given) for given in group for name in variants[given]]
+                linked = [name for name, _ in members if name in known]
+                if linked:
+                    canonical = max(linked, key=lambda name: (known[name][1], name))
+                else:
+                    # Most common spelling, preferring a full first name;
+                    # ties go to "Given Surname" order, then longer names.
+                    canonical, given = max(members, key=lambda member: (
+                        bool(member[1]) and len(member[1][0]) > 1,
+                        weights[member[0]], ',' not in member[0],
+                        len(member[0]), member[0]))
+                    known[canonical] = (given, 0)
+                for name, _ in members:
+                    if name in weights:
+                        self.aliases[name] = canonical
+                        given, count = known[canonical]
+                        known[canonical] = (given, count + 1)
+        return len(weights)
+
+    def _anchor_blocks(self) -> Dict[Tuple[str, str], Dict[str, Tuple[GivenNames, int]]]:
+        """Canonical names by block, with their given names and alias count."""
+        if self._anchors is None:
+            counts: Dict[str, int] = defaultdict(int)
+            for canonical in self.aliases.values():
+                counts[canonical] += 1
+            self._anchors = defaultdict(dict)
+            for canonical, count in counts.items():
+                surname, given = parse_name(canonical)
+                self._anchors[blocking_key(surname, given)][canonical] = (given, count)
+        return self._anchors
+
+    def apply(self, table) -> int:
+        """Replace the author names of a ``PaperTable`` by their canonical forms.
+
+        Unknown names are resolved first (see ``update``).  A paper that
+        lists two variants of one author keeps a single slot.
+
+        Returns:
+            Number of distinct author names merged away
+        """
+        names = table.authors.values
+        self.update(names, np.bincount(table.author_ids, minlength=len(names)).tolist())
+        pool = StringPool()
+        mapping = np.array([pool.intern(self.canonical(name)) for name in names],
+                           dtype=np.int32)
+        if len(pool) == len(names):
+            return 0
+        rows = np.repeat(np.arange(len(table)), table.author_counts)
+        table.replace_authors(rows, mapping[table.author_ids], pool)
+        return len(names) - len(pool)
+
+
+def _is_initials(token: str) -> bool:
+    """True for "J" or "JA": up to three capitals standing for given names."""
+    return len(token) <= 3 and token.isupper()
+
+
+def _cluster_block(variants: Iterable[GivenNames]) -> List[List[GivenNames]]:
+    """Group the given-name variants of one block into people."""
+    variants = list(variants)
+    if len(variants) == 1:
+        return [variants]
+    full: List[GivenNames] = []
+    initials: List[GivenNames] = []
+    for given in variants:
+        (full if given and len(given[0]) > 1 else initials).append(given)
+
+    first_names = _fuzzy_first_names({given[0] for given in full})
+    people: Dict[Tuple[str, str], List[GivenNames]] = defaultdict(list)
+    for given in full:
+        people[(first_names[given[0]], _middle(given))].append(given)
+    _absorb_unmarked(people)
+
+    abbreviated: Dict[Tuple[str, str], List[GivenNames]] = defaultdict(list)
+    for given in initials:
+        middle = _middle(given)
+        matches = [key for key in people if not middle or key[1] in (middle, '')]
+        if given and len(matches) == 1:
+            people[matches[0]].append(given)
+        else:
+            abbreviated[('', middle) if given else ('', '\0')].append(given)
+    _absorb_unmarked(abbreviated)
+    return list(people.values()) + list(abbreviated.values())
+
+
+def _middle(given: GivenNames) -> str:
+    return given[1][0] if len(given) > 1 else ''
+
+
+def _absorb_unmarked(people: Dict[Tuple[str, str], List[GivenNames]]) -> None:
+    """Merge names without a middle initial into the only one with one."""
+    by_first: Dict[str, List[str]] = defaultdict(list)
+    for first, middle in people:
+        if middle:
+            by_first[first].append(middle)
+    for first, middles in by_first.items():
+        if len(middles) == 1 and (first, '') in people:
+            people[(first, middles[0])].extend(people.pop((first, '')))
+
+
+def _fuzzy_first_names(names: Iterable[str]) -> Dict[str, str]:
+    """Map each first name to the name it is a typo of (itself if none).
+
+    Two names of equal length that differ by one substitution or one
+    adjacent swap, away from their first and last letters, share a key
+    with that position masked, so grouping by those keys finds every
+    such pair without comparing all of them.  Only mutual, unique
+    neighbours are linked: "Micheal" and "Michael" merge, but neither
+    joins a third name one typo from it, and no name is linked through
+    another.
+    """
+    names = sorted(names)
+    neighbours: Dict[str, Set[str]] = defaultdict(set)
+    by_key: Dict[str, List[str]] = defaultdict(list)
+    for name in names:
+        if len(name) < FUZZY_MIN_LENGTH:
+            continue
+        for i in range(1, len(name) - 1):
+            by_key[f'{name[:i]}\0{name[i + 1:]}'].append(name)
+            if i < len(name) - 2:
+                pair = ''.join(sorted(name[i:i + 2]))
+                by_key[f'{name[:i]}\0{pair}\0{name[i + 2:]}'].append(name)
+    for group in by_key.values():
+        for name in group:
+            neighbours[name].update(other for other in group if other != name)
+
+    first_names = {name: name for name in names}
+    for name, others in neighbours.items():
+        if len(others) == 1:
+            other, = others
+            if neighbours[other] == {name}:
+                first_names[name] = min(name, other)
+    return first_names
@@ -1,20 +1,233 @@
 # scholar_analyzer/analyzer.py
-from typing import Dict, Any, Optional, List
+from typing import BinaryIO, Dict, Any, Iterable, Optional, List
 from pathlib import Path
+import numpy as np
+from .aggregation import PaperAggregator
+from .aliases import AuthorAliases
+from .corpus import is_corpus, load_corpus, save_corpus
+from .authors import AuthorIndex
+from .autocomplete import AuthorPrefixIndex
+from .dedup import Deduplicator
+from .filter_index import FilterIndex, FilterPlan, FilterScan
+from .histogram import Binning
+from .jsonl import is_jsonl, load_jsonl
+from .leaderboard import OTHER, leaderboard
+from .network import CollaborationGraph, network_links, network_nodes, node_sizes
+from .network_metrics import NetworkMetrics
+from .reader import JsonCorpusReader, is_csv, read_csv
+from . import serialization
+from .table import PaperTable, paper_key
+from .topics import TopicIndex
 from .visualization.chart_generator import ChartGenerator
 from pyecharts.globals import ThemeType
 
 
+# Leaderboard metrics whose values can be summed into an "Other" entry.
+ADDITIVE_METRICS = ("papers", "citations", "frequency")
+
+
 class ScholarAnalyzer:
     """Analyzer for scholarly publication data."""
 
-    def __init__(self, data: Dict[str, Any], theme: str = "light"):
-        """Initialize analyzer with data and theme."""
-        self.data = data
+    def __init__(self, data: Dict[str, Any], theme: str = "light",
+                 citation_bins: Any = None, max_authors: Optional[int] = None,
+                 collaboration_counting: str = "full", deduplicate: Any = None,
+                 author_aliases: Any = None):
+        """Initialize analyzer with data and theme.
+
+        The paper list (or iterator) is converted once into a columnar
+        ``PaperTable``, which is also accepted as is; the per-paper dicts
+        are not kept.  ``citation_bins`` selects the binning of
+        ``citation_data``: None for the default buckets, a sequence of
+        lower edges, ``"log"``, ``"quantile"`` or a ``Binning``.
+        ``max_authors`` and ``collaboration_counting`` configure the
+        collaboration graph (see ``CollaborationGraph``).  ``deduplicate``
+        (True or a configured ``Deduplicator``) merges near-duplicate
+        papers as they are loaded; ``duplicates_removed`` counts them.
+        ``author_aliases`` (True, an ``AuthorAliases`` table or the path
+        of one, created if missing and saved back with any new names)
+        replaces author name variants by their canonical name.
+        """
+        data = data or {}
+        self.table = _as_table(data.get("papers", []))
+        self.duplicates_removed = 0
+        if deduplicate:
+            if not isinstance(deduplicate, Deduplicator):
+                deduplicate = Deduplicator()
+            self.duplicates_removed = deduplicate.deduplicate(self.table)
+        if author_aliases:
+            self.canonicalize_authors(author_aliases)
+        self._document = {k: v for k, v in data.items() if k != "papers"}
         self.theme = theme
+        self.citation_bins = citation_bins
+        self.network_options = {"max_authors": max_authors,
+                                "counting": collaboration_counting}
         self.chart_generator = ChartGenerator(theme=theme)
+
+    def canonicalize_authors(self, aliases: Any = True) -> int:
+        """
+        Merge author name variants ("J. Smith", "Smith, John") in place.
+
+        Args:
+            aliases: An ``AuthorAliases`` table, the path of a saved one
+                (created if missing and saved back when names were
+                added) or True for a table of this data alone
+
+        Returns:
+            Number of distinct author names merged away
+        """
+        path = None
+        if isinstance(aliases, (str, Path)):
+            path = Path(aliases)
+            aliases = AuthorAliases.load(path) if path.exists() else AuthorAliases()
+        elif not isinstance(aliases, AuthorAliases):
+            aliases = AuthorAliases()
+        known = len(aliases)
+        merged = aliases.apply(self.table)
+        if path is not None and len(aliases) != known:
+            aliases.save(path)
+        # Every author-keyed structure is rebuilt from the new IDs.
+        self.table = self._table
+        return merged
+
+    @classmethod
+    def from_file(cls, path: Any, workers: Optional[int] = None,
+                  **options: Any) -> "ScholarAnalyzer":
+        """Load a corpus file without holding the parsed document.
+
+        A corpus directory written by ``save`` (or ``scholar-analyzer
+        ingest``) is memory-mapped without parsing (see ``load_corpus``).  JSON Lines files
+        (``.jsonl``, ``.jsonl.gz``) are parsed in parallel by ``workers``
+        processes (see ``load_jsonl``), whose partial aggregates also
+        seed the analysis.  CSV rows (see ``read_csv``) and the papers of
+        a JSON document (see ``JsonCorpusReader``) are streamed into the
+        table.  ``options`` are those of the constructor.
+        """
+        if is_corpus(path):
+            table, document = load_corpus(path)
+            return cls({**document, "papers": table}, **options)
+        if is_jsonl(path):
+            table, aggregator = load_jsonl(path, workers)
+            analyzer = cls({"papers": table}, **options)
+            if not analyzer.duplicates_removed:
+                analyzer._aggregator = aggregator
+            return analyzer
+        if is_csv(path):
+            return cls({"papers": read_csv(path)}, **options)
+        reader = JsonCorpusReader(path)
+        analyzer = cls({"papers": iter(reader)}, **options)
+        analyzer._document = dict(reader.document)
+        return analyzer
+
+    def save(self, path: Any, overwrite: bool = False) -> None:
+        """Write the papers and metadata as a corpus directory (see ``save_corpus``)."""
+        save_corpus(self.table, path, self._document, overwrite=overwrite)
+
+    @classmethod
+    def from_table(cls, table: PaperTable,
+                   metadata: Optional[Dict[str, Any]] = None,
+                   theme: str = "light") -> "ScholarAnalyzer":
+        """Create an analyzer over an already built ``PaperTable``."""
+        analyzer = cls({"metadata": metadata or {}}, theme=theme)
+        analyzer.table = table
+        return analyzer
+
+    @property
+    def table(self) -> PaperTable:
+        """The analyzer's papers, with pending removals compacted away."""
+        if self._removed_rows:
+            self._table.delete(self._removed_rows)
+            self._removed_rows = []
+        return self._table
+
+    @table.setter
+    def table(self, table: PaperTable) -> None:
+        self._table = table
+        self._removed_rows: List[int] = []
+        self._aggregator: Optional[PaperAggregator] = None
+        self._collaboration: Optional[CollaborationGraph] = None
+        self._author_index: Optional[AuthorIndex] = None
+        self._topic_index: Optional[TopicIndex] = None
+        self._filter_index: Optional[FilterIndex] = None
+        self._author_prefixes: Optional[AuthorPrefixIndex] = None
+        self._data: Optional[Dict[str, Any]] = None
+        self.analysis_results = None
+        self.charts = None
+
+    def add_papers(self, papers: List[Dict[str, Any]]) -> None:
+        """Add papers, updating every maintained aggregate in place.
+
+        The cost is proportional to the number of papers added; the next
+        ``analyze()`` reuses the aggregates instead of rescanning.
+        """
+        rows = self._table.append(papers)
+        if self._aggregator is not None:
+            self._aggregator.update_table(self._table, rows)
+        if self._collaboration is not None:
+            self._collaboration.update_table(self._table, rows)
+        self._author_index = None
+        self._topic_index = None
+        self._filter_index = None
+        self._author_prefixes = None
+        self._data = None
+        self.analysis_results = None
+        self.charts = None
+
+    def remove_papers(self, papers: List[Dict[str, Any]]) -> int:
+        """Remove papers, matched by title and year, and update aggregates.
+
+        Each given paper removes at most one matching row; papers that are
+        not present are ignored.  Rows are dropped from the table lazily,
+        the next time the full table is read.
+
+        Returns:
+            Number of papers removed
+        """
+        rows = []
+        for paper in papers:
+            matches = self._table.find_rows(paper_key(paper))
+            if matches:
+                rows.append(matches.pop())
+        if not rows:
+            return 0
+
+        rows = np.array(rows, dtype=np.int64)
+        if self._aggregator is not None:
+            self._aggregator.update_table(self._table, rows, sign=-1)
+        if self._collaboration is not None:
+            self._collaboration.update_table(self._table, rows, sign=-1)
+        self._removed_rows.extend(rows.tolist())
+        self._author_index = None
+        self._topic_index = None
+        self._filter_index = None
+        self._author_prefixes = None
+        self._data = None
         self.analysis_results = None
         self.charts = None
+        return len(rows)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Input document with the paper list rebuilt from the table.
+
+        Built on first access and kept until papers are added, removed or
+        replaced, so repeated reads do not rebuild every paper dict.
+        """
+        if self._data is None:
+            self._data = {**self._document, "papers": self.table.to_records()}
+        return self._data
+
+    @data.setter
+    def data(self, data: Dict[str, Any]) -> None:
+        # Replaces the papers and document; deduplication and author
+        # aliases given to the constructor are not re-applied.
+        data = data or {}
+        self.table = _as_table(data.get("papers", []))
+        self._document = {k: v for k, v in data.items() if k != "papers"}
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._document.get("metadata", {})
 
     def _generate_charts(self) -> Dict[str, str]:
         """Generate visualization charts."""
@@ -33,30 +246,71 @@ class ScholarAnalyzer:
             )
         }
 
-    def analyze(self) -> Dict[str, Any]:
-        """Analyze data and generate visualizations."""
-        self.analysis_results = self._perform_analysis()
+    def analyze(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze data and generate visualizations.
+
+        ``filters`` (a ``FilterPlan`` configuration) restricts the papers,
+        aggregates and charts to the matching rows.
+        """
+        rows = self.select(filters)
+        self.analysis_results = self._perform_analysis(rows)
         self.charts = self._generate_charts()
 
         return {
             "success": True,
-            "papers": self.data.get("papers", []),
+            "papers": list(self.table.iter_records(rows)),
             "analysis": self.analysis_results,
             "charts": self.charts
         }
 
-    def _perform_analysis(self) -> Dict[str, Any]:
-        """Perform detailed analysis of scholarly data."""
-        return {
-            "yearly_data": self._analyze_yearly_trends(),
-            "citation_data": self._analyze_citations(),
-            "venue_data": self._analyze_venues(),
-            "metrics": {
-                "total_papers": len(self.data.get("papers", [])),
-                "total_citations": sum(p.get("citations", 0) for p in self.data.get("papers", [])),
-                "unique_venues": len(set(p.get("venue", "") for p in self.data.get("papers", [])))
-            }
-        }
+    def write_analysis(self, output_path: Any,
+                       filters: Optional[Dict[str, Any]] = None,
+                       indent: Optional[int] = None) -> None:
+        """Write what ``analyze`` returns to a JSON file.
+
+        Paper records are encoded one at a time as they are written, so
+        the output never exists as a list of dicts in memory.  The JSON
+        is compact unless ``indent`` is given.
+        """
+        rows = self.select(filters)
+        self.analysis_results = self._perform_analysis(rows)
+        self.charts = self._generate_charts()
+        with open(output_path, 'wb') as f:
+            _dump_with_papers(f, {"success": True}, self.table.iter_records(rows),
+                              {"analysis": self.analysis_results, "charts": self.charts},
+                              indent)
+
+    def select(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows matching ``filters``, or None (every row) without filters.
+
+        The indexes behind the plan are built on first use and kept until
+        papers are added or removed.  Memory-mapped tables are scanned in
+        chunks instead (see ``FilterScan``), since indexes over a corpus
+        larger than RAM would not fit in it.
+        """
+        if not filters:
+            return None
+        if self.table.is_mapped:
+            return FilterScan.from_config(self.table, filters).rows()
+        if self._filter_index is None:
+            self._filter_index = FilterIndex(self.table)
+        return FilterPlan.from_config(self._filter_index, filters).rows()
+
+    def _perform_analysis(self, rows: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Perform detailed analysis of scholarly data.
+
+        The aggregates are built from the table in a single pass the first
+        time and then maintained by ``add_papers``/``remove_papers``.  A
+        selection of ``rows`` is aggregated on its own and not kept.
+        """
+        if rows is not None:
+            aggregator = PaperAggregator().update_table(self.table, rows)
+        else:
+            if self._aggregator is None:
+                self._aggregator = PaperAggregator.from_table(self.table)
+            aggregator = self._aggregator
+        binning = Binning.resolve(self.citation_bins, *aggregator.citation_values())
+        return aggregator.results(binning)
 
     def generate_report(self, output_path: str) -> None:
         """Generate analysis report."""
@@ -69,27 +323,36 @@ class ScholarAnalyzer:
         # Use the template to generate the report
         template_data = {
             "analysis": self.analysis_results,
-            "papers": self.data.get("papers", []),
+            "papers": self.table.iter_records(),
             "charts": self.charts,
-            "query": self.data.get("metadata", {}).get("query", "")
+            "query": self.metadata.get("query", "")
         }
 
         self._render_template(output_path, template_data)
 
-    def export_to_json(self, output_path: str) -> None:
-        """Export data to JSON format."""
-        import json
-        if not self.analysis_results:
-            self.analyze()
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                "papers": self.data.get("papers", []),
-                "analysis": self.analysis_results
-            }, f, indent=2)
+    def export_to_json(self, output_path: str,
+                       filters: Optional[Dict[str, Any]] = None,
+                       indent: Optional[int] = None) -> None:
+        """Export data to JSON format, optionally only papers matching ``filters``.
 
-    def export_to_csv(self, output_path: str) -> None:
-        """Export data to CSV format."""
+        The JSON is compact unless ``indent`` is given.
+        """
+        rows = self.select(filters)
+        if rows is not None:
+            # A filtered export must not replace the stored analysis.
+            analysis = self._perform_analysis(rows)
+        else:
+            if not self.analysis_results:
+                self.analyze()
+            analysis = self.analysis_results
+
+        with open(output_path, 'wb') as f:
+            _dump_with_papers(f, {}, self.table.iter_records(rows),
+                              {"analysis": analysis}, indent)
+
+    def export_to_csv(self, output_path: str,
+                      filters: Optional[Dict[str, Any]] = None) -> None:
+        """Export data to CSV format, optionally only papers matching ``filters``."""
         import csv
         if not self.analysis_results:
             self.analyze()
@@ -100,7 +363,7 @@ class ScholarAnalyzer:
                 fieldnames=['title', 'authors', 'year', 'venue', 'citations']
             )
             writer.writeheader()
-            for paper in self.data.get("papers", []):
+            for paper in self.table.iter_records(self.select(filters)):
                 writer.writerow({
                     'title': paper.get('title', ''),
                     'authors': ', '.join(paper.get('authors', [])),
@@ -109,13 +372,14 @@ class ScholarAnalyzer:
                     'citations': paper.get('citations', 0)
                 })
 
-    def export_to_bibtex(self, output_path: str) -> None:
-        """Export data to BibTeX format."""
+    def export_to_bibtex(self, output_path: str,
+                         filters: Optional[Dict[str, Any]] = None) -> None:
+        """Export data to BibTeX format, optionally only papers matching ``filters``."""
         if not self.analysis_results:
             self.analyze()
 
         with open(output_path, 'w', encoding='utf-8') as f:
-            for paper in self.data.get("papers", []):
+            for paper in self.table.iter_records(self.select(filters)):
                 f.write(self._paper_to_bibtex(paper))
                 f.write('\n\n')
 
@@ -131,9 +395,7 @@ class ScholarAnalyzer:
 
     def _render_template(self, output_path: Path, data: Dict[str, Any]) -> None:
         """Render HTML template with provided data."""
-        from jinja2 import Template
-
-        template = Template(self._get_default_template())
+        template = _template_environment().from_string(self._get_default_template())
         html_content = template.render(**data)
 
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -163,99 +425,199 @@ class ScholarAnalyzer:
                 """
 
 
-    def _analyze_yearly_trends(self) -> Dict[str, int]:
+    def _analyze_citations(self, bins: Any = None, **options: Any) -> Dict[str, int]:
         """
-        Analyze publication trends by year.
+        Analyze citation distribution.
+
+        Args:
+            bins: Binning spec as accepted by ``Binning.resolve``; defaults
+                to the analyzer's ``citation_bins``
+            **options: Options for ``"log"`` (``per_decade``, ``base``) or
+                ``"quantile"`` (``n_bins``) binning
 
         Returns:
-            Dictionary mapping years to publication counts
+            Dictionary mapping citation ranges to paper counts
         """
-        yearly_counts = {}
-        for paper in self.data.get('papers', []):
-            year = paper.get('year')
-            if year:
-                yearly_counts[year] = yearly_counts.get(year, 0) + 1
-        return dict(sorted(yearly_counts.items()))
-
-    def _analyze_citations(self) -> Dict[str, int]:
+        citations = self.table.citations
+        spec = bins if bins is not None else self.citation_bins
+        return Binning.resolve(spec, citations, **options).histogram(citations)
+
+    def _extract_network_nodes(self) -> List[Dict[str, Any]]:
         """
-        Analyze citation distribution.
+        Extract collaboration network nodes.
 
         Returns:
-            Dictionary mapping citation ranges to paper counts
+            List of dictionaries containing node information, sized by
+            each author's paper count
+        """
+        return network_nodes(self._collaboration_graph(), self._table.authors.values)
+
+    def _extract_network_links(self) -> List[Dict[str, Any]]:
+        """
+        Extract collaboration network links.
+
+        Returns:
+            List of dictionaries containing link information
         """
-        citation_ranges = {
-            '0': 0, '1-10': 0, '11-50': 0,
-            '51-100': 0, '101-500': 0, '500+': 0
+        return network_links(self._collaboration_graph(), self._table.authors.values)
+
+    def analyze_network(self, size_by: str = "pagerank",
+                        betweenness_samples: int = 64,
+                        seed: Optional[int] = 0) -> Dict[str, Any]:
+        """
+        Analyze the collaboration network.
+
+        Args:
+            size_by: Node size metric: ``"papers"``, ``"degree"``,
+                ``"pagerank"`` or ``"betweenness"``
+            betweenness_samples: BFS sources sampled for betweenness
+            seed: Seed for the source sample
+
+        Returns:
+            Dictionary with sized nodes, links, a metrics summary and the
+            rendered network chart
+        """
+        graph = self._collaboration_graph()
+        metrics = NetworkMetrics(graph, betweenness_samples=betweenness_samples,
+                                 seed=seed)
+        scores = {
+            "papers": graph.paper_counts,
+            "degree": metrics.degree,
+            "pagerank": metrics.pagerank,
+            "betweenness": metrics.betweenness,
         }
+        if size_by not in scores:
+            raise ValueError(f"Unsupported node size metric: {size_by}")
 
-        for paper in self.data.get('papers', []):
-            citations = paper.get('citations', 0)
-            if citations == 0:
-                citation_ranges['0'] += 1
-            elif citations <= 10:
-                citation_ranges['1-10'] += 1
-            elif citations <= 50:
-                citation_ranges['11-50'] += 1
-            elif citations <= 100:
-                citation_ranges['51-100'] += 1
-            elif citations <= 500:
-                citation_ranges['101-500'] += 1
-            else:
-                citation_ranges['500+'] += 1
-
-        return citation_ranges
-
-    def _analyze_venues(self) -> Dict[str, int]:
+        names = self._table.authors.values
+        nodes = network_nodes(graph, names, sizes=node_sizes(scores[size_by]))
+        links = network_links(graph, names)
+        return {
+            "nodes": nodes,
+            "links": links,
+            "metrics": metrics.summary(names),
+            "chart": self.chart_generator.generate_network_chart(nodes, links)
+        }
+
+    def author_metrics(self, sort_by: str = "h_index",
+                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Analyze publication venues.
+        Compute citation metrics for every author.
+
+        Args:
+            sort_by: Metric to rank authors by (see ``AUTHOR_METRICS``)
+            limit: Maximum number of authors to return
 
         Returns:
-            Dictionary mapping venue names to publication counts
+            List of dictionaries with each author's papers, citations,
+            h-index, g-index and i10-index
         """
-        venue_counts = {}
-        for paper in self.data.get('papers', []):
-            venue = paper.get('venue')
-            if venue:
-                venue_counts[venue] = venue_counts.get(venue, 0) + 1
-        return dict(sorted(venue_counts.items(), key=lambda x: x[1], reverse=True))
+        if self._author_index is None:
+            self._author_index = AuthorIndex.from_table(self.table)
+        return self._author_index.records(self._table.authors.values,
+                                          sort_by=sort_by, limit=limit)
 
-    def _extract_network_nodes(self) -> List[Dict[str, Any]]:
+    def author_suggestions(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Extract collaboration network nodes.
+        Suggest authors for a typed prefix.
+
+        Args:
+            prefix: Start of the author's name or of a later name word,
+                matched ignoring case
+            limit: Maximum number of suggestions
 
         Returns:
-            List of dictionaries containing node information
+            List of ``{"name", "count"}`` dictionaries, most papers first
         """
-        authors = set()
-        for paper in self.data.get('papers', []):
-            authors.update(paper.get('authors', []))
+        self.prepare_author_suggestions()
+        return self._author_prefixes.suggest(prefix, limit)
 
-        return [{'name': author, 'symbolSize': 10} for author in authors]
+    def prepare_author_suggestions(self) -> None:
+        """Build the author prefix index now rather than on the first suggestion."""
+        if self._author_prefixes is None:
+            self._author_prefixes = AuthorPrefixIndex.from_table(self.table)
 
-    def _extract_network_links(self) -> List[Dict[str, Any]]:
+    def leaderboard(self, kind: str = "venues", limit: int = 10,
+                    metric: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Extract collaboration network links.
+        Rank venues, authors or title terms.
+
+        Args:
+            kind: ``"venues"``, ``"authors"`` or ``"terms"``
+            limit: Number of entries ranked individually
+            metric: Score to rank by; ``"papers"`` or ``"citations"`` for
+                venues, an ``AUTHOR_METRICS`` name for authors (default
+                ``"papers"``) and a term metric for terms (default
+                ``"frequency"``)
 
         Returns:
-            List of dictionaries containing link information
+            List of ``{"name", <metric>}`` dictionaries, best first; for
+            additive metrics a final ``"Other"`` entry sums the rest;
+            authors tied on ``metric`` are ranked by citations
+        """
+        ties = None
+        if kind == "venues":
+            metric = metric or "papers"
+            if metric not in ADDITIVE_METRICS:
+                raise ValueError(f"Unsupported venue metric: {metric}")
+            names = self.table.venues.values
+            scores = np.bincount(self.table.venue_ids, minlength=len(names))
+            present = scores > 0
+            if metric == "citations":
+                scores = np.bincount(self.table.venue_ids, weights=self.table.citations,
+                                     minlength=len(names)).astype(np.int64)
+            present[0] = False  # papers without a venue
+        elif kind == "authors":
+            metric = metric or "papers"
+            if self._author_index is None:
+                self._author_index = AuthorIndex.from_table(self.table)
+            metrics = self._author_index.metrics()
+            if metric not in metrics:
+                raise ValueError(f"Unsupported author metric: {metric}")
+            scores, names = metrics[metric], self.table.authors.values
+            ties, present = metrics["citations"], metrics["papers"] > 0
+        elif kind == "terms":
+            metric = metric or "frequency"
+            if self._topic_index is None:
+                self._topic_index = TopicIndex.from_table(self.table)
+            stats = self._topic_index.term_stats()
+            if metric not in stats:
+                raise ValueError(f"Unsupported term metric: {metric}")
+            scores, names = stats[metric], self._topic_index.terms
+            present = stats["papers"] > 0
+        else:
+            raise ValueError(f"Unsupported leaderboard: {kind}")
+
+        return leaderboard(names, scores, limit, metric=metric, ties=ties, keep=present,
+                           other=OTHER if metric in ADDITIVE_METRICS else None)
+
+    def analyze_topics(self, top: int = 50, sort_by: str = "frequency",
+                       cooccurrence_terms: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze research topics from paper titles and abstracts.
+
+        Args:
+            top: Number of terms to report
+            sort_by: Term ranking: ``"frequency"``, ``"papers"``,
+                ``"citations"`` or ``"impact"``
+            cooccurrence_terms: Restrict the co-occurrence network to the
+                best ranked terms (all ``top`` terms by default)
+
+        Returns:
+            Dictionary with top terms, term co-occurrence links and
+            per-year term counts
         """
-        collaborations = {}
-        for paper in self.data.get('papers', []):
-            authors = paper.get('authors', [])
-            for i, author1 in enumerate(authors):
-                for author2 in authors[i+1:]:
-                    key = tuple(sorted([author1, author2]))
-                    collaborations[key] = collaborations.get(key, 0) + 1
-
-        return [
-            {
-                'source': source,
-                'target': target,
-                'value': weight
-            }
-            for (source, target), weight in collaborations.items()
-        ]
+        if self._topic_index is None:
+            self._topic_index = TopicIndex.from_table(self.table)
+        return self._topic_index.summary(top, sort_by=sort_by,
+                                         cooccurrence_terms=cooccurrence_terms)
+
+    def _collaboration_graph(self) -> CollaborationGraph:
+        """Co-authorship graph, built on first use and then maintained."""
+        if self._collaboration is None:
+            self._collaboration = CollaborationGraph.from_table(
+                self.table, **self.network_options)
+        return self._collaboration
 
     def _render_report_template(self, output_path: str,
                                 analysis_results: Dict[str, Any],
@@ -268,7 +630,7 @@ class ScholarAnalyzer:
             analysis_results: Results of the data analysis
             chart_paths: Paths to the generated chart files
         """
-        from jinja2 import Environment, FileSystemLoader
+        from jinja2 import FileSystemLoader
         import pkg_resources
 
         # Get template path
@@ -277,7 +639,7 @@ class ScholarAnalyzer:
             'templates'
         )
 
-        env = Environment(loader=FileSystemLoader(template_path))
+        env = _template_environment(FileSystemLoader(template_path))
         template = env.get_template('report.html')
 
         # Render report
@@ -290,3 +652,54 @@ class ScholarAnalyzer:
         # Save report
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
+
+
+def _as_table(papers: Any) -> PaperTable:
+    """A ``PaperTable`` from a table, a list of papers or any iterable of them."""
+    if isinstance(papers, PaperTable):
+        return papers
+    if isinstance(papers, list):
+        return PaperTable.from_papers(papers)
+    return PaperTable.from_stream(papers)
+
+
+def _dump_with_papers(f: BinaryIO, head: Dict[str, Any], papers: Iterable[Dict[str, Any]],
+                      tail: Dict[str, Any], indent: Optional[int] = None) -> None:
+    """Write ``{**head, "papers": [...], **tail}`` as JSON.
+
+    Papers are encoded one at a time as they come, so they never have to
+    be collected into a list first.  With ``indent`` the object is
+    indented and each paper goes on a line of its own.
+    """
+    newline, pad = (b'\n', b' ' * indent) if indent else (b'', b'')
+    colon = b': ' if indent else b':'
+    f.write(b'{' + newline)
+    for key, value in head.items():
+        f.write(pad + serialization.dumpb(key) + colon + _nested(value, indent)
+                + b',' + newline)
+    f.write(pad + b'"papers"' + colon + b'[')
+    separator = newline + pad * 2
+    for paper in papers:
+        f.write(separator)
+        f.write(serialization.dumpb(paper))
+        separator = b',' + newline + pad * 2
+    f.write(b']' if separator == newline + pad * 2 else newline + pad + b']')
+    for key, value in tail.items():
+        f.write(b',' + newline + pad + serialization.dumpb(key) + colon
+                + _nested(value, indent))
+    f.write(newline + b'}' + newline)
+
+
+def _nested(value: Any, indent: Optional[int]) -> bytes:
+    """``value`` as JSON, indented to sit one level inside an object."""
+    encoded = serialization.dumpb(value, indent=indent)
+    return encoded.replace(b'\n', b'\n' + b' ' * indent) if indent else encoded
+
+
+def _template_environment(loader: Any = None) -> Any:
+    """Jinja environment whose ``tojson`` filter uses the package's JSON layer."""
+    from jinja2 import Environment
+
+    env = Environment(loader=loader)
+    env.policies['json.dumps_function'] = serialization.dumps
+    return env
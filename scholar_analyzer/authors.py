@@ -0,0 +1,92 @@
+# scholar_analyzer/authors.py
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .leaderboard import top_k
+
+AUTHOR_METRICS = ('papers', 'citations', 'h_index', 'g_index', 'i10_index')
+
+
+class AuthorIndex:
+    """Inverted index from author ID to papers, by citations descending.
+
+    The postings of author ``a`` are ``rows[offsets[a]:offsets[a + 1]]``
+    with matching ``citations``, so every per-author citation metric is a
+    segmented reduction over two flat arrays.  The index is built with one
+    sort of the table's author slots; an author listed twice on a paper
+    gets a single posting.
+    """
+
+    def __init__(self, offsets: np.ndarray, rows: np.ndarray, citations: np.ndarray):
+        self.offsets = offsets
+        self.rows = rows
+        self.citations = citations
+
+    @classmethod
+    def from_table(cls, table) -> "AuthorIndex":
+        """Index every author slot of a ``PaperTable``."""
+        n_authors = len(table.authors)
+        papers = np.repeat(np.arange(len(table), dtype=np.int64), table.author_counts)
+        keys = np.unique(table.author_ids.astype(np.int64) * max(len(table), 1) + papers)
+        authors, rows = np.divmod(keys, max(len(table), 1))
+
+        citations = table.citations[rows]
+        order = np.lexsort((-citations, authors))
+        counts = np.bincount(authors, minlength=n_authors)
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return cls(offsets, rows[order], citations[order])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def papers(self, author_id: int) -> np.ndarray:
+        """Rows of an author's papers, most cited first."""
+        return self.rows[self.offsets[author_id]:self.offsets[author_id + 1]]
+
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """Paper count, total citations, h-index, g-index and i10-index per author.
+
+        With postings sorted by citations, the rank ``r`` posting of an
+        author satisfies ``c >= r`` exactly for the first ``h`` ranks, and
+        the running citation total satisfies ``total >= r ** 2`` exactly
+        for the first ``g`` ranks, so each index is a segmented count.
+        """
+        n_authors = len(self)
+        counts = np.diff(self.offsets)
+        author = np.repeat(np.arange(n_authors), counts)
+        rank = np.arange(len(self.rows)) - self.offsets[author] + 1
+
+        prefix = np.concatenate(([0], np.cumsum(self.citations)))
+        running = prefix[1:] - prefix[self.offsets[author]]
+
+        def segment_sum(mask_or_weights: np.ndarray) -> np.ndarray:
+            return np.bincount(author, weights=mask_or_weights,
+                               minlength=n_authors).astype(np.int64)
+
+        return {
+            'papers': counts,
+            'citations': segment_sum(self.citations),
+            'h_index': segment_sum(self.citations >= rank),
+            'g_index': segment_sum(running >= rank * rank),
+            'i10_index': segment_sum(self.citations >= 10),
+        }
+
+    def records(self, names: List[str], sort_by: str = 'h_index',
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-author metric dicts, best first by ``sort_by``.
+
+        Ties are broken by total citations; authors without papers are
+        left out.  With a ``limit`` only the best authors are sorted.
+        """
+        if sort_by not in AUTHOR_METRICS:
+            raise ValueError(f"Unsupported sort metric: {sort_by}")
+        metrics = self.metrics()
+        ids = np.flatnonzero(metrics['papers'] > 0)
+        ids = ids[top_k(metrics[sort_by][ids], limit, ties=metrics['citations'][ids])]
+
+        columns = {key: metrics[key][ids].tolist() for key in AUTHOR_METRICS}
+        return [
+            {'author': names[id_], **{key: columns[key][i] for key in AUTHOR_METRICS}}
+            for i, id_ in enumerate(ids.tolist())
+        ]
@@ -0,0 +1,136 @@
+# scholar_analyzer/autocomplete.py
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Prefixes matching more keys than this keep a precomputed top-k; smaller
+# ranges are ranked per query with one partition.
+HEAVY_RANGE = 2048
+
+DEFAULT_LIMIT = 10
+
+# Sorts after every other character, closing a prefix range.
+_LAST_CHAR = chr(0x10FFFF)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class AuthorPrefixIndex:
+    """Ranked prefix lookup over author names for autocompletion.
+
+    Each author is indexed under its case-folded name and under the
+    suffix starting at every later word, so ``"smi"`` finds "John Smith".
+    The keys form one sorted list, so a prefix is a contiguous range
+    found with two bisects.  Authors in the range are ranked by paper
+    count (ties by name).  For the few prefixes matching more than
+    ``HEAVY_RANGE`` keys the top ``limit`` authors are computed once at
+    build time, which bounds every query by the cost of ranking
+    ``HEAVY_RANGE`` counts.
+    """
+
+    def __init__(self, keys: List[str], authors: np.ndarray, names: Sequence[str],
+                 counts: np.ndarray, limit: int = DEFAULT_LIMIT):
+        self.keys = keys
+        self.authors = authors
+        self.names = names
+        self.counts = counts
+        self.limit = limit
+        self._key_counts = counts[authors]
+        # Tie-break rank of each key's author: position in name order.
+        ranked = sorted(set(authors.tolist()), key=lambda id_: names[id_].casefold())
+        name_rank = np.zeros(len(counts), dtype=np.int64)
+        name_rank[ranked] = np.arange(len(ranked))
+        self._key_ties = name_rank[authors]
+        self._heavy: Dict[str, np.ndarray] = {}
+        self._index_heavy_prefixes()
+
+    @classmethod
+    def from_table(cls, table, limit: int = DEFAULT_LIMIT) -> "AuthorPrefixIndex":
+        """Index the authors of a ``PaperTable`` by their number of papers."""
+        counts = np.bincount(table.author_ids, minlength=len(table.authors))
+        return cls.from_names(table.authors.values, counts, limit)
+
+    @classmethod
+    def from_names(cls, names: Sequence[str], counts: np.ndarray,
+                   limit: int = DEFAULT_LIMIT) -> "AuthorPrefixIndex":
+        """Index ``names[i]`` with weight ``counts[i]``; zero-count names are left out."""
+        keys, authors = [], []
+        for id_ in np.flatnonzero(counts).tolist():
+            words = names[id_].casefold().split()
+            for start in range(len(words)):
+                keys.append(' '.join(words[start:]))
+                authors.append(id_)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return cls([keys[i] for i in order],
+                   np.asarray(authors, dtype=np.int64)[order] if keys
+                   else np.empty(0, dtype=np.int64),
+                   names, np.asarray(counts, dtype=np.int64), limit)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Authors with a name or later name word starting with ``prefix``.
+
+        Matching ignores case and runs of whitespace.  Results are
+        ``{'name', 'count'}`` dicts, most papers first.
+        """
+        limit = self.limit if limit is None else limit
+        prefix = _WHITESPACE.sub(' ', prefix.casefold().lstrip())
+        if not prefix or limit <= 0:
+            return []
+        heavy = self._heavy.get(prefix)
+        if heavy is not None and limit <= self.limit:
+            ids = heavy[:limit]
+        else:
+            ids = self._rank(bisect_left(self.keys, prefix),
+                             bisect_left(self.keys, prefix + _LAST_CHAR), limit)
+        return [{'name': self.names[id_], 'count': int(self.counts[id_])}
+                for id_ in ids.tolist()]
+
+    def _rank(self, lo: int, hi: int, limit: int) -> np.ndarray:
+        """Distinct authors of the keys ``[lo, hi)`` with the most papers."""
+        counts = self._key_counts[lo:hi]
+        take = min(len(counts), 2 * limit)
+        while True:
+            if take < len(counts):
+                # Everything tied with the take-th largest count, so the
+                # name tie-break below sees every candidate.
+                threshold = -np.partition(-counts, take - 1)[take - 1]
+                top = np.flatnonzero(counts >= threshold)
+            else:
+                top = np.arange(len(counts))
+            # Most papers first, then by name; keep each author once.
+            top = top[np.lexsort((self._key_ties[lo + top], -counts[top]))]
+            authors = self.authors[lo + top]
+            _, first = np.unique(authors, return_index=True)
+            ids = authors[np.sort(first)]
+            if len(ids) >= limit or take >= len(counts):
+                return ids[:limit]
+            take = min(len(counts), 4 * take)
+
+    def _index_heavy_prefixes(self) -> None:
+        """Precompute the top authors of every prefix with a large range.
+
+        Walks the implicit trie of the sorted keys from the empty prefix,
+        descending only into children whose range is still too large to
+        rank at query time.
+        """
+        keys = self.keys
+        stack = [('', 0, len(keys))]
+        while stack:
+            prefix, lo, hi = stack.pop()
+            if hi - lo <= HEAVY_RANGE:
+                continue
+            self._heavy[prefix] = self._rank(lo, hi, self.limit)
+            depth = len(prefix)
+            # Keys equal to the prefix sort first and have no child.
+            start = bisect_left(keys, prefix + '\0', lo, hi)
+            while start < hi:
+                char = keys[start][depth]
+                end = (bisect_left(keys, prefix + chr(ord(char) + 1), start, hi)
+                       if char != _LAST_CHAR else hi)
+                stack.append((prefix + char, start, end))
+                start = end
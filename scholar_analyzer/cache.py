@@ -0,0 +1,148 @@
+# scholar_analyzer/cache.py
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import __version__, serialization
+
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024  # 512MB
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class AnalysisCache:
+    """Size-bounded, content-addressed on-disk cache of analysis outputs.
+
+    Entries are keyed by a hash of the input file's content, the package
+    version and the analysis options, and hold the files a run produced
+    (``analysis.json`` with its rendered charts, reports, exports).  A
+    hit copies those files back instead of re-parsing and re-analyzing.
+    When the cache grows past ``max_bytes`` the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.entries_dir = self.directory / 'entries'
+        self.stats_dir = self.directory / 'stats'
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, input_file: Path, options: Dict[str, Any]) -> str:
+        """Cache key for analyzing ``input_file`` with ``options``."""
+        digest = hashlib.sha256()
+        digest.update(__version__.encode('utf-8'))
+        # Always the stdlib encoder, so keys do not depend on the JSON backend.
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(self.content_hash(input_file).encode('ascii'))
+        return digest.hexdigest()
+
+    def content_hash(self, path: Path) -> str:
+        """SHA-256 of a file's content, or of every file in a directory.
+
+        The digest is remembered together with the file's size and
+        modification time, so unchanged inputs are not re-read.
+        """
+        path = Path(path).resolve()
+        if path.is_dir():
+            digest = hashlib.sha256()
+            for file in sorted(file for file in path.rglob('*') if file.is_file()):
+                digest.update(file.relative_to(path).as_posix().encode('utf-8') + b'\0')
+                digest.update(self.content_hash(file).encode('ascii'))
+            return digest.hexdigest()
+        stat = path.stat()
+        stat_file = self.stats_dir / hashlib.sha1(str(path).encode('utf-8')).hexdigest()
+        try:
+            cached = serialization.loads(stat_file.read_bytes())
+            if cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+                return cached['digest']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        _write_atomic(stat_file, serialization.dumps({
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'digest': digest.hexdigest()
+        }))
+        return digest.hexdigest()
+
+    def get(self, key: str, output_dir: Path) -> Optional[List[Path]]:
+        """Copy a cached entry's files into ``output_dir``.
+
+        Returns:
+            The restored file paths, or None on a cache miss
+        """
+        entry = self.entries_dir / key
+        try:
+            names = serialization.loads((entry / 'manifest.json').read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        restored = []
+        try:
+            for name in names:
+                restored.append(Path(shutil.copyfile(entry / name, output_dir / name)))
+        except OSError:
+            return None
+
+        now = time.time()
+        os.utime(entry, (now, now))  # mark as recently used
+        return restored
+
+    def put(self, key: str, files: Iterable[Path]) -> None:
+        """Store ``files`` under ``key`` and evict old entries if needed."""
+        files = [Path(file) for file in files]
+        staging = Path(tempfile.mkdtemp(prefix='tmp-', dir=self.directory))
+        try:
+            for file in files:
+                shutil.copyfile(file, staging / file.name)
+            (staging / 'manifest.json').write_text(
+                serialization.dumps([file.name for file in files]))
+            entry = self.entries_dir / key
+            if entry.exists():
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits."""
+        entries = []
+        total = 0
+        for entry in self.entries_dir.iterdir():
+            size = sum(file.stat().st_size for file in entry.iterdir())
+            entries.append((entry.stat().st_mtime, size, entry))
+            total += size
+
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        shutil.rmtree(self.entries_dir, ignore_errors=True)
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write ``content`` so concurrent readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, 'w') as f:
+        f.write(content)
+    os.replace(tmp, path)
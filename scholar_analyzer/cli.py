@@ -16,58 +16,105 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .analyzer import ScholarAnalyzer
+from .cache import AnalysisCache, DEFAULT_CACHE_SIZE
+
+# Output file written for each supported format
+OUTPUT_FILES = {
+    "html": "output.html",
+    "json": "output.json",
+    "csv": "output.csv",
+    "bibtex": "output.bibtex",
+}
 
 
 def process_query(
     query: str,
     output_dir: Path,
     input_file: Optional[Path] = None,
-    format: str = "html"
+    format: str = "html",
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = DEFAULT_CACHE_SIZE,
+    deduplicate: bool = False,
+    author_aliases: Optional[Path] = None,
+    workers: Optional[int] = None,
+    pretty: bool = False
 ) -> Dict[str, Any]:
-    """Process a scholarly query and generate analysis outputs."""
+    """Process a scholarly query and generate analysis outputs.
+
+    ``deduplicate`` merges near-duplicate papers (see ``Deduplicator``)
+    before anything is counted; ``author_aliases`` names an alias table
+    file (see ``AuthorAliases``) used and extended to merge author name
+    variants.
+
+    The input is a JSON document with a ``papers`` array or a JSON Lines
+    file (``.jsonl``, ``.jsonl.gz``) with one paper per line, which is
+    parsed by ``workers`` processes (all cores by default).  JSON outputs
+    are compact unless ``pretty`` is set.
+
+    With ``cache_dir`` set, the outputs are cached under a key derived from
+    the input file's content, the package version and the options, and an
+    unchanged input is served from the cache without re-parsing it.
+    """
     try:
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load input data
-        if input_file and input_file.exists():
-            with open(input_file) as f:
-                data = json.load(f)
-        else:
+        if not (input_file and input_file.exists()):
             raise ValueError("Input file not found or invalid")
-
-        # Initialize analyzer
-        analyzer = ScholarAnalyzer(data)
-
-        # Generate analysis
-        results = analyzer.analyze()
-
-        # Save analysis results
+        if format not in OUTPUT_FILES:
+            raise ValueError(f"Unsupported format: {format}")
+        output_file = output_dir / OUTPUT_FILES[format]
+
+        # Serve unchanged inputs from the cache
+        cache = None
+        if cache_dir is not None:
+            cache = AnalysisCache(cache_dir, cache_max_bytes)
+            # The alias table is keyed by content: edits to it invalidate.
+            aliases_key = (cache.content_hash(author_aliases)
+                           if author_aliases and author_aliases.exists() else None)
+            cache_key = cache.make_key(input_file, {"query": query, "format": format,
+                                                    "deduplicate": deduplicate,
+                                                    "author_aliases": aliases_key,
+                                                    "pretty": pretty})
+            if cache.get(cache_key, output_dir) is not None:
+                return {
+                    "success": True,
+                    "message": "Analysis restored from cache",
+                    "output_file": str(output_file),
+                    "cached": True
+                }
+
+        # Stream the input into the analyzer
+        analyzer = ScholarAnalyzer.from_file(input_file, workers=workers,
+                                             deduplicate=deduplicate,
+                                             author_aliases=author_aliases)
+
+        # Generate and save analysis results
         analysis_file = output_dir / "analysis.json"
-        with open(analysis_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        indent = 2 if pretty else None
+        analyzer.write_analysis(analysis_file, indent=indent)
+        written = [analysis_file, output_file]
 
         # Generate outputs based on format
         if format == "html":
             analyzer.generate_report(output_dir / "report.html")
-            output_file = output_dir / "output.html"
             analyzer.generate_report(output_file)
+            written.append(output_dir / "report.html")
         elif format == "json":
-            output_file = output_dir / "output.json"
-            analyzer.export_to_json(output_file)
+            analyzer.export_to_json(output_file, indent=indent)
         elif format == "csv":
-            output_file = output_dir / "output.csv"
             analyzer.export_to_csv(output_file)
         elif format == "bibtex":
-            output_file = output_dir / "output.bibtex"
             analyzer.export_to_bibtex(output_file)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+
+        if cache is not None:
+            cache.put(cache_key, written)
 
         return {
             "success": True,
             "message": "Analysis completed successfully",
-            "output_file": str(output_file)
+            "output_file": str(output_file),
+            "cached": False
         }
 
     except Exception as e:
@@ -87,23 +134,44 @@ def cli():
 @cli.command()
 @click.argument('query')
 @click.option('--output', '-o', type=click.Path(), help='Output directory')
-@click.option('--input', '-i', type=click.Path(exists=True), help='Input file')
+@click.option('--input', '-i', type=click.Path(exists=True), help='Input file (.json, .jsonl, .jsonl.gz, .csv or an ingested corpus)')
 @click.option('--format', '-f', type=click.Choice(['html', 'json', 'csv', 'bibtex']),
               default='html', help='Output format')
-def analyze(query: str, output: Optional[str], input: Optional[str], format: str):
+@click.option('--cache-dir', type=click.Path(file_okay=False),
+              envvar='SCHOLAR_ANALYZER_CACHE_DIR',
+              help='Directory for caching results of unchanged inputs')
+@click.option('--cache-size', type=int, default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+              show_default=True, help='Maximum cache size in MB')
+@click.option('--dedup', is_flag=True,
+              help='Merge near-duplicate papers (similar titles) before analysis')
+@click.option('--author-aliases', type=click.Path(dir_okay=False),
+              help='Alias table file for merging author name variants '
+                   '(created if missing, extended with new names)')
+@click.option('--workers', type=click.IntRange(min=1),
+              help='Processes parsing JSON Lines input (default: all cores)')
+@click.option('--pretty', is_flag=True, help='Indent JSON outputs')
+def analyze(query: str, output: Optional[str], input: Optional[str], format: str,
+            cache_dir: Optional[str], cache_size: int, dedup: bool,
+            author_aliases: Optional[str], workers: Optional[int], pretty: bool):
     """Analyze scholarly papers based on search query."""
     result = process_query(
         query=query,
         output_dir=Path(output) if output else None,
         input_file=Path(input) if input else None,
-        format=format
+        format=format,
+        cache_dir=Path(cache_dir) if cache_dir else None,
+        cache_max_bytes=cache_size * 1024 * 1024,
+        deduplicate=dedup,
+        author_aliases=Path(author_aliases) if author_aliases else None,
+        workers=workers,
+        pretty=pretty
     )
 
     if result["success"]:
         click.echo(
-            f"Analysis complete. Results saved to: {result['output_dir']}")
+            f"Analysis complete. Results saved to: {result['output_file']}")
     else:
-        click.echo(f"Error: {result['error']}", err=True)
+        click.echo(result['message'], err=True)
 
 
 @cli.command()
@@ -111,13 +179,11 @@ def analyze(query: str, output: Optional[str], input: Optional[str], format: str
 @click.option('--format', '-f', type=click.Choice(['html', 'json', 'csv', 'bibtex']),
               default='html', help='Export format')
 @click.option('--output', '-o', type=click.Path(), help='Output path')
-def export(input_file: str, format: str, output: Optional[str]):
+@click.option('--pretty', is_flag=True, help='Indent JSON output')
+def export(input_file: str, format: str, output: Optional[str], pretty: bool):
     """Export analysis results to different formats."""
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        analyzer = ScholarAnalyzer(data)
+        analyzer = ScholarAnalyzer.from_file(input_file)
 
         if not output:
             output = f"scholar_export.{format}"
@@ -126,7 +192,10 @@ def export(input_file: str, format: str, output: Optional[str]):
             analyzer.generate_report(output)
         else:
             export_method = getattr(analyzer, f"export_to_{format}")
-            export_method(output)
+            if format == "json":
+                export_method(output, indent=2 if pretty else None)
+            else:
+                export_method(output)
 
         click.echo(f"Export complete. File saved as: {output}")
 
@@ -134,5 +203,36 @@ def export(input_file: str, format: str, output: Optional[str]):
         click.echo(f"Error during export: {str(e)}", err=True)
 
 
+@cli.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('corpus', type=click.Path(file_okay=False))
+@click.option('--overwrite', is_flag=True, help='Replace an existing corpus directory')
+@click.option('--workers', type=click.IntRange(min=1),
+              help='Processes parsing JSON Lines input (default: all cores)')
+@click.option('--dedup', is_flag=True,
+              help='Merge near-duplicate papers (similar titles) once, at ingest')
+@click.option('--author-aliases', type=click.Path(dir_okay=False),
+              help='Alias table file for merging author name variants')
+def ingest(input_file: str, corpus: str, overwrite: bool, workers: Optional[int],
+           dedup: bool, author_aliases: Optional[str]):
+    """Convert JSON, JSON Lines or CSV input into a columnar corpus directory.
+
+    The corpus can then be passed wherever an input file is accepted and
+    opens without parsing.
+    """
+    try:
+        analyzer = ScholarAnalyzer.from_file(input_file, workers=workers,
+                                             deduplicate=dedup,
+                                             author_aliases=author_aliases)
+        analyzer.save(corpus, overwrite=overwrite)
+        click.echo(f"Ingested {len(analyzer.table)} papers into: {corpus}")
+    except Exception as e:
+        click.echo(f"Error during ingest: {str(e)}", err=True)
+
+
+# Console script entry point
+main = cli
+
+
 if __name__ == '__main__':
     cli()
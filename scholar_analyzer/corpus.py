@@ -0,0 +1,142 @@
+# scholar_analyzer/corpus.py
+import os
+import shutil
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from . import serialization
+from .table import JsonColumn, PaperTable, StringColumn, StringPool
+
+CORPUS_FORMAT = 'scholar-analyzer-corpus'
+CORPUS_VERSION = 1
+MANIFEST = 'corpus.json'
+
+# Numeric columns of a ``PaperTable`` with their on-disk dtypes.
+COLUMNS = {
+    'years': np.int32,
+    'citations': np.int64,
+    'venue_ids': np.int32,
+    'author_offsets': np.int64,
+    'author_ids': np.int32,
+}
+
+
+def is_corpus(path: Union[str, Path]) -> bool:
+    """True for a directory written by ``save_corpus``."""
+    return (Path(path) / MANIFEST).is_file()
+
+
+def save_corpus(table: PaperTable, path: Union[str, Path],
+                document: Optional[Dict[str, Any]] = None,
+                overwrite: bool = False) -> None:
+    """Write ``table`` as a columnar corpus directory.
+
+    The layout is one ``.npy`` file per numeric column, titles as a UTF-8
+    buffer with an offsets array, the venue and author dictionaries as
+    JSON arrays of names, and each extra field as a buffer of JSON-encoded
+    values with offsets.  ``corpus.json`` holds the format version, the
+    paper count, the extra field names and ``document`` (the other
+    top-level values of the input, such as ``metadata``).
+
+    The directory is written next to ``path`` and renamed into place;
+    an existing corpus is replaced only with ``overwrite``.
+    """
+    path = Path(path)
+    if path.exists() and not (overwrite and is_corpus(path)):
+        raise FileExistsError(f"{path} already exists")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f'.{path.name}-', dir=path.parent))
+    try:
+        for name, dtype in COLUMNS.items():
+            np.save(staging / f'{name}.npy', np.ascontiguousarray(getattr(table, name), dtype))
+        _save_strings(staging, 'titles', table.titles)
+        for name in ('venues', 'authors'):
+            (staging / f'{name}.json').write_bytes(
+                serialization.dumpb(getattr(table, name).values))
+        fields = list(table.extra)
+        for i, field in enumerate(fields):
+            column = table.extra[field]
+            if not isinstance(column, JsonColumn):
+                column = JsonColumn.from_values(column)
+            _save_strings(staging, f'extra-{i}', column.strings)
+        (staging / MANIFEST).write_bytes(serialization.dumpb({
+            'format': CORPUS_FORMAT,
+            'version': CORPUS_VERSION,
+            'papers': len(table),
+            'extra': fields,
+            'document': document or {},
+        }, indent=2))
+        if path.exists():
+            shutil.rmtree(path)
+        os.replace(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def load_corpus(path: Union[str, Path],
+                mmap: bool = True) -> Tuple[PaperTable, Dict[str, Any]]:
+    """Open a corpus directory; returns the table and the saved document.
+
+    By default the columns and string buffers are memory-mapped
+    copy-on-write, so opening costs the same for any corpus size, pages
+    are read from disk as scans reach them, and edits to the table never
+    reach the files.  The venue and author dictionaries are decoded on
+    first use and extra fields stay encoded until a value is read.  With
+    ``mmap=False`` everything except those dictionaries is read into
+    memory up front.
+    """
+    path = Path(path)
+    manifest = serialization.loads((path / MANIFEST).read_bytes())
+    if manifest.get('format') != CORPUS_FORMAT:
+        raise ValueError(f"{path} is not a scholar-analyzer corpus")
+    if manifest.get('version') != CORPUS_VERSION:
+        raise ValueError(f"Unsupported corpus version: {manifest.get('version')}")
+
+    mmap_mode = 'c' if mmap else None
+    columns = {name: np.load(path / f'{name}.npy', mmap_mode=mmap_mode) for name in COLUMNS}
+    table = PaperTable(
+        titles=_load_strings(path, 'titles', mmap),
+        venues=_load_names(path / 'venues.json', mmap),
+        authors=_load_names(path / 'authors.json', mmap),
+        extra={field: JsonColumn(_load_strings(path, f'extra-{i}', mmap))
+               for i, field in enumerate(manifest['extra'])},
+        **columns,
+    )
+    if len(table) != manifest['papers']:
+        raise ValueError(f"{path} is incomplete: expected {manifest['papers']} papers")
+    return table, manifest['document']
+
+
+def _save_strings(directory: Path, name: str, column: StringColumn) -> None:
+    end = int(column.offsets[-1])
+    (directory / f'{name}.bin').write_bytes(bytes(column.buffer[:end]))
+    np.save(directory / f'{name}.offsets.npy', np.asarray(column.offsets, dtype=np.int64))
+
+
+def _load_strings(directory: Path, name: str, mmap: bool = False) -> StringColumn:
+    offsets = np.load(directory / f'{name}.offsets.npy', mmap_mode='c' if mmap else None)
+    data = directory / f'{name}.bin'
+    return StringColumn(_map_bytes(data) if mmap else data.read_bytes(), offsets)
+
+
+def _load_names(file: Path, mmap: bool = False) -> StringPool:
+    if not mmap:
+        return StringPool.from_distinct(serialization.loads(file.read_bytes()))
+    # Mapped now, so the pool reads this corpus even if it is replaced later.
+    return StringPool.from_loader(partial(_decode_names, _map_bytes(file)))
+
+
+def _decode_names(data: Any) -> List[str]:
+    return serialization.loads(bytes(data))
+
+
+def _map_bytes(file: Path) -> Any:
+    """Read-only view of a file's bytes; ``np.memmap`` rejects empty files."""
+    if file.stat().st_size == 0:
+        return b''
+    return np.memmap(file, dtype=np.uint8, mode='r')
@@ -0,0 +1,335 @@
+# scholar_analyzer/dedup.py
+from typing import Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+CITATION_POLICIES = ('max', 'sum', 'first')
+AUTHOR_POLICIES = ('union', 'first')
+
+# Title characters shingled per chunk while computing signatures; small
+# enough for the per-permutation hash arrays to stay in cache.
+DEFAULT_CHUNK_CHARS = 65536
+
+# Candidate pairs checked per step, bounding the signature and author
+# slot arrays gathered for them.
+PAIR_CHUNK = 1 << 16
+
+# Normalized titles shorter than this are too unspecific to match on.
+MIN_TITLE_CHARS = 12
+
+# Normalized titles shared by unrelated papers (front matter, notices);
+# papers with them are never matched.
+GENERIC_TITLES = frozenset(title.encode() for title in (
+    'abstracts', 'acknowledgements', 'acknowledgments', 'announcements',
+    'authorindex', 'bookreview', 'bookreviews', 'calendar', 'commentary',
+    'contents', 'correction', 'corrigendum', 'discussion', 'editorial',
+    'editorialboard', 'editorsnote', 'erratum', 'foreword', 'fromtheeditor',
+    'frontmatter', 'backmatter', 'guesteditorial', 'index', 'introduction',
+    'keynote', 'keynoteaddress', 'lettertotheeditor', 'news', 'obituary',
+    'preface', 'reply', 'response', 'retractionnotice', 'reviewers',
+    'subjectindex', 'tableofcontents', 'thankyoutoourreviewers',
+))
+
+# Odd 64-bit multiplier folding each shingle into a 32-bit base hash.
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+# Byte translation used to normalize titles: ASCII letters are lowered,
+# other ASCII characters (spaces, punctuation) map to 0 and are dropped,
+# and UTF-8 bytes of other characters are kept as they are.
+_FOLD = np.arange(256, dtype=np.uint8)
+_FOLD[:128] = 0
+for _char in b'0123456789abcdefghijklmnopqrstuvwxyz':
+    _FOLD[_char] = _char
+for _char in b'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+    _FOLD[_char] = _char + 32
+
+
+def normalized_titles(titles) -> Tuple[np.ndarray, np.ndarray]:
+    """Lowercased title bytes without spaces or ASCII punctuation.
+
+    Works on a ``StringColumn`` without decoding it; returns the joined
+    bytes and their ``offsets`` by row, like the column itself.
+    """
+    lengths = np.diff(titles.offsets)
+    data = np.frombuffer(titles.buffer, dtype=np.uint8, count=int(titles.offsets[-1]))
+    folded = _FOLD[data]
+    keep = folded != 0
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    np.cumsum(np.bincount(rows[keep], minlength=len(lengths)), out=offsets[1:])
+    return folded[keep], offsets
+
+
+def shingles(chars: np.ndarray, offsets: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Every run of ``k`` bytes within each row, packed into a ``uint64``.
+
+    Rows shorter than ``k`` (but not empty) get a single shingle of their
+    whole text.  Returns the shingles and their offsets by row.
+    """
+    if not 1 <= k <= 8:
+        raise ValueError("Shingle size must be between 1 and 8 bytes")
+    lengths = np.diff(offsets)
+    counts = np.where(lengths >= k, lengths - k + 1, np.minimum(lengths, 1))
+    shingle_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(counts, out=shingle_offsets[1:])
+
+    rows = np.repeat(np.arange(len(lengths)), counts)
+    starts = offsets[rows] + (np.arange(len(rows)) - shingle_offsets[rows])
+    ends = offsets[rows + 1]
+    padded = np.concatenate((chars, np.zeros(k, dtype=np.uint8))).astype(np.uint64)
+    values = np.zeros(len(rows), dtype=np.uint64)
+    for j in range(k):
+        byte = padded[starts + j]
+        byte[starts + j >= ends] = 0
+        values = (values << np.uint64(8)) | byte
+    return values, shingle_offsets
+
+
+def shared_authors(table, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Whether papers ``left[i]`` and ``right[i]`` have an author in common."""
+    shared = np.zeros(len(left), dtype=bool)
+    if len(left) == 0 or len(table.author_ids) == 0:
+        return shared
+    n_authors = int(table.author_ids.max()) + 1
+    for start in range(0, len(left), PAIR_CHUNK):
+        # (pair, author) keys of each side; a key on both sides is a
+        # shared author of that pair.
+        keys_left = _author_keys(table, left[start:start + PAIR_CHUNK], n_authors)
+        keys_right = _author_keys(table, right[start:start + PAIR_CHUNK], n_authors)
+        hits = keys_left[np.isin(keys_left, keys_right)]
+        shared[start + hits // n_authors] = True
+    return shared
+
+
+def _author_keys(table, rows: np.ndarray, n_authors: int) -> np.ndarray:
+    """``i * n_authors + author`` for every author slot of ``rows[i]``."""
+    starts = table.author_offsets[rows]
+    counts = table.author_offsets[rows + 1] - starts
+    pair = np.repeat(np.arange(len(rows), dtype=np.int64), counts)
+    heads = np.cumsum(counts) - counts
+    slots = starts[pair] + (np.arange(len(pair)) - heads[pair])
+    return pair * n_authors + table.author_ids[slots]
+
+
+class Deduplicator:
+    """Near-duplicate paper detection with MinHash signatures and LSH.
+
+    Titles are normalized (lowercase, no spaces or punctuation) and cut
+    into ``shingle``-byte shingles; each paper gets a ``num_perm``-value
+    MinHash signature, whose agreement with another paper's estimates
+    the Jaccard similarity of their shingle sets.  Signatures are split
+    into ``bands`` bands and papers sharing any band become candidates,
+    so only near-identical titles are ever compared: with ``r`` rows per
+    band a pair of similarity ``s`` is a candidate with probability
+    ``1 - (1 - s ** r) ** bands``.  Candidates are confirmed when their
+    estimated similarity reaches ``threshold``, their known years are at
+    most ``year_tolerance`` apart and they share an author or a (known)
+    venue; a title alone never merges papers.  Titles shorter than
+    ``min_title_chars`` once normalized, or in ``GENERIC_TITLES``
+    ("Editorial", "Preface", ...), are not matched at all.
+
+    Confirmed pairs are grouped into connected components, but a paper
+    is only merged into its group's earliest paper if that pair is
+    confirmed directly; the others are regrouped among themselves, so a
+    chain A ~ B ~ C never merges C into an A it does not match.
+
+    Merging keeps the earliest paper of each group.  ``citations`` picks
+    its citation count (``'max'``, ``'sum'`` or ``'first'``), ``authors``
+    whether it gains the other papers' authors (``'union'``) or keeps
+    its own (``'first'``); a missing year or venue is filled in from the
+    duplicates.  Every step is a vectorized pass over the papers or a
+    sort per band, so the cost grows linearly with the corpus.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 64, bands: int = 16,
+                 shingle: int = 5, year_tolerance: Optional[int] = 1,
+                 citations: str = 'max', authors: str = 'union', seed: int = 0,
+                 chunk_chars: int = DEFAULT_CHUNK_CHARS,
+                 min_title_chars: int = MIN_TITLE_CHARS):
+        if citations not in CITATION_POLICIES:
+            raise ValueError(f"Unsupported citation policy: {citations}")
+        if authors not in AUTHOR_POLICIES:
+            raise ValueError(f"Unsupported author policy: {authors}")
+        if bands < 1 or num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        if not 0 < threshold <= 1:
+            raise ValueError("Threshold must be in (0, 1]")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle = shingle
+        self.year_tolerance = year_tolerance
+        self.citations = citations
+        self.authors = authors
+        self.chunk_chars = chunk_chars
+        self.min_title_chars = min_title_chars
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64).astype(np.uint32) | np.uint32(1)
+        self._b = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64).astype(np.uint32)
+
+    def signatures(self, table) -> Tuple[np.ndarray, np.ndarray]:
+        """MinHash signature of every paper's title.
+
+        Returns a ``(len(table), num_perm)`` ``uint32`` array and a mask
+        of the papers whose normalized title is specific enough to match
+        (see the class docstring); the others have no signature.
+        """
+        chars, offsets = normalized_titles(table.titles)
+        n = len(table)
+        signatures = np.zeros((n, self.num_perm), dtype=np.uint32)
+        lengths = np.diff(offsets)
+        present = lengths >= max(self.min_title_chars, 1)
+        longest = max(map(len, GENERIC_TITLES))
+        for row in np.flatnonzero(present & (lengths <= longest)).tolist():
+            if chars[offsets[row]:offsets[row + 1]].tobytes() in GENERIC_TITLES:
+                present[row] = False
+
+        start = 0
+        while start < n:
+            end = int(np.searchsorted(offsets, offsets[start] + self.chunk_chars, 'right'))
+            end = min(max(end - 1, start + 1), n)
+            rows = np.arange(start, end)[present[start:end]]
+            if len(rows):
+                # Shingle the present rows only, so each reduceat segment
+                # ends where its own title does.
+                kept = present[start:end]
+                row_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+                np.cumsum(lengths[start:end][kept], out=row_offsets[1:])
+                text = chars[offsets[start]:offsets[end]]
+                mask = np.repeat(kept, lengths[start:end])
+                values, shingle_offsets = shingles(text[mask], row_offsets, self.shingle)
+                heads = shingle_offsets[:-1]
+                # Each permutation is x -> a * x + b (mod 2 ** 32) of a
+                # 32-bit base hash, computed in place in one buffer.
+                base = ((values * _GOLDEN) >> np.uint64(32)).astype(np.uint32)
+                hashed = np.empty_like(base)
+                for p in range(self.num_perm):
+                    np.multiply(base, self._a[p], out=hashed)
+                    np.add(hashed, self._b[p], out=hashed)
+                    signatures[rows, p] = np.minimum.reduceat(hashed, heads)
+            start = end
+        return signatures, present
+
+    def candidates(self, signatures: np.ndarray, present: np.ndarray) -> np.ndarray:
+        """Pairs of papers sharing at least one signature band.
+
+        Within each band bucket every paper is paired with the bucket's
+        first paper, so a bucket of ``m`` papers yields ``m - 1`` pairs
+        rather than ``m ** 2``.  Returns an ``(n_pairs, 2)`` array.
+        """
+        rows = np.flatnonzero(present)
+        width = self.num_perm // self.bands
+        pairs = []
+        for band in range(self.bands):
+            block = signatures[rows, band * width:(band + 1) * width].astype(np.uint64)
+            keys = np.zeros(len(rows), dtype=np.uint64)
+            for column in block.T:
+                keys = (keys * np.uint64(0x100000001B3)) ^ column
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            same = np.zeros(len(keys), dtype=bool)
+            same[1:] = keys[1:] == keys[:-1]
+            if not same.any():
+                continue
+            bucket_start = np.maximum.accumulate(np.where(same, 0, np.arange(len(keys))))
+            members = np.flatnonzero(same)
+            pairs.append(np.column_stack((rows[order[bucket_start[members]]],
+                                          rows[order[members]])))
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        pairs = np.concatenate(pairs)
+        pairs.sort(axis=1)
+        keys = np.sort(pairs[:, 0] * len(signatures) + pairs[:, 1])
+        keys = keys[np.diff(keys, prepend=-1) != 0]
+        return np.column_stack(np.divmod(keys, len(signatures)))
+
+    def confirm(self, table, signatures: np.ndarray, left: np.ndarray,
+                right: np.ndarray) -> np.ndarray:
+        """Which pairs ``(left[i], right[i])`` are duplicates of each other."""
+        similar = np.empty(len(left), dtype=bool)
+        for start in range(0, len(left), PAIR_CHUNK):
+            part = slice(start, start + PAIR_CHUNK)
+            agreement = np.mean(signatures[left[part]] == signatures[right[part]], axis=1)
+            similar[part] = agreement >= self.threshold
+        if self.year_tolerance is not None:
+            years_a = table.years[left].astype(np.int64)
+            years_b = table.years[right].astype(np.int64)
+            similar &= ((years_a == 0) | (years_b == 0)
+                        | (np.abs(years_a - years_b) <= self.year_tolerance))
+        venue_a, venue_b = table.venue_ids[left], table.venue_ids[right]
+        evidence = (venue_a != 0) & (venue_a == venue_b)
+        unsettled = np.flatnonzero(similar & ~evidence)
+        evidence[unsettled] = shared_authors(table, left[unsettled], right[unsettled])
+        return similar & evidence
+
+    def find_duplicates(self, table) -> np.ndarray:
+        """Row of the paper each row is merged into (itself if unique)."""
+        n = len(table)
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+        signatures, present = self.signatures(table)
+        pairs = self.candidates(signatures, present)
+        confirmed = self.confirm(table, signatures, pairs[:, 0], pairs[:, 1])
+        left, right = pairs[confirmed, 0], pairs[confirmed, 1]
+
+        into = np.arange(n)
+        rows = np.arange(n)
+        while len(left):
+            graph = sp.coo_matrix((np.ones(len(left), dtype=np.int8), (left, right)),
+                                  shape=(n, n))
+            _, labels = connected_components(graph, directed=False)
+            # Assigned in reverse, the last write for each label is its
+            # earliest row.
+            first = np.zeros(labels.max() + 1, dtype=np.int64)
+            first[labels[::-1]] = rows[::-1]
+            leaders = first[labels]
+            members = np.flatnonzero(leaders != rows)
+            direct = members[self.confirm(table, signatures, leaders[members], members)]
+            into[direct] = leaders[direct]
+
+            # Leaders and merged papers are settled; members that did not
+            # match their leader may still match each other.
+            settled = np.zeros(n, dtype=bool)
+            settled[direct] = True
+            settled[leaders[members]] = True
+            keep = ~(settled[left] | settled[right])
+            left, right = left[keep], right[keep]
+        return into
+
+    def merge(self, table, into: np.ndarray) -> int:
+        """Merge every row into ``into[row]`` in place; returns rows removed."""
+        rows = np.arange(len(table))
+        duplicate = into != rows
+        if not duplicate.any():
+            return 0
+        dups, targets = rows[duplicate], into[duplicate]
+
+        if self.citations == 'max':
+            np.maximum.at(table.citations, targets, table.citations[dups])
+        elif self.citations == 'sum':
+            np.add.at(table.citations, targets, table.citations[dups])
+        for column in (table.years, table.venue_ids):
+            fill = (column[targets] == 0) & (column[dups] != 0)
+            column[targets[fill]] = column[dups[fill]]
+
+        if self.authors == 'union':
+            # Slots are in row order and each group's target is its first
+            # row, so a stable sort by target keeps the target's authors
+            # first and the others in input order.
+            owners = into[np.repeat(rows, table.author_counts)]
+            order = np.argsort(owners, kind='stable')
+            table.replace_authors(owners[order], table.author_ids[order])
+
+        table.delete(dups)
+        return len(dups)
+
+    def deduplicate(self, table) -> int:
+        """Find and merge near-duplicate papers of ``table`` in place.
+
+        Returns:
+            Number of papers removed
+        """
+        return self.merge(table, self.find_duplicates(table))
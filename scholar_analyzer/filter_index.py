@@ -0,0 +1,559 @@
+# scholar_analyzer/filter_index.py
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .table import SCAN_CHUNK
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+# Years accepted by year range filters.
+MIN_YEAR = 1900
+
+# A plan whose most selective predicate is estimated to match at most
+# 1/SPARSE_RATIO of the papers refines that row list; otherwise it ANDs
+# full-length boolean masks.
+SPARSE_RATIO = 32
+
+# Joins the texts of a field for substring search, so no match can span
+# two papers; queries containing it match nothing.
+_TEXT_SEPARATOR = '\x00'
+
+
+class FilterIndex:
+    """Secondary indexes over a ``PaperTable`` for sub-linear filtering.
+
+    Every lookup returns the matching rows as a sorted ``int64`` array:
+
+    * years and citations: a row permutation sorted by value, so a range
+      is two binary searches and a slice;
+    * venues and authors: CSR posting lists (``offsets`` by string ID
+      into ``rows``), so a name costs a dict lookup and a slice, and
+      substring or pattern matches scan the distinct names instead of
+      the papers;
+    * titles and abstracts: one lowercased string per field, searched
+      with ``str.find`` and mapped back to rows through their offsets.
+
+    Each index is built on first use, so a corpus only filtered by year
+    never pays for the author postings.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self._sorted = {}
+        self._postings = {}
+        self._texts = {}
+
+    def year_range(self, start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """Rows with ``start <= year <= end``; undated papers never match."""
+        return self._range('years', max(start if start is not None else 1, 1), end)
+
+    def citation_range(self, minimum: Optional[int] = None,
+                       maximum: Optional[int] = None) -> np.ndarray:
+        """Rows with ``minimum <= citations <= maximum``."""
+        return self._range('citations', minimum, maximum)
+
+    def venues(self, names: Iterable[str]) -> np.ndarray:
+        """Rows published in any of the venues ``names``."""
+        pool = self.table.venues
+        return self._union('venues', [pool.lookup(name) for name in names if name])
+
+    def venue_pattern(self, pattern: str) -> np.ndarray:
+        """Rows whose venue matches the regular expression ``pattern``."""
+        search = re.compile(pattern).search
+        return self._union('venues', [id_ for id_, name in enumerate(self.table.venues.values)
+                                      if name and search(name)])
+
+    def authors(self, names: Iterable[str], match_all: bool = False) -> np.ndarray:
+        """Rows with any (or, with ``match_all``, every) author in ``names``."""
+        pool = self.table.authors
+        ids = [pool.lookup(name) for name in names]
+        if not match_all:
+            return self._union('authors', ids)
+        if not ids or None in ids:
+            return _EMPTY
+        return intersect(*(self._posting('authors', id_) for id_ in ids))
+
+    def author_substring(self, text: str) -> np.ndarray:
+        """Rows with an author whose name contains ``text``, ignoring case."""
+        return self._union('authors', self.matching_authors(text))
+
+    def matching_authors(self, text: str) -> List[int]:
+        """IDs of the author names containing ``text``, ignoring case."""
+        text = text.lower()
+        return [id_ for id_, name in enumerate(self.table.authors.values)
+                if name and text in name.lower()]
+
+    def matching_venues(self, text: str) -> List[int]:
+        """IDs of the venue names containing ``text``, ignoring case."""
+        text = text.lower()
+        return [id_ for id_, name in enumerate(self.table.venues.values)
+                if name and text in name.lower()]
+
+    def posting_sizes(self, field: str, ids: List[int]) -> np.ndarray:
+        """Number of papers for each venue or author ID in ``ids``."""
+        offsets, _ = self._csr(field)
+        ids = np.asarray(ids, dtype=np.int64)
+        return offsets[ids + 1] - offsets[ids]
+
+    def keyword(self, keyword: str,
+                fields: Tuple[str, ...] = ('title', 'abstract')) -> np.ndarray:
+        """Rows whose title or abstract contains ``keyword``, ignoring case."""
+        keyword = keyword.lower()
+        if not keyword or _TEXT_SEPARATOR in keyword:
+            return _EMPTY
+        matches = [self._search(field, keyword) for field in fields]
+        return _sorted_unique(np.concatenate(matches)) if len(matches) > 1 else matches[0]
+
+    def _range(self, column: str, low: Optional[int], high: Optional[int]) -> np.ndarray:
+        order, values = self._sorted_column(column)
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        stop = len(values) if high is None else np.searchsorted(values, high, side='right')
+        return np.sort(order[start:stop])
+
+    def _sorted_column(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        cached = self._sorted.get(column)
+        if cached is None:
+            values = getattr(self.table, column)
+            order = np.argsort(values, kind='stable').astype(np.int64)
+            cached = self._sorted[column] = (order, values[order])
+        return cached
+
+    def _csr(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Posting lists of venue or author IDs, rows ascending and unique."""
+        cached = self._postings.get(field)
+        if cached is None:
+            table = self.table
+            n = max(len(table), 1)
+            if field == 'venues':
+                keys = table.venue_ids.astype(np.int64) * n + np.arange(len(table))
+            else:
+                rows = np.repeat(np.arange(len(table), dtype=np.int64), table.author_counts)
+                keys = table.author_ids.astype(np.int64) * n + rows
+            # Drops repeats (an author listed twice on a paper).
+            keys = _sorted_unique(keys)
+            ids, rows = np.divmod(keys, n)
+            counts = np.bincount(ids, minlength=len(getattr(table, field)))
+            offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+            cached = self._postings[field] = (offsets, rows)
+        return cached
+
+    def _posting(self, field: str, id_: int) -> np.ndarray:
+        offsets, rows = self._csr(field)
+        return rows[offsets[id_]:offsets[id_ + 1]]
+
+    def _union(self, field: str, ids: List[Optional[int]]) -> np.ndarray:
+        postings = [self._posting(field, id_) for id_ in set(ids) if id_ is not None]
+        if not postings:
+            return _EMPTY
+        if len(postings) == 1:
+            return postings[0]
+        return _sorted_unique(np.concatenate(postings))
+
+    def _text(self, field: str) -> Tuple[str, List[int]]:
+        """Lowercased texts of a field joined by separators, with row starts."""
+        cached = self._texts.get(field)
+        if cached is None:
+            table = self.table
+            if field == 'title':
+                texts = [title.lower() for title in table.titles]
+            else:
+                texts = [value.lower() if isinstance(value, str) else ''
+                         for value in table.extra.get(field, [''] * len(table))]
+            starts = np.zeros(len(texts) + 1, dtype=np.int64)
+            np.cumsum([len(text) + 1 for text in texts], out=starts[1:])
+            cached = self._texts[field] = (_TEXT_SEPARATOR.join(texts), starts.tolist())
+        return cached
+
+    def _search(self, field: str, keyword: str) -> np.ndarray:
+        """Rows of ``field`` containing ``keyword``, one ``find`` per hit."""
+        text, starts = self._text(field)
+        rows = []
+        find = text.find
+        position = find(keyword)
+        while position >= 0:
+            row = bisect_right(starts, position) - 1
+            rows.append(row)
+            # Skip the rest of this row; one hit is enough.
+            position = find(keyword, starts[row + 1])
+        return np.asarray(rows, dtype=np.int64)
+
+
+class FilterPlan:
+    """A compound filter: one predicate per filter, most selective first.
+
+    ``from_config`` turns a filter configuration into predicates that
+    each estimate their match count from the indexes (two binary searches
+    or a sum of posting sizes, never a scan).  Execution starts from the
+    most selective predicate: if it is small, its rows are refined by
+    testing only those rows against the other predicates; otherwise each
+    predicate becomes a boolean mask over the table and the masks are
+    ANDed together.  Keyword predicates have no estimate and always run
+    last, so their text search usually only touches the surviving rows.
+
+    The result is a sorted row array (or mask) that exports, charts and
+    the web API read through ``PaperTable`` without copying papers.
+    """
+
+    def __init__(self, index: FilterIndex, predicates: List["_Predicate"]):
+        self.index = index
+        self.predicates = sorted(predicates, key=lambda predicate: (
+            predicate.searches_text, predicate.estimate))
+
+    @classmethod
+    def from_config(cls, index: FilterIndex, config: Dict[str, Any]) -> "FilterPlan":
+        """Plan a configuration as accepted by ``validate_filter``."""
+        table = index.table
+        predicates: List[_Predicate] = []
+        for filter_type, value in config.items():
+            value = validate_filter(filter_type, value)
+            if filter_type in ('year_range', 'year'):
+                start = max(value[0] if value[0] is not None else 1, 1)
+                predicates.append(_RangePredicate(index, 'years', start, value[1]))
+            elif filter_type == 'citations':
+                predicates.append(_RangePredicate(index, 'citations', *value))
+            elif filter_type == 'venues':
+                predicates.append(_PostingPredicate(
+                    index, 'venues', [table.venues.lookup(name) for name in value]))
+            elif filter_type == 'venue_pattern':
+                search = re.compile(value).search
+                predicates.append(_PostingPredicate(
+                    index, 'venues', [id_ for id_, name in enumerate(table.venues.values)
+                                      if name and search(name)]))
+            elif filter_type == 'authors':
+                predicates.append(_PostingPredicate(
+                    index, 'authors', [table.authors.lookup(name) for name in value]))
+            elif filter_type == 'author':
+                predicates.append(_PostingPredicate(
+                    index, 'authors', index.matching_authors(value)))
+            else:
+                predicates.append(_KeywordPredicate(index, value))
+        return cls(index, predicates)
+
+    def explain(self) -> List[Dict[str, Any]]:
+        """The predicates in execution order with their estimated matches."""
+        return [{'filter': predicate.name, 'estimate': predicate.estimate}
+                for predicate in self.predicates]
+
+    def rows(self) -> np.ndarray:
+        """Sorted rows matching every predicate."""
+        n = len(self.index.table)
+        if not self.predicates:
+            return np.arange(n, dtype=np.int64)
+
+        first, rest = self.predicates[0], self.predicates[1:]
+        if first.estimate * SPARSE_RATIO <= n:
+            rows = first.rows()
+            for predicate in rest:
+                if len(rows) == 0:
+                    break
+                rows = rows[predicate.test(rows)]
+            return rows
+
+        mask = first.mask()
+        rows = None
+        for predicate in rest:
+            if rows is None and not predicate.searches_text:
+                mask &= predicate.mask()
+            else:
+                # Text predicates come last; search only the rows left.
+                if rows is None:
+                    rows = np.flatnonzero(mask)
+                rows = rows[predicate.test(rows)]
+        return np.flatnonzero(mask) if rows is None else rows
+
+    def mask(self) -> np.ndarray:
+        """Boolean mask over the table's rows."""
+        mask = np.zeros(len(self.index.table), dtype=bool)
+        mask[self.rows()] = True
+        return mask
+
+
+class FilterScan:
+    """A compound filter evaluated by scanning the table in row chunks.
+
+    ``FilterPlan`` answers from indexes whose size is proportional to the
+    table: a sorted row permutation per range column and posting lists
+    per name.  On a memory-mapped corpus larger than RAM those cannot be
+    built, so a scan reads each filtered column once, ``chunk_size`` rows
+    at a time, and keeps only the matching row numbers.  Names and
+    patterns are resolved to IDs up front against the (small) venue and
+    author dictionaries; keyword tests decode the titles and abstracts of
+    the rows that survive the other filters.
+    """
+
+    def __init__(self, table, chunk_size: int = SCAN_CHUNK):
+        self.table = table
+        self.chunk_size = chunk_size
+        self.ranges: List[Tuple[str, Optional[int], Optional[int]]] = []
+        self.venue_ids: List[np.ndarray] = []
+        self.author_ids: List[np.ndarray] = []
+        self.keywords: List[List[str]] = []
+
+    @classmethod
+    def from_config(cls, table, config: Dict[str, Any],
+                    chunk_size: int = SCAN_CHUNK) -> "FilterScan":
+        """Plan a configuration as accepted by ``validate_filter``."""
+        scan = cls(table, chunk_size)
+        for filter_type, value in config.items():
+            value = validate_filter(filter_type, value)
+            if filter_type in ('year_range', 'year'):
+                start = max(value[0] if value[0] is not None else 1, 1)
+                scan.ranges.append(('years', start, value[1]))
+            elif filter_type == 'citations':
+                scan.ranges.append(('citations', *value))
+            elif filter_type == 'venues':
+                scan.venue_ids.append(_ids([table.venues.lookup(name) for name in value]))
+            elif filter_type == 'venue_pattern':
+                search = re.compile(value).search
+                scan.venue_ids.append(_ids([id_ for id_, name in enumerate(table.venues.values)
+                                            if name and search(name)]))
+            elif filter_type == 'authors':
+                scan.author_ids.append(_ids([table.authors.lookup(name) for name in value]))
+            elif filter_type == 'author':
+                scan.author_ids.append(_ids(FilterIndex(table).matching_authors(value)))
+            else:
+                scan.keywords.append([keyword.lower() for keyword in value])
+        return scan
+
+    def rows(self) -> np.ndarray:
+        """Sorted rows matching every filter."""
+        n = len(self.table)
+        matches = [self._chunk(start, min(start + self.chunk_size, n))
+                   for start in range(0, n, self.chunk_size)]
+        return np.concatenate(matches) if matches else _EMPTY
+
+    def mask(self) -> np.ndarray:
+        """Boolean mask over the table's rows."""
+        mask = np.zeros(len(self.table), dtype=bool)
+        mask[self.rows()] = True
+        return mask
+
+    def _chunk(self, start: int, stop: int) -> np.ndarray:
+        table = self.table
+        keep = np.ones(stop - start, dtype=bool)
+        for column, low, high in self.ranges:
+            values = getattr(table, column)[start:stop]
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+        for ids in self.venue_ids:
+            keep &= np.isin(table.venue_ids[start:stop], ids)
+        if self.author_ids:
+            offsets = table.author_offsets[start:stop + 1]
+            slots = table.author_ids[offsets[0]:offsets[-1]]
+            for ids in self.author_ids:
+                # Matching slots counted per row through a running total.
+                hits = np.zeros(len(slots) + 1, dtype=np.int64)
+                np.cumsum(np.isin(slots, ids), out=hits[1:])
+                ends = hits[offsets - offsets[0]]
+                keep &= ends[1:] > ends[:-1]
+        rows = np.flatnonzero(keep) + start
+        for keywords in self.keywords:
+            if len(rows) == 0:
+                break
+            rows = rows[_keyword_test(table, keywords, rows)]
+        return rows
+
+
+class _Predicate(ABC):
+    name = ''
+    estimate = 0
+    searches_text = False
+
+    @abstractmethod
+    def rows(self) -> np.ndarray:
+        """Sorted matching rows, from the index."""
+
+    def test(self, rows: np.ndarray) -> np.ndarray:
+        """Which of the candidate ``rows`` match."""
+        return np.isin(rows, self.rows(), assume_unique=True)
+
+    def mask(self) -> np.ndarray:
+        """Boolean mask over all rows."""
+        mask = np.zeros(len(self.index.table), dtype=bool)
+        mask[self.rows()] = True
+        return mask
+
+
+class _RangePredicate(_Predicate):
+    def __init__(self, index: FilterIndex, column: str,
+                 low: Optional[int], high: Optional[int]):
+        self.index = index
+        self.name = column
+        self.column = column
+        self.low, self.high = low, high
+        _, values = index._sorted_column(column)
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        stop = len(values) if high is None else np.searchsorted(values, high, side='right')
+        self.estimate = int(max(stop - start, 0))
+
+    def rows(self) -> np.ndarray:
+        return self.index._range(self.column, self.low, self.high)
+
+    def test(self, rows: np.ndarray) -> np.ndarray:
+        return self._within(getattr(self.index.table, self.column)[rows])
+
+    def mask(self) -> np.ndarray:
+        return self._within(getattr(self.index.table, self.column))
+
+    def _within(self, values: np.ndarray) -> np.ndarray:
+        keep = np.ones(len(values), dtype=bool)
+        if self.low is not None:
+            keep &= values >= self.low
+        if self.high is not None:
+            keep &= values <= self.high
+        return keep
+
+
+class _PostingPredicate(_Predicate):
+    def __init__(self, index: FilterIndex, field: str, ids: List[Optional[int]]):
+        self.index = index
+        self.name = field
+        self.field = field
+        self.ids = sorted({id_ for id_ in ids if id_ is not None})
+        self.estimate = int(index.posting_sizes(field, self.ids).sum()) if self.ids else 0
+
+    def rows(self) -> np.ndarray:
+        return self.index._union(self.field, self.ids)
+
+    def test(self, rows: np.ndarray) -> np.ndarray:
+        if self.field == 'venues':
+            return np.isin(self.index.table.venue_ids[rows], self.ids)
+        return super().test(rows)
+
+    def mask(self) -> np.ndarray:
+        # Set each posting list directly; no union needed.
+        mask = np.zeros(len(self.index.table), dtype=bool)
+        for id_ in self.ids:
+            mask[self.index._posting(self.field, id_)] = True
+        return mask
+
+
+class _KeywordPredicate(_Predicate):
+    name = 'keywords'
+    searches_text = True
+
+    def __init__(self, index: FilterIndex, keywords: List[str]):
+        self.index = index
+        self.keywords = [keyword.lower() for keyword in keywords]
+        self.estimate = len(index.table)
+
+    def rows(self) -> np.ndarray:
+        matches = [self.index.keyword(keyword) for keyword in self.keywords]
+        return _sorted_unique(np.concatenate(matches)) if matches else _EMPTY
+
+    def test(self, rows: np.ndarray) -> np.ndarray:
+        return _keyword_test(self.index.table, self.keywords, rows)
+
+
+def _keyword_test(table, keywords: List[str], rows: np.ndarray) -> np.ndarray:
+    """Which of ``rows`` mention any of the lowercased ``keywords``."""
+    titles = [title.lower() for title in table.titles.take(rows)]
+    abstracts = table.extra.get('abstract')
+    if abstracts is None:
+        abstracts = [''] * len(rows)
+    else:
+        abstracts = [abstracts[row].lower() if isinstance(abstracts[row], str) else ''
+                     for row in rows.tolist()]
+    return np.fromiter((any(keyword in title or keyword in abstract for keyword in keywords)
+                        for title, abstract in zip(titles, abstracts)),
+                       dtype=bool, count=len(rows))
+
+
+def validate_filter(filter_type: str, value: Any) -> Any:
+    """Check a filter value and return it in the form the planner uses.
+
+    ``year_range`` (or ``year``) and ``citations`` take dicts with
+    ``start``/``end`` and ``min``/``max``; ``venues``, ``authors`` and
+    ``keywords`` a name or list of names (any may match); ``author`` a
+    name substring and ``venue_pattern`` a regular expression.
+    """
+    if filter_type in ('year_range', 'year'):
+        if not isinstance(value, dict):
+            raise TypeError("Year range must be a dict with 'start' and 'end'")
+        return _year_range(value.get('start'), value.get('end'))
+    if filter_type == 'citations':
+        if not isinstance(value, dict):
+            raise TypeError("Citations must be a dict with 'min' and 'max'")
+        return _citation_range(value.get('min'), value.get('max'))
+    if filter_type in ('venues', 'authors', 'keywords'):
+        return _names(value, filter_type.capitalize())
+    if filter_type == 'author':
+        return _text(value, 'Author')
+    if filter_type == 'venue_pattern':
+        return _text(value, 'Venue pattern')
+    raise ValueError(f"Unknown filter type: {filter_type}")
+
+
+def _text(value: Any, label: str) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"{label} must be a string")
+    if not value.strip():
+        raise ValueError(f"{label} must not be empty")
+    return value
+
+
+def _names(value: Any, label: str) -> List[str]:
+    """A name or list of names as a list of non-empty strings."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, (list, tuple, set)):
+        raise TypeError(f"{label} must be a string or a list of strings")
+    return [_text(name, label) for name in value]
+
+
+def _year_range(start: Any, end: Any) -> Tuple[Optional[int], Optional[int]]:
+    max_year = datetime.now().year + 1
+    for year in (start, end):
+        if year is not None and (not isinstance(year, int) or isinstance(year, bool)):
+            raise TypeError(f"Years must be integers, got {year!r}")
+    if start is not None and end is not None and start > end:
+        raise ValueError(f"Year range ends before it starts: {start} > {end}")
+    if any(year is not None and not MIN_YEAR <= year <= max_year for year in (start, end)):
+        raise ValueError(f"Years must be between {MIN_YEAR} and {max_year}")
+    return start, end
+
+
+def _citation_range(minimum: Any, maximum: Any) -> Tuple[Optional[int], Optional[int]]:
+    for count in (minimum, maximum):
+        if count is not None and (not isinstance(count, int) or isinstance(count, bool)):
+            raise TypeError(f"Citation counts must be integers, got {count!r}")
+    if (minimum is not None and minimum < 0) or (maximum is not None and maximum < 0):
+        raise ValueError("Citation counts cannot be negative")
+    if minimum is not None and maximum is not None and minimum > maximum:
+        raise ValueError(f"Citation range ends before it starts: {minimum} > {maximum}")
+    return minimum, maximum
+
+
+def _ids(ids: Iterable[Optional[int]]) -> np.ndarray:
+    """Sorted distinct IDs, skipping names that were never interned."""
+    return np.array(sorted({id_ for id_ in ids if id_ is not None}), dtype=np.int64)
+
+
+def _sorted_unique(rows: np.ndarray) -> np.ndarray:
+    """Sorted distinct values of a non-negative array.
+
+    Sorting and dropping repeats is several times faster than
+    ``np.unique`` on millions of integers.
+    """
+    rows = np.sort(rows)
+    return rows[np.diff(rows, prepend=-1) != 0]
+
+
+def intersect(*rows: np.ndarray) -> np.ndarray:
+    """Intersection of sorted, unique row arrays, smallest first."""
+    if not rows:
+        return _EMPTY
+    rows = sorted(rows, key=len)
+    result = rows[0]
+    for other in rows[1:]:
+        if len(result) == 0:
+            break
+        result = np.intersect1d(result, other, assume_unique=True)
+    return result
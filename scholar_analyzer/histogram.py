@@ -0,0 +1,132 @@
+# scholar_analyzer/histogram.py
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+# Default citation buckets: lower edges of half-open integer ranges, the
+# last one open-ended.  Labels are the ones ``citation_data`` always used.
+CITATION_EDGES = (0, 1, 11, 51, 101, 501)
+CITATION_RANGES = ('0', '1-10', '11-50', '51-100', '101-500', '500+')
+
+
+class Binning:
+    """Integer histogram bins defined by sorted lower edges.
+
+    Bin ``i`` covers ``[edges[i], edges[i + 1])`` and the last bin is
+    open-ended.  Negative values (malformed citation counts) are counted
+    as 0, so with the default buckets they fall in the first one; other
+    values below the first edge are not counted.  Binning a column is a
+    single ``searchsorted`` plus ``bincount``.
+    """
+
+    def __init__(self, edges: Sequence[int], labels: Optional[Sequence[str]] = None):
+        edges = np.asarray(edges, dtype=np.int64)
+        if edges.ndim != 1 or len(edges) == 0:
+            raise ValueError("Bin edges must be a non-empty sequence")
+        if np.any(np.diff(edges) <= 0):
+            raise ValueError("Bin edges must be strictly increasing")
+        if labels is not None and len(labels) != len(edges):
+            raise ValueError("Expected one label per bin")
+
+        self.edges = edges
+        self.labels = tuple(labels) if labels is not None else _edge_labels(edges)
+
+    @classmethod
+    def default(cls) -> "Binning":
+        """The six citation buckets reported by ``citation_data``."""
+        return cls(CITATION_EDGES, CITATION_RANGES)
+
+    @classmethod
+    def log(cls, max_value: int, per_decade: int = 1, base: float = 10.0) -> "Binning":
+        """Logarithmic bins covering ``0`` through ``max_value``.
+
+        ``0`` gets its own bin; above that edges grow by a factor of
+        ``base ** (1 / per_decade)``, rounded to distinct integers.
+        """
+        if per_decade < 1:
+            raise ValueError("per_decade must be at least 1")
+        max_value = max(int(max_value), 1)
+        steps = int(np.ceil(np.log(max_value + 1) / np.log(base) * per_decade)) + 1
+        edges = np.unique(np.floor(
+            base ** (np.arange(steps) / per_decade)).astype(np.int64))
+        return cls(np.concatenate(([0], edges[edges <= max_value])))
+
+    @classmethod
+    def quantile(cls, values: np.ndarray, n_bins: int = 10,
+                 weights: Optional[np.ndarray] = None) -> "Binning":
+        """Bins holding roughly equal numbers of ``values``.
+
+        ``weights`` gives the multiplicity of each value, so a histogram of
+        distinct values yields the same bins as the full column.  Repeated
+        quantiles (common with heavily skewed citation counts) are merged,
+        so fewer than ``n_bins`` bins may come back.
+        """
+        if n_bins < 1:
+            raise ValueError("n_bins must be at least 1")
+        values = np.asarray(values, dtype=np.int64)
+        if weights is None:
+            values, weights = np.unique(values, return_counts=True)
+        else:
+            order = np.argsort(values, kind='stable')
+            values, weights = values[order], np.asarray(weights)[order]
+        if len(values) == 0:
+            return cls([0])
+
+        # Edge i is the first value whose cumulative share exceeds
+        # i / n_bins (an inverted CDF lookup).
+        cumulative = np.cumsum(weights)
+        targets = cumulative[-1] * np.arange(n_bins) / n_bins
+        index = np.searchsorted(cumulative, targets, side='right')
+        return cls(np.unique(values[np.minimum(index, len(values) - 1)]))
+
+    @classmethod
+    def resolve(cls, spec: Union[None, str, Sequence[int], "Binning"],
+                values: Optional[np.ndarray] = None,
+                weights: Optional[np.ndarray] = None, **options: Any) -> "Binning":
+        """Turn a binning spec into a ``Binning``.
+
+        ``spec`` may be None (the default buckets), a ``Binning``, a
+        sequence of edges, ``"log"`` or ``"quantile"``; the last two are
+        fitted to ``values`` (optionally weighted by ``weights``).
+        """
+        if spec is None:
+            return cls.default()
+        if isinstance(spec, Binning):
+            return spec
+        if isinstance(spec, str):
+            values = np.asarray(values if values is not None else [], dtype=np.int64)
+            if spec == 'log':
+                return cls.log(values.max() if len(values) else 1, **options)
+            if spec == 'quantile':
+                return cls.quantile(values, weights=weights, **options)
+            raise ValueError(f"Unsupported binning: {spec}")
+        return cls(spec, options.get('labels'))
+
+    def counts(self, values: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """Count ``values`` (optionally weighted) per bin."""
+        index = np.searchsorted(self.edges, np.maximum(values, 0), side='right') - 1
+        valid = index >= 0
+        if weights is not None:
+            weights = np.asarray(weights)[valid]
+        counts = np.bincount(index[valid], weights=weights, minlength=len(self.edges))
+        return counts.astype(np.int64)
+
+    def histogram(self, values: np.ndarray, weights: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Return a label -> count dict for ``values``."""
+        return dict(zip(self.labels, self.counts(values, weights).tolist()))
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, Binning) and self.labels == other.labels
+                and np.array_equal(self.edges, other.edges))
+
+    def __repr__(self) -> str:
+        return f"Binning({self.edges.tolist()!r})"
+
+
+def _edge_labels(edges: np.ndarray) -> tuple:
+    """Label bins as ``lo-hi``, ``lo`` for one-value bins and ``lo+`` for the last."""
+    labels = []
+    for lo, hi in zip(edges[:-1].tolist(), (edges[1:] - 1).tolist()):
+        labels.append(str(lo) if lo == hi else f"{lo}-{hi}")
+    labels.append(f"{int(edges[-1])}+")
+    return tuple(labels)
@@ -0,0 +1,150 @@
+# scholar_analyzer/jsonl.py
+import gzip
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import serialization
+from .aggregation import PaperAggregator
+from .table import PaperTable
+
+JSONL_SUFFIXES = ('.jsonl', '.ndjson', '.jsonl.gz', '.ndjson.gz')
+
+# Bytes of input parsed per task: large enough to amortize the cost of
+# shipping a partial table back, small enough to keep every worker busy.
+DEFAULT_BLOCK_BYTES = 16 << 20
+
+Partial = Tuple[PaperTable, PaperAggregator]
+
+
+def is_jsonl(path: Union[str, Path]) -> bool:
+    """True for JSON Lines files (``.jsonl``/``.ndjson``, optionally gzipped)."""
+    return str(path).lower().endswith(JSONL_SUFFIXES)
+
+
+def block_ranges(path: Union[str, Path],
+                 block_bytes: int = DEFAULT_BLOCK_BYTES) -> List[Tuple[int, int]]:
+    """Split a file into ``(start, end)`` byte ranges that end on a newline.
+
+    Each range is about ``block_bytes`` long and holds whole lines only,
+    so ranges can be parsed independently.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + block_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_block(data: bytes) -> Partial:
+    """Parse whole JSON lines into a partial table and its aggregates.
+
+    Blank lines are skipped.  The lines are decoded with a single
+    ``loads`` call; a malformed line is located by decoding them
+    one at a time.
+    """
+    lines = [line for line in data.split(b'\n') if line.strip()]
+    try:
+        papers = serialization.loads(b'[' + b','.join(lines) + b']')
+    except json.JSONDecodeError:
+        papers = None
+    if papers is None or len(papers) != len(lines):
+        papers = []
+        for number, line in enumerate(lines, 1):
+            try:
+                papers.append(serialization.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in line {number} of a block: {e}") from e
+    table = PaperTable.from_papers(papers)
+    return table, PaperAggregator.from_table(table)
+
+
+def _parse_range(path: str, start: int, end: int) -> Partial:
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return parse_block(f.read(end - start))
+
+
+def _gzip_blocks(path: Union[str, Path], block_bytes: int) -> Iterator[bytes]:
+    """Decompress ``path`` into blocks of whole lines."""
+    with gzip.open(path, 'rb') as f:
+        rest = b''
+        while True:
+            chunk = f.read(block_bytes)
+            if not chunk:
+                break
+            cut = chunk.rfind(b'\n') + 1
+            if cut:
+                yield rest + chunk[:cut]
+                rest = chunk[cut:]
+            else:
+                rest += chunk
+        if rest:
+            yield rest
+
+
+def load_jsonl(path: Union[str, Path], workers: Optional[int] = None,
+               block_bytes: int = DEFAULT_BLOCK_BYTES) -> Partial:
+    """Read a JSON Lines corpus into a ``PaperTable`` and its aggregates.
+
+    The file is cut into blocks of whole lines, which ``workers``
+    processes (all cores by default) parse into partial tables and
+    aggregates; those are merged in file order, so rows come out as
+    in a sequential read.  Plain files are split by byte range and each
+    worker reads its own range; gzip input is decompressed here and
+    the blocks are handed out, at most two per worker in flight.
+    Files of a single block, or ``workers=1``, are parsed in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    compressed = str(path).lower().endswith('.gz')
+    if compressed:
+        blocks = _gzip_blocks(path, block_bytes)
+        tasks: Iterable[tuple] = ((block,) for block in blocks)
+        parse: Callable[..., Partial] = parse_block
+    else:
+        ranges = block_ranges(path, block_bytes)
+        tasks = ((str(path), start, end) for start, end in ranges)
+        parse = _parse_range
+        if len(ranges) <= 1:
+            workers = 1
+
+    if workers == 1:
+        return _merge(parse(*task) for task in tasks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _merge(_ordered_map(executor, parse, tasks, 2 * workers))
+
+
+def _ordered_map(executor: Executor, func: Callable[..., Partial],
+                 tasks: Iterable[tuple], window: int) -> Iterator[Partial]:
+    """``executor.map`` with at most ``window`` tasks submitted at a time.
+
+    ``Executor.map`` submits every task up front, which would hold all
+    of a decompressed file in memory.
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(executor.submit(func, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _merge(partials: Iterable[Partial]) -> Partial:
+    table, aggregator = None, PaperAggregator()
+    for part, counts in partials:
+        if table is None:
+            table = part
+        else:
+            table.extend(part)
+        aggregator.merge(counts)
+    return (table if table is not None else PaperTable.from_papers([])), aggregator
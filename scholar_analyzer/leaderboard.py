@@ -0,0 +1,62 @@
+# scholar_analyzer/leaderboard.py
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_LIMIT = 10
+
+OTHER = 'Other'
+
+
+def top_k(scores: np.ndarray, k: Optional[int] = None,
+          ties: Optional[np.ndarray] = None) -> np.ndarray:
+    """Indices of the ``k`` largest ``scores``, best first.
+
+    Equal scores are ordered by larger ``ties`` and then by lower index,
+    so the result does not depend on how the partition split them.  Only
+    the entries tied with or above the ``k``-th largest score are sorted;
+    ``k=None`` ranks everything.
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    if k is not None and k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k is None or k >= n:
+        candidates = np.arange(n)
+    else:
+        threshold = np.partition(scores, n - k)[n - k]
+        candidates = np.flatnonzero(scores >= threshold)
+    keys = [candidates]
+    if ties is not None:
+        keys.append(-np.asarray(ties)[candidates])
+    keys.append(-scores[candidates])
+    return candidates[np.lexsort(keys)][:k]
+
+
+def leaderboard(names: Sequence[str], scores: np.ndarray, k: int = DEFAULT_LIMIT,
+                metric: str = 'count', ties: Optional[np.ndarray] = None,
+                keep: Optional[np.ndarray] = None,
+                other: Optional[str] = OTHER) -> List[Dict[str, Any]]:
+    """The ``k`` best ``names`` by ``scores`` as ``{'name', metric}`` dicts.
+
+    ``keep`` is an optional boolean mask of the entries taking part.
+    Unless ``other`` is None, the remaining entries are summed into a
+    final ``{'name': other, metric, 'members', 'other': True}`` bucket,
+    which is left out when nothing remains.  Summing only makes sense
+    for additive metrics such as counts and citations.
+    """
+    scores = np.asarray(scores)
+    if keep is None:
+        ids = np.arange(len(scores))
+    else:
+        ids = np.flatnonzero(keep)
+        scores = scores[ids]
+        ties = np.asarray(ties)[ids] if ties is not None else None
+    best = top_k(scores, k, ties)
+    entries = [{'name': names[id_], metric: value}
+               for id_, value in zip(ids[best].tolist(), scores[best].tolist())]
+    rest = len(scores) - len(best)
+    if other is not None and rest > 0:
+        entries.append({'name': other, metric: (scores.sum() - scores[best].sum()).item(),
+                        'members': rest, 'other': True})
+    return entries
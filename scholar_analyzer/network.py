@@ -0,0 +1,188 @@
+# scholar_analyzer/network.py
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+# Upper bound on author pairs materialized at once while building edges.
+DEFAULT_CHUNK_PAIRS = 4_000_000
+
+COUNTING_MODES = ('full', 'fractional')
+
+
+class CollaborationGraph:
+    """Weighted co-authorship graph over integer author IDs.
+
+    Edges are accumulated into a sparse upper-triangular matrix
+    (``upper[i, j]`` for ``i < j``) whose weights are the number of shared
+    papers.  With ``counting='fractional'`` a paper with ``k`` authors
+    adds ``1 / (k - 1)`` per pair instead, so each author spreads a total
+    weight of one over their co-authors and hyper-authored papers do not
+    dominate.  Papers with more than ``max_authors`` authors contribute no
+    edges at all (they still count towards node paper counts).
+    """
+
+    def __init__(self, n_authors: int = 0, max_authors: Optional[int] = None,
+                 counting: str = 'full', chunk_pairs: int = DEFAULT_CHUNK_PAIRS):
+        if counting not in COUNTING_MODES:
+            raise ValueError(f"Unsupported counting mode: {counting}")
+        if max_authors is not None and max_authors < 2:
+            raise ValueError("max_authors must be at least 2")
+
+        self.max_authors = max_authors
+        self.counting = counting
+        self.chunk_pairs = chunk_pairs
+        self.dtype = np.float32 if counting == 'fractional' else np.int32
+        self._upper = sp.csr_matrix((n_authors, n_authors), dtype=self.dtype)
+        self._pending: List[sp.csr_matrix] = []
+        self._adjacency: Optional[sp.csr_matrix] = None
+        self.paper_counts = np.zeros(n_authors, dtype=np.int64)
+
+    @classmethod
+    def from_table(cls, table, **options: Any) -> "CollaborationGraph":
+        """Build the graph of every paper in a ``PaperTable``."""
+        graph = cls(len(table.authors), **options)
+        graph.update_table(table)
+        return graph
+
+    @property
+    def n_authors(self) -> int:
+        return len(self.paper_counts)
+
+    @property
+    def upper(self) -> sp.csr_matrix:
+        """Upper-triangular edge weights with pending updates folded in."""
+        if self._pending:
+            upper = _sum([self._upper] + self._pending, self.n_authors, self.dtype)
+            upper.eliminate_zeros()
+            self._upper = upper
+            self._pending = []
+            self._adjacency = None
+        return self._upper
+
+    @property
+    def adjacency(self) -> sp.csr_matrix:
+        """Symmetric weighted adjacency matrix."""
+        if self._adjacency is None or self._pending:
+            upper = self.upper
+            self._adjacency = (upper + upper.T).tocsr()
+        return self._adjacency
+
+    def update_table(self, table, rows: Optional[np.ndarray] = None,
+                     sign: int = 1) -> "CollaborationGraph":
+        """Add (or with ``sign=-1`` subtract) the papers at ``rows``.
+
+        The work is proportional to the author pairs of those papers.
+        Each chunk of pairs is summed into one delta as it is produced, so
+        memory stays bounded by the edges rather than the pairs; the delta
+        is merged into the matrix on next access.
+        """
+        n_authors = len(table.authors)
+        if n_authors > self.n_authors:
+            self.paper_counts = np.concatenate(
+                (self.paper_counts, np.zeros(n_authors - self.n_authors, dtype=np.int64)))
+
+        offsets = table.author_offsets
+        if rows is None:
+            rows = np.arange(len(table))
+        starts, ends = offsets[rows], offsets[rows + 1]
+
+        self.paper_counts += sign * _paper_counts(table.author_ids, starts, ends, n_authors)
+
+        # Partial sums of decreasing size: a new chunk is merged with every
+        # partial no larger than itself, so each edge is re-added only a
+        # logarithmic number of times.
+        partials: List[sp.csr_matrix] = []
+        for first, second, weights in self._pairs(table.author_ids, starts, ends - starts):
+            delta = sp.csr_matrix((sign * weights, (first, second)),
+                                  shape=(n_authors, n_authors))
+            while partials and partials[-1].nnz <= delta.nnz:
+                delta = partials.pop() + delta
+            partials.append(delta)
+        if partials:
+            self._pending.append(_sum(partials, n_authors, self.dtype))
+        return self
+
+    def _pairs(self, author_ids: np.ndarray, starts: np.ndarray,
+               counts: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yield ``(low, high, weight)`` edge arrays in bounded chunks.
+
+        Papers are grouped by author count ``k`` so that each group's
+        authors form a dense ``(papers, k)`` matrix and every pair comes
+        from one fancy-indexing operation.
+        """
+        for k in np.unique(counts).tolist():
+            if k < 2 or (self.max_authors is not None and k > self.max_authors):
+                continue
+            group = starts[counts == k]
+            left, right = np.triu_indices(k, 1)
+            weight = 1.0 / (k - 1) if self.counting == 'fractional' else 1
+            per_chunk = max(1, self.chunk_pairs // len(left))
+
+            for begin in range(0, len(group), per_chunk):
+                ids = author_ids[group[begin:begin + per_chunk, None] + np.arange(k)]
+                a, b = ids[:, left].ravel(), ids[:, right].ravel()
+                distinct = a != b
+                a, b = a[distinct], b[distinct]
+                yield (np.minimum(a, b), np.maximum(a, b),
+                       np.full(len(a), weight, dtype=self.dtype))
+
+    def edges(self) -> Iterator[Tuple[int, int, float]]:
+        """Iterate ``(low_id, high_id, weight)`` for every edge."""
+        upper = self.upper.tocoo()
+        return zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist())
+
+
+def _sum(matrices: List[sp.spmatrix], n: int, dtype) -> sp.csr_matrix:
+    """Sum of sparse matrices, grown to ``(n, n)``, in one COO to CSR pass."""
+    parts = [matrix.tocoo() for matrix in matrices]
+    return sp.csr_matrix(
+        (np.concatenate([part.data for part in parts]).astype(dtype, copy=False),
+         (np.concatenate([part.row for part in parts]),
+          np.concatenate([part.col for part in parts]))),
+        shape=(n, n))
+
+
+def _paper_counts(author_ids: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                  n_authors: int) -> np.ndarray:
+    """Number of distinct papers per author over the given CSR slices."""
+    lengths = ends - starts
+    paper = np.repeat(np.arange(len(starts)), lengths)
+    slots = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    ids = author_ids[np.repeat(starts, lengths) + slots].astype(np.int64)
+    # Drop repeated authors within one paper before counting.
+    unique = np.unique(paper * n_authors + ids) % n_authors if len(ids) else ids
+    return np.bincount(unique, minlength=n_authors)
+
+
+def node_sizes(values: np.ndarray, min_size: float = 10.0,
+               max_size: float = 40.0) -> np.ndarray:
+    """Map node weights to chart symbol sizes on a square-root scale."""
+    values = np.asarray(values, dtype=np.float64)
+    top = values.max() if len(values) else 0.0
+    if top <= 0:
+        return np.full(len(values), min_size)
+    return min_size + (max_size - min_size) * np.sqrt(values / top)
+
+
+def network_nodes(graph: CollaborationGraph, names: List[str],
+                  sizes: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+    """Chart nodes for every author with at least one paper."""
+    ids = np.flatnonzero(graph.paper_counts > 0)
+    counts = graph.paper_counts[ids]
+    sizes = node_sizes(counts) if sizes is None else np.asarray(sizes)[ids]
+    return [
+        {'name': names[id_], 'symbolSize': round(size, 2), 'value': count}
+        for id_, size, count in zip(ids.tolist(), sizes.tolist(), counts.tolist())
+    ]
+
+
+def network_links(graph: CollaborationGraph, names: List[str]) -> List[Dict[str, Any]]:
+    """Chart links with endpoints ordered by name."""
+    links = []
+    for first, second, weight in graph.edges():
+        source, target = names[first], names[second]
+        if target < source:
+            source, target = target, source
+        links.append({'source': source, 'target': target, 'value': weight})
+    return links
@@ -0,0 +1,162 @@
+# scholar_analyzer/reader.py
+import csv
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional, Union
+
+# Characters read from the input at a time.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = ' \t\n\r'
+
+
+class JsonCorpusReader:
+    """Incremental reader of a corpus document ``{"papers": [...], ...}``.
+
+    Iterating yields the records of the top-level ``papers`` array one at
+    a time while reading the input in ``chunk_size`` pieces, so memory
+    holds one chunk and one record rather than the whole document.  The
+    other top-level values (``metadata`` and the like) are decoded whole
+    into ``document`` as they are passed; values after ``papers`` are
+    only available once iteration has finished.  A top-level array is
+    read as the paper list itself.
+    """
+
+    def __init__(self, source: Union[str, Path, IO[str]],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.document: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._file: Optional[IO[str]] = None
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.document.get('metadata', {})
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if isinstance(self.source, (str, Path)):
+            with open(self.source, encoding='utf-8') as f:
+                yield from self._read(f)
+        else:
+            yield from self._read(self.source)
+
+    def _read(self, file: IO[str]) -> Iterator[Dict[str, Any]]:
+        self._file, self._buffer, self._pos, self._eof = file, '', 0, False
+        self.document = {}
+        opening = self._next_char()
+        if opening == '[':
+            yield from self._array()
+        elif opening == '{':
+            if self._peek() == '}':
+                self._pos += 1
+            else:
+                while True:
+                    key = self._value()
+                    if not isinstance(key, str) or self._next_char() != ':':
+                        self._fail("Expected an object key")
+                    if key == 'papers' and self._peek() == '[':
+                        self._pos += 1
+                        yield from self._array()
+                    else:
+                        self.document[key] = self._value()
+                    separator = self._next_char()
+                    if separator == '}':
+                        break
+                    if separator != ',':
+                        self._fail("Expected ',' or '}'")
+        else:
+            self._fail("Expected a JSON object or array")
+        if self._peek() is not None:
+            self._fail("Extra data after the document")
+
+    def _array(self) -> Iterator[Any]:
+        """Yield the elements of an array whose '[' was just consumed."""
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            separator = self._next_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                self._fail("Expected ',' or ']'")
+
+    def _value(self) -> Any:
+        """Decode the next value, reading more input until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def _peek(self) -> Optional[str]:
+        """Next non-whitespace character without consuming it (None at the end)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return None
+            self._fill()
+
+    def _next_char(self) -> Optional[str]:
+        char = self._peek()
+        if char is not None:
+            self._pos += 1
+        return char
+
+    def _fill(self) -> None:
+        """Drop the consumed input and append the next chunk."""
+        chunk = self._file.read(self.chunk_size)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        if not chunk:
+            self._eof = True
+
+    def _fail(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+
+def is_csv(path: Union[str, Path]) -> bool:
+    return str(path).lower().endswith('.csv')
+
+
+def read_csv(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield paper records from a CSV file with a header row.
+
+    Headers are matched case-insensitively, so the package's own CSV
+    exports read back.  ``authors`` is split on ``;`` when present and
+    on ``,`` otherwise; other columns become extra fields, empty cells
+    are left out.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        for row in reader:
+            paper: Dict[str, Any] = {}
+            for name, value in zip(header, row):
+                if not value:
+                    continue
+                if name == 'authors':
+                    separator = ';' if ';' in value else ','
+                    paper['authors'] = [author.strip() for author in value.split(separator)
+                                        if author.strip()]
+                else:
+                    paper[name] = value
+            yield paper
@@ -0,0 +1,116 @@
+# scholar_analyzer/serialization.py
+import io
+import json
+import os
+from typing import IO, Any, Optional, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# Every JSON file and response of the package goes through this module.
+# orjson is used when installed (``pip install scholar-analyzer[fast]``)
+# unless ``SCHOLAR_ANALYZER_JSON=json``; both backends write compact
+# UTF-8, encode NumPy arrays and scalars, write non-string keys such as
+# years as strings, and write NaN and infinities as ``null``.
+BACKENDS = ('orjson', 'json')
+
+_backend = 'json'
+
+
+def set_backend(name: str) -> None:
+    """Select the backend, ``'orjson'`` or ``'json'``."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name == 'orjson' and orjson is None:
+        raise ImportError("orjson is not installed")
+    _backend = name
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def dumpb(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON, compact unless ``indent`` is given."""
+    # orjson only indents by two spaces and only handles 64-bit integers;
+    # anything it cannot encode is retried by the standard library.
+    if _backend == 'orjson' and indent in (None, 2):
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_default, option=options)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, indent, sort_keys).encode('utf-8')
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """``dumpb`` as a string."""
+    if _backend == 'json':
+        return _stdlib_dumps(obj, indent, sort_keys)
+    return dumpb(obj, indent, sort_keys).decode('utf-8')
+
+
+def dump(obj: Any, fp: IO, indent: Optional[int] = None, sort_keys: bool = False) -> None:
+    """Write ``obj`` to a binary or text file."""
+    if isinstance(fp, io.TextIOBase):
+        fp.write(dumps(obj, indent, sort_keys))
+    else:
+        fp.write(dumpb(obj, indent, sort_keys))
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode a JSON document; errors are ``json.JSONDecodeError``."""
+    if _backend == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Decode the JSON document in a binary or text file."""
+    return loads(fp.read())
+
+
+def _stdlib_dumps(obj: Any, indent: Optional[int], sort_keys: bool) -> str:
+    options = dict(indent=indent, sort_keys=sort_keys, ensure_ascii=False,
+                   separators=(',', ':') if indent is None else None,
+                   default=_default, allow_nan=False)
+    try:
+        return json.dumps(obj, **options)
+    except ValueError:
+        # Only non-finite floats are rejected; replace them and retry.
+        return json.dumps(_finite(obj), **options)
+
+
+def _finite(obj: Any) -> Any:
+    """``obj`` with NaN and infinite floats replaced by ``None``, as orjson writes them."""
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return _finite(obj.tolist())
+    if isinstance(obj, float) and not np.isfinite(obj):
+        return None
+    return obj
+
+
+def _default(obj: Any) -> Any:
+    """NumPy values the backend does not encode itself."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None and os.environ.get('SCHOLAR_ANALYZER_JSON', 'orjson') != 'json':
+    _backend = 'orjson'
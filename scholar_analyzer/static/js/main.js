@@ -120,6 +120,11 @@ function initFilters() {
 
 // Results Update
 function updateResults(data) {
+    // Follow-up lookups (author suggestions) name this analysis by id
+    if (data.analysis_id) {
+        document.body.dataset.analysisId = data.analysis_id
+    }
+
     // Update papers list
     const papersList = document.querySelector('.papers-list')
     if (papersList && data.papers) {
@@ -4,6 +4,10 @@ class ScholarAnalytics {
         this.rawData = data
         this.processedData = null
         this.metrics = null
+        // Per-author metrics from /api/authors; null until loaded
+        this.authorMetrics = null
+        // Top terms, co-occurrence and trends from /api/topics; null until loaded
+        this.topics = null
     }
 
     // Initialize and process data
@@ -11,6 +15,7 @@ class ScholarAnalytics {
         try {
             this.processedData = await this.processRawData()
             this.metrics = this.calculateMetrics()
+            await Promise.all([this.loadAuthorMetrics(), this.loadTopics()])
             return true
         } catch (error) {
             console.error('Failed to initialize analytics:', error)
@@ -40,6 +45,48 @@ class ScholarAnalytics {
         }
     }
 
+    // Fetch h-index, g-index and i10 for every author from the server.
+    // On failure the statistics module computes h-indexes itself.
+    async loadAuthorMetrics() {
+        try {
+            const response = await fetch('/api/authors', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ papers: this.rawData })
+            })
+            if (response.ok) {
+                this.authorMetrics = (await response.json()).authors
+            } else {
+                console.error('Failed to load author metrics:', await response.text())
+            }
+        } catch (error) {
+            console.error('Failed to load author metrics:', error)
+        }
+    }
+
+    // Fetch the server-side topic summary; without it the statistics
+    // module counts title words itself.
+    async loadTopics() {
+        try {
+            const response = await fetch('/api/topics', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ papers: this.rawData })
+            })
+            if (response.ok) {
+                this.topics = await response.json()
+            } else {
+                console.error('Failed to load topics:', await response.text())
+            }
+        } catch (error) {
+            console.error('Failed to load topics:', error)
+        }
+    }
+
     // Individual processing methods
     processPapers() {
         return this.rawData.map((paper) => ({
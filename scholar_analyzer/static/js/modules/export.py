@@ -1,5 +1,4 @@
 # scholar_analyzer/static/js/modules/export.py
-import json
 import csv
 import gzip
 import os
@@ -8,14 +7,46 @@ from datetime import datetime
 from jinja2 import Template
 from jsonschema import validate
 
+from scholar_analyzer import serialization
+from scholar_analyzer.filter_index import FilterIndex, FilterPlan
+from scholar_analyzer.table import PaperTable
+
 
 class ScholarExport:
     """Export functionality for Scholar Analyzer."""
 
     def __init__(self, data):
         self.data = data
+        self.table = None
+        self._filter_index = None
         self.supported_formats = ['csv', 'bibtex', 'json', 'md']
 
+    @classmethod
+    def from_table(cls, table, metadata=None):
+        """Create an exporter that reads papers from a ``PaperTable``."""
+        exporter = cls({'metadata': metadata or {}})
+        exporter.table = table
+        return exporter
+
+    @property
+    def papers(self):
+        """Paper records, rebuilt from the table when one is attached."""
+        if self.table is not None:
+            return self.table.to_records()
+        return self.data.get('papers', [])
+
+    def _iter_papers(self, rows=None):
+        """Iterate paper records, optionally only ``rows``, without materializing them."""
+        if self.table is not None:
+            return self.table.iter_records(rows)
+        papers = self.data.get('papers', [])
+        return iter(papers) if rows is None else (papers[row] for row in rows.tolist())
+
+    def _has_papers(self):
+        if self.table is not None:
+            return len(self.table) > 0
+        return bool(self.data.get('papers'))
+
     def export(self, output_file, format="json"):
         """Generic export method."""
         if format.lower() not in self.supported_formats:
@@ -36,7 +67,7 @@ class ScholarExport:
 
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                for paper in self.data.get('papers', []):
+                for paper in self._iter_papers():
                     f.write(self._paper_to_bibtex(paper))
                     f.write('\n\n')
             return True
@@ -48,15 +79,16 @@ class ScholarExport:
   incremental=False, progress_callback=None):
         """Export data to JSON format."""
         output_file = Path(output_file)
+        papers = self.papers
         export_data = {
             'metadata': {
                 **self.data.get('metadata', {}),
                 'exportDate': datetime.now().isoformat()
             },
-            'papers': self.data.get('papers', []),
+            'papers': papers,
             'analysis': {
-                'totalPapers': len(self.data.get('papers', [])),
-                'averageCitations': sum(p.get('citations', 0) for p in self.data.get('papers', [])) / len(self.data.get('papers', [])) if self.data.get('papers') else 0
+                'totalPapers': len(papers),
+                'averageCitations': sum(p.get('citations', 0) for p in papers) / len(papers) if papers else 0
             }
         }
 
@@ -67,15 +99,15 @@ class ScholarExport:
             if compress:
                 # 先创建一个普通的JSON文件作为比较基准
                 regular_file = output_file.parent / "export.json"
-                with open(regular_file, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=indent, sort_keys=sort_keys)
+                with open(regular_file, 'wb') as f:
+                    serialization.dump(export_data, f, indent=indent, sort_keys=sort_keys)
 
                 # 然后创建压缩文件
-                with gzip.open(output_file, 'wt', encoding='utf-8') as f:
+                with gzip.open(output_file, 'wb') as f:
                     if progress_callback:
                         progress_callback(0, 1, "Starting export...")
-                    json.dump(export_data, f, indent=None,
-                             sort_keys=sort_keys)  # 压缩时不使用缩进
+                    serialization.dump(export_data, f, indent=None,
+                                       sort_keys=sort_keys)  # 压缩时不使用缩进
                     if progress_callback:
                         progress_callback(1, 1, "Complete")
 
@@ -84,10 +116,10 @@ class ScholarExport:
                     raise IOError("Compression failed to reduce file size")
 
             else:
-                with open(output_file, 'w', encoding='utf-8') as f:
+                with open(output_file, 'wb') as f:
                     if progress_callback:
                         progress_callback(0, 1, "Starting export...")
-                    json.dump(export_data, f, indent=indent, sort_keys=sort_keys)
+                    serialization.dump(export_data, f, indent=indent, sort_keys=sort_keys)
                     if progress_callback:
                         progress_callback(1, 1, "Complete")
 
@@ -99,11 +131,10 @@ class ScholarExport:
         output_file = Path(output_file)
         output_file.parent.mkdir(parents=True, exist_ok=True)  # 确保目录存在
 
-        if not self.data.get('papers'):  # 添加数据验证
+        if not self._has_papers():  # 添加数据验证
             raise ValueError("No valid papers data found for export")
 
-        filtered_data = self._apply_filters(
-            self.data, filters) if filters else self.data
+        papers = self._iter_papers(self._filter_rows(filters) if filters else None)
 
         try:
             with open(output_file, 'w', newline='', encoding=encoding) as f:
@@ -116,7 +147,7 @@ class ScholarExport:
                     quoting=csv.QUOTE_ALL
                 )
                 writer.writeheader()
-                for paper in filtered_data.get('papers', []):
+                for paper in papers:
                     writer.writerow({
                         'Title': paper.get('title', ''),
                         'Authors': ', '.join(paper.get('authors', [])),
@@ -145,7 +176,7 @@ class ScholarExport:
     def exportWithTemplate(self, output_file, template, pre_export_hook=None, post_export_hook=None):
         """Export data using custom template."""
         output_file = Path(output_file)
-        data = self.data.copy()
+        data = {**self.data, 'papers': self.papers}
 
         if pre_export_hook:
             data = pre_export_hook(data)
@@ -195,24 +226,20 @@ class ScholarExport:
         except Exception as e:
             raise IOError(f"Failed to batch export: {str(e)}")
 
-    def _apply_filters(self, data, filters):
-        """Apply filters to data before export."""
-        if not filters:
-            return data
-
-        filtered_papers = data.get('papers', []).copy()
-
-        if 'year' in filters:
-            filtered_papers = [p for p in filtered_papers
-                               if filters['year']['start'] <= p.get('year', 0) <= filters['year']['end']]
-        if 'citations' in filters:
-            filtered_papers = [p for p in filtered_papers
-                               if p.get('citations', 0) >= filters['citations']['min']]
-        if 'venues' in filters:
-            filtered_papers = [p for p in filtered_papers
-                               if p.get('venue') in filters['venues']]
-
-        return {'papers': filtered_papers, 'metadata': data.get('metadata', {})}
+    def _filter_rows(self, filters):
+        """Rows matching ``filters``, planned over indexes of the papers.
+
+        ``filters`` is a ``FilterPlan`` configuration (``year``,
+        ``citations``, ``venues``, ...).  Without an attached table the
+        indexes are built over a table of the input papers, and the rows
+        index the input list.
+        """
+        if self._filter_index is None:
+            table = self.table
+            if table is None:
+                table = PaperTable.from_papers(self.data.get('papers', []))
+            self._filter_index = FilterIndex(table)
+        return FilterPlan.from_config(self._filter_index, filters).rows()
 
     def _paper_to_bibtex(self, paper):
         """Convert paper data to BibTeX format."""
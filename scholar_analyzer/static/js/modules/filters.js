@@ -135,9 +135,25 @@ class ScholarFilters {
         if (min < 0) minInput.value = 0;
     }
 
-    updateAuthorSuggestions(query) {
+    async updateAuthorSuggestions(query) {
         if (!query) return;
 
+        // Ranked prefix lookup on the server, over the analysis this page
+        // received from /api/analyze
+        const analysisId = document.body.dataset.analysisId;
+        try {
+            const response = analysisId && await fetch(
+                `/api/filters/authors?analysis=${encodeURIComponent(analysisId)}` +
+                `&q=${encodeURIComponent(query)}&limit=5`);
+            if (response && response.ok) {
+                const { suggestions } = await response.json();
+                this.showAuthorSuggestions(suggestions.map(s => s.name));
+                return;
+            }
+        } catch (error) {
+            console.warn('Author suggestions unavailable, searching locally:', error);
+        }
+
         const authors = new Set();
         this.analytics.processedData.papers.forEach(paper => {
             paper.authors.forEach(author => {
@@ -0,0 +1,157 @@
+# scholar_analyzer/static/js/modules/filters.py
+import numpy as np
+
+from scholar_analyzer.filter_index import FilterIndex, FilterPlan, intersect, validate_filter
+from scholar_analyzer.table import PaperTable
+
+
+class ScholarFilters:
+    """Paper filtering for Scholar Analyzer, backed by a ``FilterIndex``.
+
+    Every ``filterBy*`` call returns a new ``ScholarFilters`` narrowed to
+    the matching papers, so filters chain; the selection is a sorted
+    array of table rows (``getPaperIds``) and records are only rebuilt
+    when the result is iterated or ``getResults`` is called.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.table = None
+        self.rows = None  # None selects every paper
+        self.activeFilters = {}
+        self._index = None
+
+    @classmethod
+    def from_table(cls, table, metadata=None):
+        """Create filters over an already built ``PaperTable``."""
+        filters = cls({'metadata': metadata or {}})
+        filters.table = table
+        return filters
+
+    @property
+    def index(self):
+        """Secondary indexes over the papers, built on first use."""
+        if self._index is None:
+            if self.table is None:
+                self.table = PaperTable.from_papers(self.data.get('papers', []))
+            self._index = FilterIndex(self.table)
+        return self._index
+
+    def __iter__(self):
+        return self.index.table.iter_records(self.getPaperIds())
+
+    def __len__(self):
+        return len(self.getPaperIds())
+
+    def getPaperIds(self):
+        """Sorted table rows of the selected papers."""
+        if self.rows is None:
+            return np.arange(len(self.index.table), dtype=np.int64)
+        return self.rows
+
+    def getResults(self):
+        """Selected papers as a list of records."""
+        return list(self)
+
+    def filterByYearRange(self, start_year, end_year):
+        """Papers published between ``start_year`` and ``end_year`` inclusive."""
+        start_year, end_year = validate_filter(
+            'year_range', {'start': start_year, 'end': end_year})
+        return self._narrow(self.index.year_range(start_year, end_year))
+
+    def filterByCitations(self, min_citations=0, max_citations=None):
+        """Papers with between ``min_citations`` and ``max_citations`` citations."""
+        min_citations, max_citations = validate_filter(
+            'citations', {'min': min_citations, 'max': max_citations})
+        return self._narrow(self.index.citation_range(min_citations, max_citations))
+
+    def filterByAuthor(self, author_name):
+        """Papers with an author whose name contains ``author_name``, ignoring case."""
+        return self._narrow(self.index.author_substring(
+            validate_filter('author', author_name)))
+
+    def filterByAuthors(self, authors, match_all=False):
+        """Papers by any (or, with ``match_all``, all) of the exact ``authors``."""
+        return self._narrow(self.index.authors(validate_filter('authors', authors), match_all))
+
+    def filterByVenue(self, venue):
+        """Papers published in ``venue``."""
+        if not isinstance(venue, str):
+            raise TypeError("Venue must be a string")
+        return self._narrow(self.index.venues(validate_filter('venues', venue)))
+
+    def filterByVenuePattern(self, pattern):
+        """Papers whose venue matches the regular expression ``pattern``."""
+        return self._narrow(self.index.venue_pattern(
+            validate_filter('venue_pattern', pattern)))
+
+    def filterByKeyword(self, keyword):
+        """Papers whose title or abstract contains ``keyword``, ignoring case."""
+        if not isinstance(keyword, str):
+            raise TypeError("Keyword must be a string")
+        return self._narrow(self.index.keyword(validate_filter('keywords', keyword)[0]))
+
+    def applyFilters(self, filter_config=None):
+        """Apply a filter configuration (the active filters by default).
+
+        Keys are ``year_range`` (``start``/``end``), ``citations``
+        (``min``/``max``), ``venues``, ``authors`` and ``keywords`` (any
+        match), ``author`` (name substring) and ``venue_pattern``; see
+        ``FilterPlan`` for how they are combined.
+        """
+        if filter_config is None:
+            filter_config = self.activeFilters
+        return self._narrow(FilterPlan.from_config(self.index, filter_config).rows()
+                            if filter_config else None)
+
+    def applyCustomFilter(self, predicate):
+        """Papers for which ``predicate(paper)`` is true (a linear scan)."""
+        rows = self.getPaperIds()
+        keep = [predicate(paper) for paper in self]
+        return self._narrow(rows[np.asarray(keep, dtype=bool)] if keep else rows)
+
+    def addFilter(self, filter_type, value):
+        """Validate and store a filter for a later ``applyFilters()``."""
+        validate_filter(filter_type, value)
+        self.activeFilters[filter_type] = value
+        return self
+
+    def removeFilter(self, filter_type):
+        self.activeFilters.pop(filter_type, None)
+        return self
+
+    def clearFilters(self):
+        self.activeFilters.clear()
+        return self
+
+    def hasActiveFilters(self):
+        return bool(self.activeFilters)
+
+    def getAuthorSuggestions(self, text, limit=10):
+        """Authors whose name contains ``text``, most prolific first."""
+        return self._suggestions('authors', self.index.matching_authors(text), limit)
+
+    def getVenueSuggestions(self, text, limit=10):
+        """Venues whose name contains ``text``, largest first."""
+        return self._suggestions('venues', self.index.matching_venues(text), limit)
+
+    def _suggestions(self, field, ids, limit):
+        if not ids:
+            return []
+        counts = self.index.posting_sizes(field, ids)
+        order = np.argsort(-counts, kind='stable')[:limit]
+        names = getattr(self.index.table, field).values
+        return [{'name': names[ids[i]], 'count': int(counts[i])} for i in order.tolist()]
+
+    def _narrow(self, rows):
+        """A filters instance selecting ``rows`` within the current selection."""
+        narrowed = type(self)(self.data)
+        narrowed.table = self.index.table
+        narrowed._index = self._index
+        if self.rows is None:
+            narrowed.rows = rows
+        elif rows is None:
+            narrowed.rows = self.rows
+        else:
+            narrowed.rows = intersect(self.rows, rows)
+        return narrowed
@@ -175,6 +175,10 @@ class ScholarStatistics {
         // Calculate impact metrics
         const venueImpact = new Map()
         const authorImpact = new Map()
+        // Per-author metrics served by /api/authors, when loaded
+        const serverMetrics = new Map(
+            (this.analytics.authorMetrics || []).map((metrics) => [metrics.author, metrics])
+        )
 
         papers.forEach((paper) => {
             // Venue impact
@@ -196,12 +200,14 @@ class ScholarStatistics {
                     authorImpact.set(author, {
                         papers: 0,
                         citations: 0,
+                        citationList: [],
                         venues: new Set()
                     })
                 }
                 const impact = authorImpact.get(author)
                 impact.papers++
                 impact.citations += paper.citations
+                impact.citationList.push(paper.citations)
                 impact.venues.add(paper.venue)
             })
         })
@@ -224,7 +230,9 @@ class ScholarStatistics {
                         author,
                         papers: stats.papers,
                         citations: stats.citations,
-                        hIndex: this.calculateAuthorHIndex(papers.filter((p) => p.authors.includes(author))),
+                        hIndex: serverMetrics.has(author)
+                            ? serverMetrics.get(author).h_index
+                            : this.calculateHIndex(stats.citationList),
                         venueCount: stats.venues.size
                     }))
                     .sort((a, b) => b.citations - a.citations)
@@ -233,6 +241,22 @@ class ScholarStatistics {
     }
 
     analyzeResearchTopics(papers) {
+        // Prefer the server-side topic index served by /api/topics
+        const topics = this.analytics.topics
+        if (topics) {
+            return {
+                topWords: topics.top_terms.map((term) => ({
+                    word: term.term,
+                    frequency: term.frequency,
+                    papers: term.papers,
+                    citations: term.citations,
+                    averageImpact: term.impact
+                })),
+                wordConnections: topics.cooccurrence,
+                temporalTrends: topics.trends
+            }
+        }
+
         // Simple topic analysis based on title words
         const wordFrequency = new Map()
         const stopWords = new Set(['a', 'an', 'the', 'in', 'on', 'at', 'to', 'for', 'of', 'and'])
@@ -0,0 +1,1053 @@
+# scholar_analyzer/static/js/modules/statistics.py
+import numpy as np
+from scipy import stats as sps
+
+from scholar_analyzer.histogram import Binning
+from scholar_analyzer.table import PaperTable
+from scholar_analyzer.time_windows import WINDOW_METRICS, TimeWindowIndex
+
+
+class ScholarStatistics:
+    """Statistical analysis for Scholar Analyzer.
+
+    Paper fields are turned into NumPy columns once per dataset (through a
+    ``PaperTable``) and every statistic is computed over whole columns.
+    Sorted copies of the columns are cached as well, so medians,
+    percentiles, modes and unique counts cost O(1) or O(n) after the first
+    sort instead of a sort per call.
+    """
+
+    # Default percentiles reported by analyzeDistribution
+    PERCENTILES = (5, 10, 25, 50, 75, 90, 95, 99)
+
+    def __init__(self, data):
+        self.data = data
+        self.table = None
+        self._columns = None
+        self._sorted = {}
+        self._partitions = {}
+        self._time_windows = {}
+
+    @classmethod
+    def from_table(cls, table, metadata=None):
+        """Create statistics over an already built ``PaperTable``."""
+        statistics = cls({'metadata': metadata or {}})
+        statistics.table = table
+        return statistics
+
+    @property
+    def columns(self):
+        """Numeric paper columns; missing years are NaN."""
+        if self._columns is None:
+            if self.table is None:
+                self.table = PaperTable.from_papers(self.data.get('papers', []))
+            table = self.table
+            years = table.years.astype(np.float64)
+            years[table.years == 0] = np.nan
+            # Venue features: how many papers the paper's venue has and
+            # their mean citations (0 for papers without a venue).
+            venue_size = np.bincount(table.venue_ids, minlength=len(table.venues))
+            venue_citations = np.bincount(table.venue_ids, weights=table.citations,
+                                          minlength=len(table.venues))
+            venue_mean = np.divide(venue_citations, venue_size,
+                                   out=np.zeros(len(venue_size)), where=venue_size > 0)
+            venue_size[0] = 0
+            venue_mean[0] = 0
+            # Citations per year since publication, counting up to the
+            # latest year in the dataset (inclusive).
+            latest = np.nanmax(years) if np.isfinite(years).any() else np.nan
+            self._columns = {
+                'citations': table.citations.astype(np.float64),
+                'year': years,
+                'author_count': table.author_counts.astype(np.float64),
+                'citations_per_year': table.citations / (latest - years + 1),
+                'venue_size': venue_size[table.venue_ids].astype(np.float64),
+                'venue_citations': venue_mean[table.venue_ids],
+            }
+        return self._columns
+
+    def column(self, variable):
+        """Column for ``variable`` with missing values dropped."""
+        try:
+            values = self.columns[variable]
+        except KeyError:
+            raise ValueError(f"Unknown variable: {variable}") from None
+        return values[~np.isnan(values)]
+
+    def sorted_column(self, variable):
+        """Sorted non-missing values of ``variable``, computed once."""
+        if variable not in self._sorted:
+            self._sorted[variable] = np.sort(self.column(variable))
+        return self._sorted[variable]
+
+    def _values(self, data, variable):
+        """Sorted values of explicit ``data`` or of a dataset column."""
+        if data is None:
+            return self.sorted_column(variable)
+        return np.sort(np.asarray(data, dtype=np.float64))
+
+    def calculateBasicStats(self, data=None, variable='citations'):
+        """Calculate central tendency and dispersion of a variable.
+
+        ``data`` overrides the dataset column with explicit values.
+        """
+        values = self._values(data, variable)
+        if len(values) == 0:
+            raise ValueError("Cannot compute statistics of empty data")
+
+        mean = values.mean()
+        variance = values.var()
+        return {
+            'count': len(values),
+            'mean': float(mean),
+            'median': float(_quantiles(values, 0.5)),
+            'mode': float(_mode(values)),
+            'variance': float(variance),
+            'std_dev': float(np.sqrt(variance)),
+            'min': float(values[0]),
+            'max': float(values[-1]),
+        }
+
+    def analyzeDistribution(self, variable='citations', bins=10, percentiles=None):
+        """Histogram, percentiles and shape of a variable's distribution."""
+        values = self._values(None, variable)
+        if len(values) == 0:
+            raise ValueError("Cannot analyze the distribution of empty data")
+
+        percentiles = self.PERCENTILES if percentiles is None else percentiles
+        counts, edges = np.histogram(values, bins=bins)
+        points = _quantiles(values, np.asarray(percentiles, dtype=np.float64) / 100)
+        skewness, kurtosis = _shape(values)
+        return {
+            'histogram': {'bins': edges.tolist(), 'counts': counts.tolist()},
+            'percentiles': {f"p{p:g}": float(v) for p, v in zip(percentiles, points)},
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+        }
+
+    def calculateCorrelations(self, variables=None, method='pearson'):
+        """Pairwise correlation matrix as nested dicts.
+
+        Rows with a missing value in any of ``variables`` are dropped.
+        Correlations involving a constant column are undefined and
+        reported as 0.  ``method`` is ``'pearson'`` or ``'spearman'``.
+        """
+        variables = list(variables or self.columns)
+        matrix = np.column_stack([self.columns[name] if name in self.columns
+                                  else self.column(name) for name in variables])
+        matrix = matrix[~np.isnan(matrix).any(axis=1)]
+
+        if method == 'spearman':
+            matrix = np.column_stack([sps.rankdata(col) for col in matrix.T])
+        elif method != 'pearson':
+            raise ValueError(f"Unsupported correlation method: {method}")
+
+        correlations = _correlation_matrix(matrix)
+        return {
+            first: {second: float(correlations[i, j]) for j, second in enumerate(variables)}
+            for i, first in enumerate(variables)
+        }
+
+    def generateSummary(self, variables=None):
+        """Describe each variable: counts, moments, range and quartiles."""
+        summary = {}
+        for variable in variables or self.columns:
+            values = self.sorted_column(variable)
+            total = len(self.columns[variable])
+            if len(values) == 0:
+                summary[variable] = {'count': 0, 'missing': total, 'unique': 0,
+                                     'mean': None, 'std': None, 'min': None,
+                                     'max': None, 'quartiles': [None] * 3}
+                continue
+            summary[variable] = {
+                'count': len(values),
+                'missing': total - len(values),
+                'unique': int(np.count_nonzero(np.diff(values)) + 1),
+                'mean': float(values.mean()),
+                'std': float(values.std()),
+                'min': float(values[0]),
+                'max': float(values[-1]),
+                'quartiles': _quantiles(values, np.array([0.25, 0.5, 0.75])).tolist(),
+            }
+        return summary
+
+    def calculateMetric(self, metric, values):
+        """Single metric of a value sequence.
+
+        ``correlation``, ``p_value`` and ``r_squared`` describe the linear
+        trend of ``values`` over their positions.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            raise ValueError("Cannot compute a metric of empty data")
+        if metric == 'mean':
+            return float(values.mean())
+        if metric in ('correlation', 'p_value', 'r_squared'):
+            fit = _linear_trend(np.arange(len(values), dtype=np.float64), values)
+            return fit[metric]
+        raise ValueError(f"Unsupported metric: {metric}")
+
+    def analyzeTimeSeries(self, variable='paper_count', horizon=3):
+        """Yearly series of a variable with its trend, seasonality and forecast.
+
+        ``variable`` is ``'paper_count'`` or a column summed per year.
+        """
+        years, series = self._yearly_series(variable)
+        if len(years) < 2:
+            raise ValueError("Time series analysis needs at least two years")
+
+        trend = _linear_trend(years, series)
+        future = np.arange(years[-1] + 1, years[-1] + 1 + horizon)
+        return {
+            'years': years.astype(int).tolist(),
+            'values': series.tolist(),
+            'trend': trend,
+            'seasonality': _seasonality(series - (trend['intercept'] + trend['slope'] * years)),
+            'forecast': {
+                int(year): float(trend['intercept'] + trend['slope'] * year)
+                for year in future
+            },
+        }
+
+    def analyzeTrends(self, variable='citations', min_periods=3, alpha=0.05):
+        """Direction, change points and growth of a variable's yearly totals."""
+        years, series = self._yearly_series(variable)
+        if len(years) < max(min_periods, 2):
+            return {'overall_trend': 'stable', 'change_points': [],
+                    'seasonality': _seasonality(series), 'growth_rate': 0.0}
+
+        trend = _linear_trend(years, series)
+        if trend['p_value'] < alpha and trend['slope'] != 0:
+            direction = 'increasing' if trend['slope'] > 0 else 'decreasing'
+        else:
+            direction = 'stable'
+
+        # Change points: year-over-year moves more than two standard
+        # deviations away from the typical move.
+        steps = np.diff(series)
+        spread = steps.std()
+        jumps = np.flatnonzero(np.abs(steps - steps.mean()) > 2 * spread) if spread else []
+
+        positive = np.flatnonzero(series > 0)
+        growth = 0.0
+        if len(positive) >= 2:
+            first, last = positive[0], positive[-1]
+            span = years[last] - years[first]
+            growth = float((series[last] / series[first]) ** (1 / span) - 1)
+
+        return {
+            'overall_trend': direction,
+            'change_points': [int(years[i + 1]) for i in jumps],
+            'seasonality': _seasonality(series - (trend['intercept'] + trend['slope'] * years)),
+            'growth_rate': growth,
+        }
+
+    def analyzeTimeWindows(self, window_size=1, metrics=WINDOW_METRICS, step=1,
+                           granularity='year'):
+        """Rolling metrics over windows of ``window_size`` periods.
+
+        Keyed by window label (``'2020-2021'``); each window has its
+        ``start_year``, ``end_year`` and the requested ``metrics``, as
+        described in ``TimeWindowIndex.windows``.  The prefix sums behind them are
+        built once per granularity, so further window sizes and steps
+        cost O(periods).
+        """
+        index = self._time_windows.get(granularity)
+        if index is None:
+            self.columns  # builds the table for dict input
+            index = self._time_windows[granularity] = TimeWindowIndex.from_table(
+                self.table, granularity)
+        return {window['label']: window
+                for window in index.windows(window_size, step, metrics)}
+
+    def performBootstrap(self, data, statistic='mean', n_iterations=1000,
+                         confidence_level=0.95, seed=None):
+        """Bootstrap estimate, standard error and percentile interval.
+
+        Resamples are drawn as index matrices in chunks of bounded size,
+        and the statistic is applied along each row at once.
+        """
+        values = np.asarray(data, dtype=np.float64)
+        if len(values) < 2:
+            raise ValueError("Bootstrap needs at least two values")
+        reducers = {'mean': np.mean, 'median': np.median, 'std': np.std}
+        if statistic not in reducers:
+            raise ValueError(f"Unsupported statistic: {statistic}")
+        reduce = reducers[statistic]
+
+        rng = np.random.default_rng(seed)
+        chunk = max(1, 10_000_000 // len(values))
+        estimates = np.concatenate([
+            reduce(values[rng.integers(0, len(values), (min(chunk, n_iterations - start),
+                                                        len(values)))], axis=1)
+            for start in range(0, n_iterations, chunk)
+        ])
+        tail = (1 - confidence_level) / 2 * 100
+        low, high = np.percentile(estimates, [tail, 100 - tail])
+        return {
+            'estimate': float(reduce(values)),
+            'confidence_interval': [float(low), float(high)],
+            'standard_error': float(estimates.std(ddof=1)),
+        }
+
+    def performRegression(self, x_var, y_var, regression_type='linear', degree=1):
+        """Least-squares regression of one column on another.
+
+        ``regression_type`` is ``'linear'`` or ``'polynomial'`` (of
+        ``degree``).  ``coefficients[i]`` multiplies ``x ** i``; p-values are
+        two-sided t-tests of each coefficient being zero.  ``predictions``
+        holds the fitted value at each distinct ``x``.
+        """
+        x, y = self._paired(x_var, y_var)
+        model = _fit_polynomial(x, y, _regression_degree(regression_type, degree))
+        grid = np.unique(x)
+        return {
+            'coefficients': model['coefficients'].tolist(),
+            'standard_errors': _optional_floats(model['standard_errors']),
+            'p_values': _optional_floats(model['p_values']),
+            'r_squared': model['r_squared'],
+            'adjusted_r_squared': model['adjusted_r_squared'],
+            'predictions': [
+                {'x': float(value), 'y': float(fitted)}
+                for value, fitted in zip(grid, _evaluate(model['coefficients'], grid))
+            ],
+        }
+
+    def performCrossValidation(self, model_type='regression', x_var='year',
+                               y_var='citations', folds=5, regression_type='linear',
+                               degree=1, seed=None):
+        """K-fold cross-validated R^2 of a regression model.
+
+        ``folds`` is capped at the number of papers (leave-one-out).
+        """
+        if model_type != 'regression':
+            raise ValueError(f"Unsupported model type: {model_type}")
+        x, y = self._paired(x_var, y_var)
+        if folds < 2 or len(x) < 2:
+            raise ValueError("Cross-validation needs at least 2 folds and 2 papers")
+        folds = min(folds, len(x))
+        degree = _regression_degree(regression_type, degree)
+
+        fold_of = np.random.default_rng(seed).permutation(len(x)) % folds
+        scores = []
+        for fold in range(folds):
+            test = fold_of == fold
+            coefficients = _fit_polynomial(x[~test], y[~test], degree)['coefficients']
+            residual = y[test] - _evaluate(coefficients, x[test])
+            total = np.sum((y[test] - y[test].mean()) ** 2)
+            scores.append(float(1 - residual @ residual / total) if total else 0.0)
+
+        scores = np.array(scores)
+        return {
+            'scores': scores.tolist(),
+            'mean_score': float(scores.mean()),
+            'std_score': float(scores.std()),
+        }
+
+    def performClustering(self, features=None, n_clusters=3, method='kmeans',
+                          batch_size=4096, max_iter=100, tol=1e-4, seed=None,
+                          silhouette_sample=2000):
+        """K-means clustering of papers on standardized feature columns.
+
+        ``method='kmeans'`` runs Lloyd iterations over all rows;
+        ``method='minibatch'`` streams random batches of ``batch_size``
+        rows with per-centroid learning rates, so its cost does not grow
+        with the number of iterations times the corpus size.  Distances
+        are always computed in chunks, which bounds memory to the feature
+        matrix plus ``chunk x n_clusters`` scratch space.
+
+        Papers with a missing feature get label -1; ``n_clusters`` is capped
+        at the number of papers left.  The silhouette score is computed
+        exactly on a random sample of ``silhouette_sample`` clustered
+        papers.
+        """
+        features = list(features or ['citations', 'year', 'author_count'])
+        columns = [self.columns[name] if name in self.columns else self.column(name)
+                   for name in features]
+        complete = np.ones(len(columns[0]), dtype=bool)
+        for column in columns:
+            complete &= ~np.isnan(column)
+        n_points = int(complete.sum())
+        if n_clusters < 1 or n_points == 0:
+            raise ValueError("Clustering needs n_clusters >= 1 and at least one complete paper")
+        n_clusters = min(n_clusters, n_points)
+
+        # Standardized float32 features, filled column by column so the
+        # only full-size allocation is the matrix itself.
+        points = np.empty((n_points, len(columns)), dtype=np.float32)
+        mean, scale = np.empty(len(columns)), np.empty(len(columns))
+        for j, column in enumerate(columns):
+            values = column[complete]
+            mean[j], scale[j] = values.mean(), values.std() or 1.0
+            points[:, j] = (values - mean[j]) / scale[j]
+
+        rng = np.random.default_rng(seed)
+        if method == 'kmeans':
+            centroids = _kmeans(points, n_clusters, max_iter, tol, rng)
+        elif method == 'minibatch':
+            centroids = _minibatch_kmeans(points, n_clusters, batch_size, max_iter, tol, rng)
+        else:
+            raise ValueError(f"Unsupported clustering method: {method}")
+        assigned, distances = _assign(points, centroids)
+
+        labels = np.full(len(complete), -1, dtype=np.int64)
+        labels[complete] = assigned
+        sample = rng.choice(n_points, min(silhouette_sample, n_points), replace=False)
+        return {
+            'features': features,
+            'labels': labels.tolist(),
+            'centroids': (centroids * scale + mean).tolist(),
+            'sizes': np.bincount(assigned, minlength=n_clusters).tolist(),
+            'inertia': float(distances.sum()),
+            'silhouette_score': _silhouette(points[sample].astype(np.float64),
+                                            assigned[sample]),
+        }
+
+    def detectOutliers(self, variable='citations', method='zscore', threshold=3.0,
+                       group_by=None, min_group_size=3, as_array=False):
+        """Flag papers whose value of ``variable`` is anomalous.
+
+        ``method='zscore'`` flags ``|x - mean| / std > threshold``;
+        ``method='iqr'`` flags values more than ``threshold`` interquartile
+        ranges outside the quartiles.  With ``group_by='venue'`` or
+        ``'year'`` the statistics are computed per group in one vectorized
+        group-by, so a paper is compared with its own venue or year; groups
+        with fewer than ``min_group_size`` papers are not scored.
+
+        Returns:
+            Row indices of the outliers with their scores (in standard
+            deviations or IQRs past the fence), as lists or, with
+            ``as_array``, NumPy arrays
+        """
+        values = self.columns.get(variable)
+        if values is None:
+            raise ValueError(f"Unknown variable: {variable}")
+        groups, names = self.partition(group_by)
+        rows = np.flatnonzero(~np.isnan(values) & (groups >= 0))
+        groups, values, n_groups = groups[rows], values[rows], len(names)
+
+        sizes = np.bincount(groups, minlength=n_groups)
+        scored = sizes[groups] >= min_group_size
+        rows, groups, values = rows[scored], groups[scored], values[scored]
+
+        if method not in ('zscore', 'iqr'):
+            raise ValueError(f"Unsupported outlier method: {method}")
+        if len(values) == 0:
+            scores = np.zeros(0)
+        elif method == 'zscore':
+            scores = _group_zscores(values, groups, n_groups)
+        else:
+            scores = _group_iqr_scores(values, groups, n_groups)
+
+        flagged = scores > threshold
+        indices, scores = rows[flagged], scores[flagged]
+        return {
+            'indices': indices if as_array else indices.tolist(),
+            'scores': scores if as_array else scores.tolist(),
+            'threshold_used': threshold,
+            'method': method,
+            'group_by': group_by,
+        }
+
+    def performTTest(self, group1_data, group2_data, equal_var=False):
+        """Two-sample t-test (Welch's unless ``equal_var``)."""
+        first, second = _sample(group1_data), _sample(group2_data)
+        statistic, p_value, dof = _t_test(
+            first.mean(), first.var(ddof=1), len(first),
+            second.mean(), second.var(ddof=1), len(second), equal_var)
+        return {'statistic': float(statistic), 'p_value': float(p_value),
+                'degrees_of_freedom': float(dof)}
+
+    def performChiSquareTest(self, observed, expected=None):
+        """Chi-square goodness-of-fit test (uniform ``expected`` by default).
+
+        ``expected`` is rescaled to the observed total.
+        """
+        observed = np.asarray(observed, dtype=np.float64)
+        if len(observed) < 2:
+            raise ValueError("Chi-square test needs at least two categories")
+        expected = (np.ones(len(observed)) if expected is None
+                    else np.asarray(expected, dtype=np.float64))
+        if len(expected) != len(observed) or np.any(expected <= 0):
+            raise ValueError("Expected frequencies must be positive, one per category")
+        expected = expected * observed.sum() / expected.sum()
+        statistic = float(np.sum((observed - expected) ** 2 / expected))
+        dof = len(observed) - 1
+        return {'statistic': statistic, 'p_value': float(sps.chi2.sf(statistic, dof)),
+                'degrees_of_freedom': dof}
+
+    def performANOVA(self, groups):
+        """One-way ANOVA over a ``{name: values}`` mapping of groups."""
+        samples = [_sample(values) for values in groups.values()]
+        if len(samples) < 2:
+            raise ValueError("ANOVA needs at least two groups")
+        values = np.concatenate(samples)
+        labels = np.repeat(np.arange(len(samples)), [len(sample) for sample in samples])
+        f_statistic, p_value, between, within = _anova(values, labels, len(samples))
+        return {'f_statistic': float(f_statistic), 'p_value': float(p_value),
+                'df_between': between, 'df_within': within}
+
+    def performKSTest(self, data, distribution='normal'):
+        """One-sample Kolmogorov-Smirnov test against a fitted distribution.
+
+        ``distribution`` is ``'normal'``, ``'exponential'`` or ``'uniform'``;
+        its parameters are estimated from ``data``.
+        """
+        values = _sample(data)
+        if distribution == 'normal':
+            cdf = sps.norm(values.mean(), values.std(ddof=1) or 1.0).cdf
+        elif distribution == 'exponential':
+            cdf = sps.expon(values.min(), values.mean() - values.min() or 1.0).cdf
+        elif distribution == 'uniform':
+            cdf = sps.uniform(values.min(), values.max() - values.min() or 1.0).cdf
+        else:
+            raise ValueError(f"Unsupported distribution: {distribution}")
+        result = sps.kstest(values, cdf)
+        return {'statistic': float(result.statistic), 'p_value': float(result.pvalue)}
+
+    def compareGroups(self, group1_data, group2_data, tests=('t_test', 'mann_whitney')):
+        """Run several two-sample tests on ``{'name', 'values'}`` groups."""
+        first, second = _sample(group1_data['values']), _sample(group2_data['values'])
+        values = np.concatenate((first, second))
+        labels = np.repeat([0, 1], [len(first), len(second)])
+
+        comparison = {}
+        for test in tests:
+            statistic, p_value = _group_vs_rest(test, values, labels, 2)
+            comparison[test] = {'statistic': float(statistic[0]),
+                                'p_value': float(p_value[0]),
+                                'groups': [group1_data.get('name'), group2_data.get('name')]}
+        return comparison
+
+    def testAllGroups(self, variable='citations', group_by='venue', test='t_test',
+                      correction='holm', alpha=0.05, min_group_size=2):
+        """Test every group against the rest of the corpus in one batch.
+
+        The partition comes from ``partition`` (computed once per
+        grouping) and each test is evaluated for all groups at once from
+        group-wise sums, ranks or sorted runs; nothing is re-sliced per
+        group.  ``test`` is ``'t_test'`` (Welch), ``'mann_whitney'``
+        (normal approximation with tie correction), ``'ks'`` (two-sample,
+        p-values for the effective sample size like scipy's ``asymp``) or
+        ``'chi_square'`` (the group's histogram over the default citation
+        bins against the corpus shares).
+        ``test='anova'`` runs one ANOVA across all groups instead.
+
+        P-values are corrected for the number of groups with
+        ``'bonferroni'``, ``'holm'``, ``'fdr_bh'`` or None.
+        """
+        values = self.columns.get(variable)
+        if values is None:
+            raise ValueError(f"Unknown variable: {variable}")
+        groups, names = self.partition(group_by)
+        rows = ~np.isnan(values) & (groups >= 0)
+        values, groups = values[rows], groups[rows]
+
+        # Drop groups that are too small and renumber the rest densely.
+        sizes = np.bincount(groups, minlength=len(names))
+        kept = np.flatnonzero(sizes >= min_group_size)
+        remap = np.full(len(names), -1)
+        remap[kept] = np.arange(len(kept))
+        groups = remap[groups]
+        values, groups = values[groups >= 0], groups[groups >= 0]
+        names, sizes = [names[i] for i in kept.tolist()], sizes[kept]
+
+        if test == 'anova':
+            if len(names) < 2:
+                raise ValueError("ANOVA needs at least two groups")
+            f_statistic, p_value, between, within = _anova(values, groups, len(names))
+            return {'test': test, 'f_statistic': float(f_statistic),
+                    'p_value': float(p_value), 'df_between': between,
+                    'df_within': within, 'groups': len(names)}
+
+        if len(names) < 2:
+            raise ValueError("Testing groups against the rest needs at least two groups")
+        statistics, p_values = _group_vs_rest(test, values, groups, len(names))
+        adjusted = _adjust_p_values(p_values, correction)
+        return {
+            'test': test,
+            'correction': correction,
+            'groups': [
+                {'group': name, 'size': int(size), 'statistic': float(statistic),
+                 'p_value': float(p_value), 'adjusted_p_value': float(corrected),
+                 'significant': bool(corrected < alpha)}
+                for name, size, statistic, p_value, corrected in zip(
+                    names, sizes.tolist(), statistics.tolist(),
+                    p_values.tolist(), adjusted.tolist())
+            ],
+        }
+
+    def partition(self, group_by):
+        """Group ID of every paper and the group names, computed once per grouping.
+
+        ``group_by`` is None (one group), ``'venue'`` or ``'year'``; papers
+        without a venue or year get group -1.
+        """
+        if group_by in self._partitions:
+            return self._partitions[group_by]
+        self.columns  # make sure the table exists
+        if group_by is None:
+            partition = np.zeros(len(self.table), dtype=np.int64), ['all']
+        elif group_by in ('venue', 'year'):
+            keys = (self.table.venue_ids if group_by == 'venue' else self.table.years)
+            keys = keys.astype(np.int64)
+            known = keys > 0  # venue ID 0 and year 0 mean "missing"
+            groups = np.full(len(keys), -1, dtype=np.int64)
+            unique, groups[known] = np.unique(keys[known], return_inverse=True)
+            if group_by == 'venue':
+                names = [self.table.venues[key] for key in unique.tolist()]
+            else:
+                names = unique.tolist()
+            partition = groups, names
+        else:
+            raise ValueError(f"Unsupported grouping: {group_by}")
+        self._partitions[group_by] = partition
+        return partition
+
+    def _paired(self, x_var, y_var):
+        """Columns ``x_var`` and ``y_var`` over rows where both are present."""
+        x, y = self.columns.get(x_var), self.columns.get(y_var)
+        if x is None or y is None:
+            raise ValueError(f"Unknown variable: {x_var if x is None else y_var}")
+        present = ~(np.isnan(x) | np.isnan(y))
+        if not present.any():
+            raise ValueError("No papers have both variables")
+        return x[present], y[present]
+
+    def _yearly_series(self, variable):
+        """Dated years and the per-year paper count or column total."""
+        years = self.columns['year']
+        dated = ~np.isnan(years)
+        if variable == 'paper_count':
+            weights = None
+        elif variable in self.columns:
+            weights = self.columns[variable][dated]
+        else:
+            raise ValueError(f"Unknown variable: {variable}")
+
+        offset = years[dated].astype(np.int64)
+        if len(offset) == 0:
+            return np.empty(0), np.empty(0)
+        first = offset.min()
+        series = np.bincount(offset - first, weights=weights).astype(np.float64)
+        return np.arange(first, first + len(series), dtype=np.float64), series
+
+
+def _regression_degree(regression_type, degree):
+    if regression_type == 'linear':
+        return 1
+    if regression_type == 'polynomial':
+        if degree < 1:
+            raise ValueError("degree must be at least 1")
+        return degree
+    raise TypeError(f"Unsupported regression type: {regression_type}")
+
+
+def _fit_polynomial(x, y, degree):
+    """Polynomial least squares with coefficient standard errors.
+
+    The fit runs on standardized ``x`` (raw years squared are badly
+    conditioned) and coefficients and their covariance are mapped back to
+    powers of the raw ``x`` afterwards.
+    """
+    center, spread = x.mean(), x.std() or 1.0
+    design = np.vander((x - center) / spread, degree + 1, increasing=True)
+    coefficients, _, rank, _ = np.linalg.lstsq(design, y, rcond=None)
+
+    residual = y - design @ coefficients
+    rss = float(residual @ residual)
+    tss = float(np.sum((y - y.mean()) ** 2))
+    n, n_params = design.shape
+    dof = n - n_params
+
+    # Row i of ``transform`` expresses z ** i in powers of x.
+    base = np.polynomial.Polynomial([-center / spread, 1 / spread])
+    transform = np.zeros((n_params, n_params))
+    for power in range(n_params):
+        terms = (base ** power).coef
+        transform[power, :len(terms)] = terms
+    raw_coefficients = transform.T @ coefficients
+
+    if dof > 0 and rank == n_params:
+        covariance = np.linalg.inv(design.T @ design) * (rss / dof)
+        raw_covariance = transform.T @ covariance @ transform
+        errors = np.sqrt(np.diag(raw_covariance))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = raw_coefficients / errors
+        p_values = 2 * sps.t.sf(np.abs(t), dof)
+    else:
+        errors = p_values = np.full(n_params, np.nan)
+
+    r_squared = 1 - rss / tss if tss else 1.0
+    adjusted = 1 - (1 - r_squared) * (n - 1) / dof if dof > 0 else r_squared
+    return {
+        'coefficients': raw_coefficients,
+        'standard_errors': errors,
+        'p_values': p_values,
+        'r_squared': float(min(max(r_squared, 0.0), 1.0)),
+        'adjusted_r_squared': float(adjusted),
+    }
+
+
+def _evaluate(coefficients, x):
+    return np.polynomial.polynomial.polyval(x, coefficients)
+
+
+def _optional_floats(values):
+    """List of floats with NaN as None."""
+    return [None if np.isnan(value) else float(value) for value in values]
+
+
+# Rows per distance computation in k-means: bounds the scratch matrix
+# to ``_CHUNK_ROWS x n_clusters``.
+_CHUNK_ROWS = 65536
+
+
+def _assign(points, centroids):
+    """Nearest centroid and squared distance for every point, in chunks."""
+    labels = np.empty(len(points), dtype=np.int64)
+    distances = np.empty(len(points))
+    centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+    for start in range(0, len(points), _CHUNK_ROWS):
+        chunk = points[start:start + _CHUNK_ROWS]
+        squared = (np.einsum('ij,ij->i', chunk, chunk)[:, None]
+                   - 2 * chunk @ centroids.T + centroid_norms)
+        labels[start:start + len(chunk)] = nearest = squared.argmin(axis=1)
+        distances[start:start + len(chunk)] = np.maximum(
+            squared[np.arange(len(chunk)), nearest], 0)
+    return labels, distances
+
+
+def _kmeans_plus_plus(points, n_clusters, rng):
+    """k-means++ seeding: each new centroid drawn proportionally to D^2."""
+    norms = np.einsum('ij,ij->i', points, points).astype(np.float64)
+
+    def squared_distances(center):
+        return np.maximum(norms - 2 * (points @ center) + center @ center, 0)
+
+    centroids = [points[rng.integers(len(points))]]
+    closest = squared_distances(centroids[0])
+    for _ in range(1, n_clusters):
+        total = closest.sum(dtype=np.float64)
+        index = rng.choice(len(points), p=closest / total) if total > 0 \
+            else rng.integers(len(points))
+        centroids.append(points[index])
+        closest = np.minimum(closest, squared_distances(points[index]))
+    return np.array(centroids, dtype=np.float64)
+
+
+def _kmeans(points, n_clusters, max_iter, tol, rng):
+    """Lloyd's algorithm; centroid sums come from one bincount per feature."""
+    centroids = _kmeans_plus_plus(points, n_clusters, rng)
+    for _ in range(max_iter):
+        labels, _ = _assign(points, centroids)
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.column_stack([np.bincount(labels, weights=column, minlength=n_clusters)
+                                for column in points.T])
+        updated = centroids.copy()
+        filled = counts > 0
+        updated[filled] = sums[filled] / counts[filled, None]
+        shift = np.sum((updated - centroids) ** 2)
+        centroids = updated
+        if shift <= tol:
+            break
+    return centroids
+
+
+def _minibatch_kmeans(points, n_clusters, batch_size, max_iter, tol, rng):
+    """Mini-batch k-means (Sculley, 2010) over random batches.
+
+    Seeds on a sample, then moves each centroid towards the mean of its
+    batch members with a learning rate of one over the points it has seen.
+    ``max_iter`` counts passes' worth of batches over the data, capped so a
+    run never needs more than a few hundred batches to settle.
+    """
+    sample = points[rng.choice(len(points), min(len(points), 10 * batch_size), replace=False)]
+    centroids = _kmeans_plus_plus(sample, n_clusters, rng)
+    seen = np.zeros(n_clusters)
+
+    n_batches = min(max_iter * max(1, len(points) // batch_size), 100 * max_iter)
+    for _ in range(n_batches):
+        batch = points[rng.integers(0, len(points), batch_size)]
+        labels, _ = _assign(batch, centroids)
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.column_stack([np.bincount(labels, weights=column, minlength=n_clusters)
+                                for column in batch.T])
+        filled = counts > 0
+        seen[filled] += counts[filled]
+        rate = counts[filled] / seen[filled]
+        updated = centroids.copy()
+        updated[filled] += rate[:, None] * (sums[filled] / counts[filled, None]
+                                            - centroids[filled])
+        shift = np.sum((updated - centroids) ** 2)
+        centroids = updated
+        if shift <= tol * tol:
+            break
+    return centroids
+
+
+def _silhouette(points, labels):
+    """Mean silhouette coefficient; 0 when fewer than two clusters are present."""
+    clusters, labels = np.unique(labels, return_inverse=True)
+    if len(clusters) < 2 or len(points) < 3:
+        return 0.0
+    squared = np.sum(points ** 2, axis=1)
+    distances = np.sqrt(np.maximum(
+        squared[:, None] - 2 * points @ points.T + squared[None, :], 0))
+    membership = np.eye(len(clusters))[labels]
+    sizes = membership.sum(axis=0)
+    totals = distances @ membership
+
+    own = sizes[labels]
+    intra = np.divide(totals[np.arange(len(points)), labels], own - 1,
+                      out=np.zeros(len(points)), where=own > 1)
+    others = totals / sizes
+    others[np.arange(len(points)), labels] = np.inf
+    nearest = others.min(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(own > 1, (nearest - intra) / np.maximum(intra, nearest), 0)
+    return float(np.nan_to_num(scores).mean())
+
+
+def _sample(values):
+    """Float array of a test sample, which needs at least two values."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        raise ValueError("Statistical tests need at least two values per group")
+    return values
+
+
+def _t_test(mean1, var1, n1, mean2, var2, n2, equal_var=False):
+    """Two-sample t statistics, p-values and degrees of freedom (vectorized)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if equal_var:
+            dof = n1 + n2 - 2
+            pooled = ((n1 - 1) * var1 + (n2 - 1) * var2) / dof
+            error = np.sqrt(pooled * (1 / n1 + 1 / n2))
+        else:
+            a, b = var1 / n1, var2 / n2
+            error = np.sqrt(a + b)
+            dof = (a + b) ** 2 / (a ** 2 / (n1 - 1) + b ** 2 / (n2 - 1))
+        statistic = np.nan_to_num((mean1 - mean2) / error)
+    p_value = np.where(error > 0, 2 * sps.t.sf(np.abs(statistic), np.nan_to_num(dof, nan=1)), 1.0)
+    return statistic, p_value, dof
+
+
+def _anova(values, groups, n_groups):
+    """One-way ANOVA F statistic from group-wise sums."""
+    sizes = np.bincount(groups, minlength=n_groups)
+    means = np.bincount(groups, weights=values, minlength=n_groups) / sizes
+    grand = values.mean()
+    between = np.sum(sizes * (means - grand) ** 2)
+    within = np.sum((values - means[groups]) ** 2)
+    df_between, df_within = n_groups - 1, len(values) - n_groups
+    if df_within <= 0:
+        raise ValueError("ANOVA needs more values than groups")
+    if within == 0:
+        f_statistic = np.inf if between > 0 else 0.0
+    else:
+        f_statistic = (between / df_between) / (within / df_within)
+    return f_statistic, float(sps.f.sf(f_statistic, df_between, df_within)), \
+        df_between, df_within
+
+
+def _group_vs_rest(test, values, groups, n_groups):
+    """Statistic and p-value of each group against all other values."""
+    n = len(values)
+    sizes = np.bincount(groups, minlength=n_groups).astype(np.float64)
+    rest = n - sizes
+
+    if test == 't_test':
+        sums = np.bincount(groups, weights=values, minlength=n_groups)
+        squares = np.bincount(groups, weights=values ** 2, minlength=n_groups)
+        total, total_squares = values.sum(), np.dot(values, values)
+        mean1, mean2 = sums / sizes, (total - sums) / rest
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var1 = (squares - sizes * mean1 ** 2) / (sizes - 1)
+            var2 = (total_squares - squares - rest * mean2 ** 2) / (rest - 1)
+        statistic, p_value, _ = _t_test(mean1, np.maximum(var1, 0), sizes,
+                                        mean2, np.maximum(var2, 0), rest)
+        return statistic, p_value
+
+    if test == 'mann_whitney':
+        ranks = sps.rankdata(values)
+        u = np.bincount(groups, weights=ranks, minlength=n_groups) - sizes * (sizes + 1) / 2
+        _, ties = np.unique(values, return_counts=True)
+        tie_term = np.sum(ties ** 3 - ties) / (n * (n - 1)) if n > 1 else 0.0
+        sigma = np.sqrt(sizes * rest / 12 * ((n + 1) - tie_term))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = np.nan_to_num((u - sizes * rest / 2) / sigma)
+        return u, np.where(sigma > 0, 2 * sps.norm.sf(np.abs(z)), 1.0)
+
+    if test == 'ks':
+        ordered = np.sort(values)
+        order = np.lexsort((values, groups))
+        sorted_values, sorted_groups = values[order], groups[order]
+        starts = np.concatenate(([0], np.cumsum(sizes.astype(np.int64))[:-1]))
+        position = np.arange(n) - starts[sorted_groups] + 1
+        share = sizes[sorted_groups]
+        right = np.searchsorted(ordered, sorted_values, side='right') / n
+        left = np.searchsorted(ordered, sorted_values, side='left') / n
+        gaps = np.maximum(position / share - right, left - (position - 1) / share)
+        # Distance to the whole corpus; against the rest it is larger by
+        # n / (n - size) because the corpus mixes in the group itself.
+        distance = np.maximum.reduceat(gaps, starts) * n / rest
+        effective = np.maximum(np.round(sizes * rest / n), 1)
+        return distance, np.clip(sps.kstwo.sf(distance, effective), 0, 1)
+
+    if test == 'chi_square':
+        binning = Binning.default()
+        bins = np.searchsorted(binning.edges, values, side='right') - 1
+        bins = np.clip(bins, 0, len(binning.edges) - 1)
+        n_bins = len(binning.edges)
+        observed = np.bincount(groups * n_bins + bins,
+                               minlength=n_groups * n_bins).reshape(n_groups, n_bins)
+        shares = observed.sum(axis=0) / n
+        used = shares > 0
+        expected = sizes[:, None] * shares[used]
+        statistic = np.sum((observed[:, used] - expected) ** 2 / expected, axis=1)
+        return statistic, sps.chi2.sf(statistic, max(int(used.sum()) - 1, 1))
+
+    raise ValueError(f"Unsupported test: {test}")
+
+
+def _adjust_p_values(p_values, method):
+    """Multiple-comparison correction of a vector of p-values."""
+    p_values = np.asarray(p_values, dtype=np.float64)
+    m = len(p_values)
+    if method is None or m == 0:
+        return p_values
+    if method == 'bonferroni':
+        return np.minimum(p_values * m, 1.0)
+
+    order = np.argsort(p_values)
+    ranked = p_values[order]
+    if method == 'holm':
+        adjusted = np.maximum.accumulate(ranked * (m - np.arange(m)))
+    elif method == 'fdr_bh':
+        adjusted = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+    else:
+        raise ValueError(f"Unsupported correction: {method}")
+    result = np.empty(m)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+
+def _group_zscores(values, groups, n_groups):
+    """Absolute z-score of each value within its group (0 for constant groups)."""
+    sizes = np.bincount(groups, minlength=n_groups)
+    means = np.bincount(groups, weights=values, minlength=n_groups) / np.maximum(sizes, 1)
+    deviations = values - means[groups]
+    stds = np.sqrt(np.bincount(groups, weights=deviations ** 2, minlength=n_groups)
+                   / np.maximum(sizes, 1))
+    std = stds[groups]
+    return np.divide(np.abs(deviations), std, out=np.zeros(len(values)), where=std > 0)
+
+
+def _group_iqr_scores(values, groups, n_groups):
+    """Distance outside each group's quartiles, in units of its IQR.
+
+    Values are sorted by (group, value) once; every group's quartiles are
+    then read off at interpolated positions inside its slice.
+    """
+    order = np.lexsort((values, groups))
+    ordered = values[order]
+    sizes = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    def quartile(q):
+        position = starts + q * np.maximum(sizes - 1, 0)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, starts + np.maximum(sizes - 1, 0))
+        low, high = np.minimum(low, len(ordered) - 1), np.minimum(high, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    q1, q3 = quartile(0.25), quartile(0.75)
+    iqr = (q3 - q1)[groups]
+    outside = np.maximum(q1[groups] - values, values - q3[groups])
+    return np.divide(np.maximum(outside, 0), iqr, out=np.zeros(len(values)), where=iqr > 0)
+
+
+def _quantiles(sorted_values, q):
+    """Linearly interpolated quantiles of pre-sorted values (NumPy's default)."""
+    position = np.asarray(q) * (len(sorted_values) - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.minimum(low + 1, len(sorted_values) - 1)
+    fraction = position - low
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * fraction
+
+
+def _mode(sorted_values):
+    """Most frequent value of pre-sorted values; the smallest on ties."""
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    runs = np.diff(np.r_[starts, len(sorted_values)])
+    return sorted_values[starts[np.argmax(runs)]]
+
+
+def _shape(values):
+    """Population skewness and excess kurtosis; 0 for constant data."""
+    centered = values - values.mean()
+    variance = np.mean(centered ** 2)
+    if variance == 0:
+        return 0.0, 0.0
+    skewness = np.mean(centered ** 3) / variance ** 1.5
+    kurtosis = np.mean(centered ** 4) / variance ** 2 - 3
+    return float(skewness), float(kurtosis)
+
+
+def _correlation_matrix(matrix):
+    """Pearson correlations of the columns, with undefined entries as 0."""
+    n_vars = matrix.shape[1]
+    if len(matrix) < 2:
+        return np.eye(n_vars)
+    centered = matrix - matrix.mean(axis=0)
+    norms = np.sqrt((centered ** 2).sum(axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correlations = (centered.T @ centered) / np.outer(norms, norms)
+    correlations = np.clip(np.nan_to_num(correlations), -1, 1)
+    np.fill_diagonal(correlations, 1.0)
+    return correlations
+
+
+def _linear_trend(x, y):
+    """Least-squares line of ``y`` on ``x`` with correlation and its p-value."""
+    n = len(x)
+    x_centered, y_centered = x - x.mean(), y - y.mean()
+    sxx, syy = np.dot(x_centered, x_centered), np.dot(y_centered, y_centered)
+    slope = np.dot(x_centered, y_centered) / sxx if sxx else 0.0
+    intercept = y.mean() - slope * x.mean()
+    correlation = slope * np.sqrt(sxx / syy) if syy and sxx else 0.0
+    correlation = float(np.clip(correlation, -1, 1))
+
+    if n > 2 and abs(correlation) < 1:
+        t = correlation * np.sqrt((n - 2) / (1 - correlation ** 2))
+        p_value = float(2 * sps.t.sf(abs(t), n - 2))
+    else:
+        p_value = 0.0 if n > 2 else 1.0
+    return {
+        'slope': float(slope),
+        'intercept': float(intercept),
+        'correlation': correlation,
+        'r_squared': correlation ** 2,
+        'p_value': p_value,
+    }
+
+
+def _seasonality(residuals, min_strength=0.3):
+    """Dominant period of a detrended series from its autocorrelation."""
+    n = len(residuals)
+    centered = residuals - residuals.mean() if n else residuals
+    denominator = np.dot(centered, centered)
+    if n < 4 or denominator == 0:
+        return {'period': None, 'strength': 0.0}
+
+    # Autocorrelation at every lag from one FFT.
+    spectrum = np.fft.rfft(centered, 2 * n)
+    acf = np.fft.irfft(spectrum * np.conj(spectrum))[:n] / denominator
+    lags = np.arange(2, n // 2 + 1)
+    if len(lags) == 0:
+        return {'period': None, 'strength': 0.0}
+    best = lags[np.argmax(acf[lags])]
+    strength = float(acf[best])
+    return {'period': int(best) if strength >= min_strength else None,
+            'strength': strength}
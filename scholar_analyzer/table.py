@@ -0,0 +1,535 @@
+# scholar_analyzer/table.py
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import serialization
+
+# Fields stored as typed columns; anything else a paper carries is kept in
+# ``PaperTable.extra`` so records round-trip unchanged.
+CORE_FIELDS = frozenset(('title', 'authors', 'year', 'venue', 'citations'))
+
+# Papers converted per step by ``PaperTable.from_stream``.
+DEFAULT_STREAM_CHUNK = 8192
+
+# Rows read per step by column scans (aggregation, filter scans), which
+# bounds their working set on memory-mapped tables.
+SCAN_CHUNK = 1 << 20
+
+# Rows decoded per step by ``PaperTable.iter_records``.
+RECORD_CHUNK = 65536
+
+class _Missing:
+    """Type of ``_MISSING``.
+
+    Pickles by name, so tables built in worker processes come back with
+    their absent fields still ``_MISSING``.
+    """
+
+    def __reduce__(self) -> str:
+        return '_MISSING'
+
+    def __repr__(self) -> str:
+        return '<missing>'
+
+
+# Sentinel for "field absent" in the extra columns.
+_MISSING = _Missing()
+
+
+def paper_key(paper: Dict[str, Any]) -> Tuple[str, int]:
+    """Identity of a paper for removal: its title and year."""
+    return (paper.get('title', '') or '', _to_int(paper.get('year')))
+
+
+def _append_into(buffer: Optional[np.ndarray], column: np.ndarray,
+                 values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Append ``values`` to ``column``, a prefix view of ``buffer``.
+
+    The buffer is reused while it has room and doubled otherwise, so a
+    run of appends costs amortized time proportional to what is added.
+    Returns the (possibly new) buffer and the extended view.
+    """
+    n, k = len(column), len(values)
+    if buffer is None or column.base is not buffer or len(buffer) < n + k:
+        buffer = np.empty(max(2 * (n + k), 1024), dtype=column.dtype)
+        buffer[:n] = column
+    buffer[n:n + k] = values
+    return buffer, buffer[:n + k]
+
+
+def _remap(pool: "StringPool", other: "StringPool") -> np.ndarray:
+    """IDs in ``pool`` of every name in ``other``, interning new ones."""
+    return np.array([pool.intern(value) for value in other.values], dtype=np.int32)
+
+
+def _to_int(value: Any) -> int:
+    """Coerce a year or citation value to int, treating junk as 0."""
+    if value is None:
+        return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class StringPool:
+    """Interned string dictionary mapping values to dense integer IDs.
+
+    IDs are assigned in first-seen order, which keeps ties in count-sorted
+    output in the same order as the input papers.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for value in values:
+            self.intern(value)
+
+    @classmethod
+    def from_distinct(cls, values: List[str]) -> "StringPool":
+        """Pool over ``values``, which must not repeat.
+
+        The name-to-ID dict is only built when first needed; reading
+        names by ID does not need it.
+        """
+        pool = cls.__new__(cls)
+        pool.values = values
+        return pool
+
+    @classmethod
+    def from_loader(cls, load: Callable[[], List[str]]) -> "StringPool":
+        """Pool whose distinct names are read by ``load()`` on first use."""
+        pool = cls.__new__(cls)
+        pool._load = load
+        return pool
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while ``values`` or ``ids`` is unset (see
+        # ``from_distinct`` and ``from_loader``).
+        if name == 'values':
+            load = self.__dict__.pop('_load', None)
+            if load is None:
+                raise AttributeError(name)
+            self.values = load()
+            return self.values
+        if name != 'ids':
+            raise AttributeError(name)
+        self.ids = dict(zip(self.values, range(len(self.values))))
+        return self.ids
+
+    def intern(self, value: str) -> int:
+        """Return the ID for ``value``, assigning a new one if needed."""
+        ids = self.ids
+        id_ = ids.get(value)
+        if id_ is None:
+            id_ = ids[value] = len(self.values)
+            self.values.append(value)
+        return id_
+
+    def lookup(self, value: str) -> Optional[int]:
+        """Return the ID for ``value`` or None when it was never interned."""
+        return self.ids.get(value)
+
+    def __getitem__(self, id_: int) -> str:
+        return self.values[id_]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.ids
+
+
+class StringColumn:
+    """Column of unique strings stored as one UTF-8 buffer plus offsets.
+
+    Used for titles, which cannot be interned; a Python ``str`` per title
+    costs several times the text itself.
+    """
+
+    def __init__(self, buffer: bytes = b'', offsets: Optional[np.ndarray] = None):
+        self.buffer = buffer
+        self.offsets = offsets if offsets is not None else np.zeros(1, dtype=np.int64)
+        self._offset_buffer: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "StringColumn":
+        encoded = [value.encode('utf-8') for value in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(b''.join(encoded), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        return bytes(self.buffer[start:end]).decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.take(np.arange(len(self))))
+
+    def extend(self, other: "StringColumn") -> None:
+        """Append the strings of ``other`` in amortized O(len(other))."""
+        if not isinstance(self.buffer, bytearray):
+            self.buffer = bytearray(self.buffer)
+        self._offset_buffer, self.offsets = _append_into(
+            self._offset_buffer, self.offsets,
+            other.offsets[1:] + len(self.buffer))
+        self.buffer += other.buffer
+
+    def compress(self, keep: np.ndarray) -> "StringColumn":
+        """Return a column holding only the rows where ``keep`` is true."""
+        lengths = np.diff(self.offsets)
+        data = np.frombuffer(self.buffer, dtype=np.uint8, count=int(self.offsets[-1]))
+        offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+        np.cumsum(lengths[keep], out=offsets[1:])
+        return StringColumn(data[np.repeat(keep, lengths)].tobytes(), offsets)
+
+    def take(self, rows: np.ndarray) -> List[str]:
+        """Decode the strings at ``rows``."""
+        # Slicing a view is cheap for bytes and memory-mapped arrays alike.
+        buffer = memoryview(self.buffer)
+        return [bytes(buffer[start:end]).decode('utf-8') for start, end in
+                zip(self.offsets[rows].tolist(), self.offsets[rows + 1].tolist())]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.nbytes
+
+
+class JsonColumn:
+    """Column of arbitrary values kept JSON-encoded and decoded on access.
+
+    Holds the extra fields of tables opened from a corpus directory, so
+    opening one does not build a Python object per value.  Empty entries
+    are absent values (``_MISSING``).  Supports the list operations
+    ``PaperTable`` uses on extra columns.
+    """
+
+    def __init__(self, strings: StringColumn):
+        self.strings = strings
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "JsonColumn":
+        encoded = [b'' if value is _MISSING else serialization.dumpb(value)
+                   for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(StringColumn(b''.join(encoded), offsets))
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def __getitem__(self, row: int) -> Any:
+        offsets = self.strings.offsets
+        return self._decode(int(offsets[row]), int(offsets[row + 1]))
+
+    def __iter__(self) -> Iterator[Any]:
+        offsets = self.strings.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield self._decode(start, end)
+
+    def _decode(self, start: int, end: int) -> Any:
+        if start == end:
+            return _MISSING
+        return serialization.loads(bytes(self.strings.buffer[start:end]))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self.strings.extend(JsonColumn.from_values(values).strings)
+
+    def compress(self, keep: np.ndarray) -> "JsonColumn":
+        return JsonColumn(self.strings.compress(keep))
+
+
+class PaperTable:
+    """Columnar, interned representation of a paper list.
+
+    Years and citations are NumPy arrays (a year of 0 means "unknown"),
+    venues are integer IDs into ``venues``, and author lists are stored
+    CSR-style: the authors of paper ``i`` are
+    ``author_ids[author_offsets[i]:author_offsets[i + 1]]``, IDs into
+    ``authors``.  Every repeated string is therefore stored once, and
+    titles live in a single ``StringColumn`` buffer.
+    """
+
+    def __init__(self, titles: StringColumn, years: np.ndarray,
+                 citations: np.ndarray, venue_ids: np.ndarray,
+                 author_offsets: np.ndarray, author_ids: np.ndarray,
+                 venues: StringPool, authors: StringPool,
+                 extra: Optional[Dict[str, List[Any]]] = None):
+        self.titles = titles
+        self.years = years
+        self.citations = citations
+        self.venue_ids = venue_ids
+        self.author_offsets = author_offsets
+        self.author_ids = author_ids
+        self.venues = venues
+        self.authors = authors
+        self.extra = extra if extra is not None else {}
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._key_index: Optional[Dict[Tuple[str, int], List[int]]] = None
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Dict[str, Any]],
+                    venues: Optional[StringPool] = None,
+                    authors: Optional[StringPool] = None) -> "PaperTable":
+        """Build a table from paper records in a single pass.
+
+        Passing existing ``venues``/``authors`` pools makes the new table's
+        IDs compatible with (and extends) another table's dictionaries.
+        """
+        titles: List[str] = []
+        years: List[int] = []
+        citations: List[int] = []
+        venue_ids: List[int] = []
+        author_ids: List[int] = []
+        author_offsets: List[int] = [0]
+        extra: Dict[str, List[Any]] = {}
+
+        venues = venues if venues is not None else StringPool([''])
+        authors = authors if authors is not None else StringPool()
+        intern_venue = venues.intern
+        intern_author = authors.intern
+
+        for row, paper in enumerate(papers):
+            titles.append(paper.get('title', '') or '')
+            years.append(_to_int(paper.get('year')))
+            citations.append(_to_int(paper.get('citations', 0)))
+            venue_ids.append(intern_venue(paper.get('venue', '') or ''))
+            author_ids.extend(map(intern_author, paper.get('authors') or ()))
+            author_offsets.append(len(author_ids))
+
+            for key, value in paper.items():
+                if key in CORE_FIELDS:
+                    continue
+                column = extra.get(key)
+                if column is None:
+                    column = extra[key] = [_MISSING] * row
+                column.append(value)
+            for column in extra.values():
+                if len(column) <= row:
+                    column.append(_MISSING)
+
+        return cls(
+            titles=StringColumn.from_strings(titles),
+            years=np.array(years, dtype=np.int32),
+            citations=np.array(citations, dtype=np.int64),
+            venue_ids=np.array(venue_ids, dtype=np.int32),
+            author_offsets=np.array(author_offsets, dtype=np.int64),
+            author_ids=np.array(author_ids, dtype=np.int32),
+            venues=venues,
+            authors=authors,
+            extra=extra,
+        )
+
+    @classmethod
+    def from_stream(cls, papers: Iterable[Dict[str, Any]],
+                    chunk_size: int = DEFAULT_STREAM_CHUNK) -> "PaperTable":
+        """Build a table from a paper iterator, ``chunk_size`` papers at a time.
+
+        Only one chunk of records and per-field Python lists is alive at
+        once, so peak memory is the table plus a bounded chunk however
+        long the stream is.
+        """
+        papers = iter(papers)
+        table = cls.from_papers(islice(papers, chunk_size))
+        while True:
+            chunk = list(islice(papers, chunk_size))
+            if not chunk:
+                return table
+            table.append(chunk)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @property
+    def is_mapped(self) -> bool:
+        """True while the numeric columns are memory-mapped from a corpus directory."""
+        return isinstance(self.years, np.memmap)
+
+    def append(self, papers: Iterable[Dict[str, Any]]) -> np.ndarray:
+        """Append papers and return their row numbers.
+
+        Columns grow into over-allocated buffers, so the cost is amortized
+        O(number of new papers) rather than a copy of the whole table.
+        """
+        return self.extend(
+            PaperTable.from_papers(papers, venues=self.venues, authors=self.authors))
+
+    def extend(self, other: "PaperTable") -> np.ndarray:
+        """Append the rows of another table and return their row numbers.
+
+        IDs of ``other`` are translated into this table's pools unless
+        they are the same pools; only its distinct names are looked up.
+        """
+        start, count = len(self), len(other)
+        venue_ids, author_ids = other.venue_ids, other.author_ids
+        if other.venues is not self.venues:
+            venue_ids = _remap(self.venues, other.venues)[venue_ids]
+        if other.authors is not self.authors:
+            author_ids = _remap(self.authors, other.authors)[author_ids]
+
+        n_author_slots = len(self.author_ids)
+        for name, values in (
+            ('years', other.years),
+            ('citations', other.citations),
+            ('venue_ids', venue_ids),
+            ('author_ids', author_ids),
+            ('author_offsets', other.author_offsets[1:] + n_author_slots),
+        ):
+            self._buffers[name], column = _append_into(
+                self._buffers.get(name), getattr(self, name), values)
+            setattr(self, name, column)
+        self.titles.extend(other.titles)
+
+        for key in self.extra.keys() | other.extra.keys():
+            column = self.extra.setdefault(key, [_MISSING] * start)
+            column.extend(other.extra.get(key, [_MISSING] * count))
+
+        if self._key_index is not None:
+            self._index_rows(range(start, start + count))
+        return np.arange(start, start + count)
+
+    def delete(self, rows: Iterable[int]) -> None:
+        """Drop ``rows`` and compact every column (vectorized, O(table))."""
+        keep = np.ones(len(self), dtype=bool)
+        keep[np.asarray(list(rows), dtype=np.int64)] = False
+
+        counts = self.author_counts
+        author_offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+        np.cumsum(counts[keep], out=author_offsets[1:])
+
+        self.author_ids = self.author_ids[np.repeat(keep, counts)]
+        self.author_offsets = author_offsets
+        self.years = self.years[keep]
+        self.citations = self.citations[keep]
+        self.venue_ids = self.venue_ids[keep]
+        self.titles = self.titles.compress(keep)
+        kept = np.flatnonzero(keep).tolist()
+        self.extra = {key: (column.compress(keep) if isinstance(column, JsonColumn)
+                            else [column[row] for row in kept])
+                      for key, column in self.extra.items()}
+        self._buffers = {}
+        self._key_index = None
+
+    def find_rows(self, key: Tuple[str, int]) -> List[int]:
+        """Rows whose ``paper_key`` equals ``key``.
+
+        The key index is built on first use and kept current by ``append``.
+        The returned list is the index's own, so callers may pop from it.
+        """
+        if self._key_index is None:
+            self._key_index = {}
+            self._index_rows(range(len(self)))
+        return self._key_index.get(key, [])
+
+    def _index_rows(self, rows: range) -> None:
+        index = self._key_index
+        titles = self.titles.take(np.arange(rows.start, rows.stop))
+        years = self.years[rows.start:rows.stop].tolist()
+        for row, key in zip(rows, zip(titles, years)):
+            index.setdefault(key, []).append(row)
+
+    def replace_authors(self, rows: np.ndarray, author_ids: np.ndarray,
+                        authors: Optional[StringPool] = None) -> None:
+        """Set every paper's authors from parallel slot arrays.
+
+        ``rows`` must be non-decreasing; each paper keeps its authors in
+        slot order with repeats dropped, and papers without slots get no
+        authors.  ``authors`` replaces the author pool if given.
+        """
+        n_authors = len(authors if authors is not None else self.authors)
+        keys = rows.astype(np.int64) * max(n_authors, 1) + author_ids
+        by_key = np.argsort(keys, kind='stable')
+        first = np.zeros(len(keys), dtype=bool)
+        first[by_key[np.diff(keys[by_key], prepend=-1) != 0]] = True
+
+        self.author_ids = author_ids[first].astype(np.int32)
+        self.author_offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows[first], minlength=len(self)), out=self.author_offsets[1:])
+        if authors is not None:
+            self.authors = authors
+        self._buffers.pop('author_ids', None)
+        self._buffers.pop('author_offsets', None)
+
+    @property
+    def author_counts(self) -> np.ndarray:
+        """Number of authors on each paper."""
+        return np.diff(self.author_offsets)
+
+    def paper_authors(self, row: int) -> List[str]:
+        """Return the author names of the paper at ``row``."""
+        start, end = self.author_offsets[row], self.author_offsets[row + 1]
+        values = self.authors.values
+        return [values[id_] for id_ in self.author_ids[start:end].tolist()]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Rebuild the paper dict stored at ``row``."""
+        return next(self.iter_records([row]))
+
+    def iter_records(self, rows: Optional[Iterable[int]] = None,
+                     chunk_size: int = RECORD_CHUNK) -> Iterator[Dict[str, Any]]:
+        """Yield paper dicts for ``rows`` (all rows by default).
+
+        Columns are decoded ``chunk_size`` rows at a time, so exporting a
+        memory-mapped table only holds one chunk of it in memory.
+        """
+        if rows is not None:
+            rows = np.asarray(rows if isinstance(rows, np.ndarray) else list(rows),
+                              dtype=np.int64)
+        n = len(self) if rows is None else len(rows)
+        for start in range(0, n, chunk_size):
+            if rows is None:
+                chunk = np.arange(start, min(start + chunk_size, n))
+            else:
+                chunk = rows[start:start + chunk_size]
+            yield from self._records(chunk)
+
+    def _records(self, rows: np.ndarray) -> Iterator[Dict[str, Any]]:
+        titles = self.titles.take(rows)
+        years = self.years[rows].tolist()
+        citations = self.citations[rows].tolist()
+        venue_ids = self.venue_ids[rows].tolist()
+        starts = self.author_offsets[rows].tolist()
+        ends = self.author_offsets[rows + 1].tolist()
+        # A plain ndarray view: slicing a memmap per paper is several times slower.
+        author_ids = np.asarray(self.author_ids)
+        author_values = self.authors.values
+        venue_values = self.venues.values
+        extra = self.extra.items()
+
+        for i, row in enumerate(rows.tolist()):
+            paper = {
+                'title': titles[i],
+                'authors': [author_values[id_] for id_ in
+                            author_ids[starts[i]:ends[i]].tolist()],
+            }
+            if years[i]:
+                paper['year'] = years[i]
+            if venue_ids[i]:
+                paper['venue'] = venue_values[venue_ids[i]]
+            paper['citations'] = citations[i]
+            for key, column in extra:
+                value = column[row]
+                if value is not _MISSING:
+                    paper[key] = value
+            yield paper
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a paper dict."""
+        return list(self.iter_records())
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the table's columns and dictionaries."""
+        import sys
+
+        arrays = (self.years, self.citations, self.venue_ids,
+                  self.author_offsets, self.author_ids)
+        size = sum(array.nbytes for array in arrays) + self.titles.nbytes
+        for pool in (self.venues, self.authors):
+            size += sys.getsizeof(pool.values) + sys.getsizeof(pool.ids)
+            size += sum(map(sys.getsizeof, pool.values))
+        return size
@@ -0,0 +1,216 @@
+# scholar_analyzer/time_windows.py
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Periods per year for each supported granularity.
+GRANULARITIES = {'year': 1, 'quarter': 4, 'month': 12}
+
+WINDOW_METRICS = ('paper_count', 'citations', 'mean_citations', 'growth_rate',
+                  'citation_growth', 'h_index')
+
+# Citation histogram behind the moving h-index: one bin per count below
+# ``EXACT_CITATIONS`` and 10% wide geometric bins above, so the h-index of
+# any window is exact up to that count and a lower bound within 10% past it.
+EXACT_CITATIONS = 256
+_GROWTH = 1.1
+
+# Extra fields read for sub-year granularity, in order of preference.
+DATE_FIELDS = ('publication_date', 'date')
+
+
+class TimeWindowIndex:
+    """Prefix sums of papers, citations and citation histograms per period.
+
+    Row ``p`` of each prefix array holds the totals of periods before
+    ``p``, so any run of periods ``[s, e)`` is ``prefix[e] - prefix[s]``:
+    every window of every size costs the same two lookups regardless of
+    how many papers it covers.  Periods run densely from the first dated
+    period to the last.
+    """
+
+    def __init__(self, first: int, granularity: str, counts: np.ndarray,
+                 citations: np.ndarray, histogram: np.ndarray, edges: np.ndarray):
+        self.first = first
+        self.granularity = granularity
+        self.counts = counts
+        self.citations = citations
+        self.histogram = histogram
+        self.edges = edges
+
+    @classmethod
+    def from_table(cls, table, granularity: str = 'year') -> "TimeWindowIndex":
+        """Index a ``PaperTable`` by year, or by quarter or month from its dates.
+
+        Sub-year granularities read ``publication_date`` (or ``date``)
+        strings starting with ``YYYY-MM``; papers without one are left
+        out rather than guessed into a period.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+        per_year = GRANULARITIES[granularity]
+
+        if per_year == 1:
+            periods = table.years.astype(np.int64)
+        else:
+            months = _months(_date_column(table), len(table))
+            periods = np.where(months >= 0, months // (12 // per_year), 0)
+        return cls.from_periods(periods, table.citations, granularity)
+
+    @classmethod
+    def from_periods(cls, periods: np.ndarray, citations: np.ndarray,
+                     granularity: str = 'year') -> "TimeWindowIndex":
+        """Index papers by absolute period number; period 0 means undated."""
+        periods = np.asarray(periods, dtype=np.int64)
+        citations = np.asarray(citations, dtype=np.int64)
+        dated = periods > 0
+        periods, citations = periods[dated], citations[dated]
+
+        top = int(citations.max()) if len(citations) else 0
+        edges = _citation_edges(top)
+        if len(periods) == 0:
+            return cls(0, granularity, np.zeros(1, np.int64), np.zeros(1, np.int64),
+                       np.zeros((1, len(edges)), np.int64), edges)
+
+        first = int(periods.min())
+        offset = periods - first
+        n_periods = int(offset.max()) + 1
+        # Negative counts are treated as 0, as in ``Binning.counts``.
+        bins = np.searchsorted(edges, np.maximum(citations, 0), side='right') - 1
+        histogram = np.bincount(offset * len(edges) + bins,
+                                minlength=n_periods * len(edges))
+
+        def prefix(per_period: np.ndarray) -> np.ndarray:
+            totals = np.zeros((n_periods + 1,) + per_period.shape[1:], dtype=np.int64)
+            np.cumsum(per_period, axis=0, out=totals[1:])
+            return totals
+
+        return cls(
+            first, granularity,
+            prefix(np.bincount(offset, minlength=n_periods)),
+            prefix(np.bincount(offset, weights=citations, minlength=n_periods).astype(np.int64)),
+            prefix(histogram.reshape(n_periods, len(edges))),
+            edges,
+        )
+
+    def __len__(self) -> int:
+        """Number of periods covered."""
+        return len(self.counts) - 1
+
+    def windows(self, window_size: int, step: int = 1,
+                metrics: Sequence[str] = WINDOW_METRICS) -> List[Dict[str, Any]]:
+        """Metrics of every ``window_size``-period window, ``step`` periods apart.
+
+        Windows start at the first period; if the data spans fewer than
+        ``window_size`` periods there is a single window from the first
+        period.  Growth rates compare a window with the one just before it
+        and are None for windows that have no full predecessor.
+        """
+        if window_size < 1 or step < 1:
+            raise ValueError("Window size and step must be positive")
+        unknown = set(metrics) - set(WINDOW_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown window metrics: {sorted(unknown)}")
+        if len(self) == 0:
+            return []
+
+        starts = np.arange(0, max(len(self) - window_size, 0) + 1, step)
+        ends = np.minimum(starts + window_size, len(self))
+        counts = self.counts[ends] - self.counts[starts]
+        citations = self.citations[ends] - self.citations[starts]
+
+        values: Dict[str, np.ndarray] = {'paper_count': counts, 'citations': citations}
+        if 'mean_citations' in metrics:
+            values['mean_citations'] = citations / np.maximum(counts, 1)
+        if 'growth_rate' in metrics or 'citation_growth' in metrics:
+            previous = starts - window_size
+            valid = previous >= 0
+            previous = np.maximum(previous, 0)
+            for name, totals, current in (('growth_rate', self.counts, counts),
+                                          ('citation_growth', self.citations, citations)):
+                before = (totals[starts] - totals[previous]).astype(np.float64)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    rate = (current - before) / before
+                values[name] = np.where(valid & (before > 0), rate, np.nan)
+        if 'h_index' in metrics:
+            values['h_index'] = self.h_index(starts, ends)
+
+        periods = self.first + starts
+        last = self.first + ends - 1
+        # Year labels read '2020-2021'; sub-year ones '2020-11/2021-02'.
+        separator = '-' if self.granularity == 'year' else '/'
+        return [
+            {
+                'label': (self.label(begin) if begin == end
+                          else f"{self.label(begin)}{separator}{self.label(end)}"),
+                'start': self.label(begin),
+                'end': self.label(end),
+                'start_year': begin // GRANULARITIES[self.granularity],
+                'end_year': end // GRANULARITIES[self.granularity],
+                'metrics': {name: _plain(values[name][i]) for name in metrics},
+            }
+            for i, (begin, end) in enumerate(zip(periods.tolist(), last.tolist()))
+        ]
+
+    def h_index(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """h-index of the papers in each period range ``[start, end)``.
+
+        The tail sums of the window's citation histogram count papers
+        with at least ``edges[b]`` citations; the h-index is the largest
+        edge that many papers reach.
+        """
+        window = self.histogram[ends] - self.histogram[starts]
+        at_least = np.cumsum(window[:, ::-1], axis=1)[:, ::-1]
+        reached = np.sum(at_least >= self.edges, axis=1)
+        return self.edges[np.maximum(reached - 1, 0)]
+
+    def label(self, period: int) -> str:
+        """Readable name of an absolute period: ``2021``, ``2021-Q3`` or ``2021-07``."""
+        per_year = GRANULARITIES[self.granularity]
+        year, index = divmod(period, per_year)
+        if per_year == 1:
+            return str(year)
+        if per_year == 4:
+            return f"{year}-Q{index + 1}"
+        return f"{year}-{index + 1:02d}"
+
+
+def _citation_edges(top: int) -> np.ndarray:
+    """Lower bin edges: every count up to ``EXACT_CITATIONS``, then geometric."""
+    edges = [np.arange(EXACT_CITATIONS, dtype=np.int64)]
+    if top >= EXACT_CITATIONS:
+        steps = int(np.ceil(np.log(top / EXACT_CITATIONS + 1) / np.log(_GROWTH))) + 1
+        wide = np.ceil(EXACT_CITATIONS * _GROWTH ** np.arange(steps)).astype(np.int64)
+        edges.append(np.unique(wide))
+    return np.concatenate(edges)
+
+
+def _date_column(table) -> Optional[List[Any]]:
+    for field in DATE_FIELDS:
+        if field in table.extra:
+            return table.extra[field]
+    return None
+
+
+def _months(dates: Optional[List[Any]], n: int) -> np.ndarray:
+    """Absolute month (``year * 12 + month - 1``) of ``YYYY-MM`` dates, else -1."""
+    months = np.full(n, -1, dtype=np.int64)
+    if dates is None:
+        return months
+    for row, value in enumerate(dates):
+        if isinstance(value, str) and len(value) >= 7 and value[4] == '-':
+            try:
+                year, month = int(value[:4]), int(value[5:7])
+            except ValueError:
+                continue
+            if year > 0 and 1 <= month <= 12:
+                months[row] = year * 12 + month - 1
+    return months
+
+
+def _plain(value: Any) -> Any:
+    """JSON-friendly scalar: ints stay ints, NaN becomes None."""
+    if isinstance(value, np.integer):
+        return int(value)
+    value = float(value)
+    return None if np.isnan(value) else value
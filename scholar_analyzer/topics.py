@@ -0,0 +1,182 @@
+# scholar_analyzer/topics.py
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+from .leaderboard import top_k
+
+# Terms are runs of word characters of at least this length, as
+# ``statistics.js`` splits titles.
+MIN_TERM_LENGTH = 3
+
+# Separates documents in the joined text; it survives tokenization as a
+# token of its own and marks where each paper's terms start.
+_DOCUMENT_MARK = '\x00'
+
+# Punctuation, symbols, separators and control characters become spaces,
+# so a plain ``str.split`` yields the word tokens.
+_SEPARATORS = {
+    code: ' ' for code in range(0x3000)
+    if chr(code) not in (_DOCUMENT_MARK, '_')
+    and unicodedata.category(chr(code))[0] in 'PSZC'
+}
+
+STOP_WORDS = frozenset([
+    'the', 'and', 'for', 'with', 'from', 'via', 'using', 'towards', 'toward',
+    'into', 'its', 'our', 'are', 'not', 'new', 'based', 'study', 'analysis',
+    'approach', 'method', 'methods', 'paper', 'their', 'this', 'that', 'these',
+    'over', 'under', 'between', 'through', 'can', 'how', 'what', 'when',
+])
+
+TERM_METRICS = ('frequency', 'papers', 'citations', 'impact')
+
+
+class TopicIndex:
+    """Sparse term-document index over titles (and abstracts, if present).
+
+    ``counts`` is a papers x terms CSR matrix of term occurrences and
+    ``presence`` its 0/1 pattern.  Every text is tokenized exactly once;
+    term statistics, co-occurrence and yearly trends are then sparse
+    reductions and products over these two matrices.
+    """
+
+    def __init__(self, terms: List[str], counts: sp.csr_matrix,
+                 citations: np.ndarray, years: np.ndarray):
+        self.terms = terms
+        self.counts = counts
+        self.presence = counts.copy()
+        self.presence.data = np.ones_like(self.presence.data, dtype=np.float32)
+        self.citations = citations
+        self.years = years
+        self._stats: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def from_table(cls, table, stop_words: Iterable[str] = STOP_WORDS) -> "TopicIndex":
+        """Tokenize every paper of a ``PaperTable``."""
+        texts: Iterable[str] = table.titles
+        abstracts = table.extra.get('abstract')
+        if abstracts is not None:
+            texts = (f"{title} {abstract}" if isinstance(abstract, str) else title
+                     for title, abstract in zip(table.titles, abstracts))
+        return cls.from_texts(texts, table.citations, table.years, stop_words)
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], citations: np.ndarray,
+                   years: np.ndarray, stop_words: Iterable[str] = STOP_WORDS) -> "TopicIndex":
+        """Build the index from raw texts with matching citation and year columns.
+
+        All texts are joined, case-folded, stripped of punctuation and
+        split in a handful of whole-corpus string operations; per-text
+        Python work is limited to one dict lookup per token.
+        """
+        texts = list(texts)
+        joined = f' {_DOCUMENT_MARK} '.join(texts)
+        if joined.count(_DOCUMENT_MARK) != max(len(texts) - 1, 0):
+            joined = f' {_DOCUMENT_MARK} '.join(
+                text.replace(_DOCUMENT_MARK, ' ') for text in texts)
+        tokens = joined.lower().translate(_SEPARATORS).split()
+
+        vocabulary = {term: id_ for id_, term in enumerate(dict.fromkeys(tokens))}
+        ids = np.fromiter(map(vocabulary.__getitem__, tokens), dtype=np.int64,
+                          count=len(tokens))
+        terms = np.array(list(vocabulary), dtype=object)
+
+        # Short words, stop words and the document marks are dropped by ID.
+        lengths = np.fromiter(map(len, terms), dtype=np.int64, count=len(terms))
+        used = lengths >= MIN_TERM_LENGTH
+        used[[vocabulary[word] for word in stop_words if word in vocabulary]] = False
+        marks = ids == vocabulary.get(_DOCUMENT_MARK, -1)
+        docs = np.cumsum(marks)
+        keep = used[ids]
+
+        present = np.zeros(len(terms), dtype=bool)
+        present[ids[keep]] = True
+        remap = np.cumsum(present) - 1
+        counts = sp.csr_matrix(
+            (np.ones(int(keep.sum()), dtype=np.int32), (docs[keep], remap[ids[keep]])),
+            shape=(len(texts), int(present.sum())))
+        counts.sum_duplicates()
+        return cls(terms[present].tolist(), counts, np.asarray(citations), np.asarray(years))
+
+    def term_stats(self) -> Dict[str, np.ndarray]:
+        """Occurrences, papers, citations of those papers and mean citations per term."""
+        if self._stats is not None:
+            return self._stats
+        frequency = np.asarray(self.counts.sum(axis=0)).ravel().astype(np.int64)
+        papers = np.diff(self.presence.tocsc().indptr)
+        citations = np.rint(self.presence.T @ self.citations.astype(np.float64)).astype(np.int64)
+        impact = np.divide(citations, papers, out=np.zeros(len(papers)), where=papers > 0)
+        self._stats = {'frequency': frequency, 'papers': papers,
+                       'citations': citations, 'impact': impact}
+        return self._stats
+
+    def top_term_ids(self, n: int = 50, sort_by: str = 'frequency',
+                     min_papers: int = 1) -> np.ndarray:
+        """IDs of the ``n`` best terms by ``sort_by``, best first."""
+        if sort_by not in TERM_METRICS:
+            raise ValueError(f"Unsupported term metric: {sort_by}")
+        stats = self.term_stats()
+        ids = np.flatnonzero(stats['papers'] >= min_papers)
+        return ids[top_k(stats[sort_by][ids], n)]
+
+    def top_terms(self, n: int = 50, sort_by: str = 'frequency',
+                  min_papers: int = 1) -> List[Dict[str, Any]]:
+        """Term statistics for the ``n`` best terms."""
+        stats = self.term_stats()
+        ids = self.top_term_ids(n, sort_by, min_papers).tolist()
+        return [
+            {
+                'term': self.terms[id_],
+                'frequency': int(stats['frequency'][id_]),
+                'papers': int(stats['papers'][id_]),
+                'citations': int(stats['citations'][id_]),
+                'impact': float(stats['impact'][id_]),
+            }
+            for id_ in ids
+        ]
+
+    def cooccurrence(self, term_ids: np.ndarray, min_count: int = 1) -> List[Dict[str, Any]]:
+        """Number of papers shared by each pair of the given terms.
+
+        Computed as ``P.T @ P`` over the presence columns of ``term_ids``,
+        so only those terms' postings are touched.
+        """
+        columns = self.presence[:, term_ids]
+        shared = sp.triu(columns.T @ columns, k=1).tocoo()
+        keep = shared.data >= min_count
+        return [
+            {'source': self.terms[term_ids[i]], 'target': self.terms[term_ids[j]],
+             'value': int(value)}
+            for i, j, value in zip(shared.row[keep].tolist(), shared.col[keep].tolist(),
+                                   shared.data[keep].tolist())
+        ]
+
+    def trends(self, term_ids: np.ndarray) -> Dict[str, Dict[int, int]]:
+        """Papers per year containing each of the given terms."""
+        dated = np.flatnonzero(self.years != 0)
+        if len(dated) == 0:
+            return {self.terms[id_]: {} for id_ in term_ids.tolist()}
+        years, year_index = np.unique(self.years[dated], return_inverse=True)
+        by_year = sp.csr_matrix(
+            (np.ones(len(dated), dtype=np.float32), (year_index, dated)),
+            shape=(len(years), len(self.years)))
+        table = (by_year @ self.presence[:, term_ids]).toarray().astype(np.int64)
+        year_list = years.tolist()
+        return {
+            self.terms[id_]: {year: count for year, count in zip(year_list, column) if count}
+            for id_, column in zip(term_ids.tolist(), table.T.tolist())
+        }
+
+    def summary(self, n: int = 50, sort_by: str = 'frequency',
+                cooccurrence_terms: Optional[int] = None,
+                min_papers: int = 1) -> Dict[str, Any]:
+        """Top terms with their co-occurrence network and yearly trends."""
+        ids = self.top_term_ids(n, sort_by, min_papers)
+        related = ids if cooccurrence_terms is None else ids[:cooccurrence_terms]
+        return {
+            'top_terms': self.top_terms(n, sort_by, min_papers),
+            'cooccurrence': self.cooccurrence(related),
+            'trends': self.trends(ids),
+        }
@@ -5,10 +5,14 @@ from typing import Dict, Any
 from pyecharts import options as opts
 from pyecharts.charts import Line, Bar, Scatter, Graph
 from pyecharts.globals import ThemeType
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Sequence, Union
 
+import numpy as np
 import pyecharts
 
+from ..histogram import Binning
+from ..leaderboard import leaderboard
+
 class ChartGenerator:
     def __init__(self, theme: ThemeType = ThemeType.LIGHT):
         self.theme = theme
@@ -114,8 +118,19 @@ class ChartGenerator:
         )
         return c.render_embed()
 
-    def generate_citation_chart(self, data: Dict[str, int]) -> str:
-        """Generate citation distribution chart."""
+    def generate_citation_chart(self, data: Union[Mapping[str, int], Sequence[int]],
+                                bins: Any = None, log_scale: bool = False) -> str:
+        """Generate citation distribution chart.
+
+        ``data`` is either a label -> count mapping that is already binned,
+        or raw citation counts, which are binned with ``bins`` (any spec
+        accepted by ``Binning.resolve``).  ``log_scale`` puts the counts on
+        a log axis, which suits fine log bins over heavy-tailed corpora.
+        """
+        if not isinstance(data, Mapping):
+            values = np.asarray(data, dtype=np.int64)
+            data = Binning.resolve(bins, values).histogram(values)
+
         x_data = list(data.keys())
         y_data = list(data.values())
 
@@ -127,17 +142,22 @@ class ChartGenerator:
                 title_opts=opts.TitleOpts(title="Citation Distribution"),
                 xaxis_opts=opts.AxisOpts(
                     axislabel_opts=opts.LabelOpts(rotate=45)),
+                yaxis_opts=opts.AxisOpts(type_="log" if log_scale else "value"),
                 datazoom_opts=[opts.DataZoomOpts()],
             )
         )
         return c.render_embed()
 
-    def generate_venue_chart(self, data: Dict[str, int]) -> str:
-        """Generate venue distribution chart."""
-        items = sorted(data.items(), key=lambda x: x[1], reverse=True)[
-            :10]  # Top 10 venues
-        venues = [item[0] for item in items]
-        counts = [item[1] for item in items]
+    def generate_venue_chart(self, data: Dict[str, int], top: int = 10) -> str:
+        """Generate venue distribution chart.
+
+        The ``top`` venues get their own slice and the rest share an
+        "Other" slice; only those venues are ranked, not the whole dict.
+        """
+        entries = leaderboard(list(data), np.fromiter(data.values(), dtype=np.int64,
+                                                      count=len(data)), top)
+        venues = [entry['name'] for entry in entries]
+        counts = [entry['count'] for entry in entries]
 
         c = (
             Pie(init_opts=opts.InitOpts(theme=self.theme))
@@ -152,3 +172,27 @@ class ChartGenerator:
             )
         )
         return c.render_embed()
+
+    def generate_network_chart(self, nodes: List[Dict[str, Any]],
+                               links: List[Dict[str, Any]]) -> str:
+        """Generate collaboration network chart.
+
+        Nodes are drawn with their ``symbolSize``, so sizing by paper
+        count or a centrality is decided by whoever builds the nodes.
+        """
+        c = (
+            Graph(init_opts=opts.InitOpts(theme=self.theme))
+            .add(
+                series_name="Collaborations",
+                nodes=nodes,
+                links=links,
+                layout="force",
+                repulsion=100,
+                is_draggable=True,
+                label_opts=opts.LabelOpts(is_show=False),
+            )
+            .set_global_opts(
+                title_opts=opts.TitleOpts(title="Collaboration Network"),
+            )
+        )
+        return c.render_embed()
@@ -1,24 +1,85 @@
 # scholar_analyzer/web.py
 
 import os
-from typing import Dict, Any
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, Optional
 from pathlib import Path
 from flask import Flask, render_template, jsonify, request, send_file, current_app
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
+from . import serialization
 from .analyzer import ScholarAnalyzer
 
 
+class JSONProvider(DefaultJSONProvider):
+    """Flask's JSON (``jsonify``, ``request.get_json``, ``tojson``) through
+    ``serialization``.
+
+    Responses are compact; setting ``app.json.compact = False`` indents
+    them.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return serialization.dumps(obj, indent=kwargs.get('indent'),
+                                   sort_keys=kwargs.get('sort_keys', False))
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return serialization.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if self.compact is False else None
+        return self._app.response_class(serialization.dumpb(obj, indent=indent),
+                                        mimetype=self.mimetype)
+
+
+class AnalysisStore:
+    """Analyzers of recent ``/api/analyze`` requests, keyed by analysis id.
+
+    Follow-up lookups such as author suggestions name the analysis they
+    belong to, so concurrent clients never read each other's data.
+    Beyond ``capacity`` the least recently used analysis is dropped.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._analyzers: "OrderedDict[str, ScholarAnalyzer]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, analyzer: ScholarAnalyzer) -> str:
+        """Keep ``analyzer`` and return its new analysis id."""
+        analysis_id = uuid.uuid4().hex
+        with self._lock:
+            self._analyzers[analysis_id] = analyzer
+            while len(self._analyzers) > self.capacity:
+                self._analyzers.popitem(last=False)
+        return analysis_id
+
+    def get(self, analysis_id: Optional[str]) -> Optional[ScholarAnalyzer]:
+        """The analyzer for ``analysis_id``, or None if unknown or expired."""
+        with self._lock:
+            analyzer = self._analyzers.get(analysis_id)
+            if analyzer is not None:
+                self._analyzers.move_to_end(analysis_id)
+        return analyzer
+
+
 def create_app(test_config=None):
     """Create and configure the Flask application."""
     app = Flask(__name__,
                 static_folder='static',
                 template_folder='templates')
+    app.json = JSONProvider(app)
 
     # Load default configuration
     app.config.from_mapping(
         SECRET_KEY='dev',
         UPLOAD_FOLDER=os.path.join(app.instance_path, 'uploads'),
-        MAX_CONTENT_LENGTH=16 * 1024 * 1024  # 16MB max file size
+        MAX_CONTENT_LENGTH=16 * 1024 * 1024,  # 16MB max file size
+        MAX_ANALYSES=16  # analyses kept for follow-up lookups
     )
 
     if test_config is None:
@@ -28,6 +89,11 @@ def create_app(test_config=None):
         # Load the test config if passed in
         app.config.update(test_config)
 
+    # Analyzers of recent /api/analyze requests; follow-up lookups such
+    # as author suggestions and leaderboards name one by its id instead
+    # of re-sending the papers.
+    app.extensions['scholar_analyzer'] = AnalysisStore(app.config['MAX_ANALYSES'])
+
     # Ensure the instance folder exists
     try:
         os.makedirs(app.instance_path)
@@ -41,38 +107,85 @@ def create_app(test_config=None):
 
     @app.route('/api/analyze', methods=['POST'])
     def analyze():
-        """Analyze scholar data."""
+        """Analyze scholar data, restricted to the request's ``filters`` if any.
+
+        The data is either the JSON body or an uploaded ``file`` (a JSON
+        document, or JSON Lines as ``.jsonl``/``.jsonl.gz``) with the
+        options as form fields, ``filters`` JSON-encoded.  With
+        ``deduplicate`` set, near-duplicate papers are merged first.
+
+        The response's ``analysis_id`` names the analyzer for
+        ``/api/filters/authors`` and ``/api/leaderboard``; its author prefix index is built here
+        so that suggestions never pay for it on a keystroke.
+        """
+        upload = request.files.get('file')
+        try:
+            if upload is not None:
+                analyzer = _analyze_upload(
+                    upload, app.config['UPLOAD_FOLDER'],
+                    deduplicate=request.form.get('deduplicate', '').lower() in ('1', 'true', 'on'))
+                filters = serialization.loads(request.form.get('filters') or 'null')
+            else:
+                data = request.get_json() or {}
+                analyzer = ScholarAnalyzer(data, deduplicate=bool(data.get('deduplicate')))
+                filters = data.get('filters')
+
+            # Perform analysis
+            results = analyzer.analyze(filters)
+            analyzer.prepare_author_suggestions()
+            results['analysis_id'] = app.extensions['scholar_analyzer'].add(analyzer)
+            return jsonify(results)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 400
+
+    @app.route('/api/authors', methods=['POST'])
+    def author_metrics():
+        """Citation metrics (h-index, g-index, i10) for every author."""
         data = request.get_json()
+        analyzer = ScholarAnalyzer(data)
+
+        try:
+            limit = request.args.get('limit', type=int)
+            authors = analyzer.author_metrics(
+                sort_by=request.args.get('sort', 'h_index'), limit=limit)
+            return jsonify({'authors': authors})
+        except Exception as e:
+            return jsonify({'error': str(e)}), 400
 
-        # Initialize analyzer with data
+    @app.route('/api/topics', methods=['POST'])
+    def topics():
+        """Top title terms with co-occurrence and yearly trends."""
+        data = request.get_json()
         analyzer = ScholarAnalyzer(data)
 
-        # Perform analysis
         try:
-            results = analyzer.analyze()
+            results = analyzer.analyze_topics(
+                top=request.args.get('limit', 50, type=int),
+                sort_by=request.args.get('sort', 'frequency'))
             return jsonify(results)
         except Exception as e:
             return jsonify({'error': str(e)}), 400
 
     @app.route('/api/export/<format>', methods=['POST'])
     def export(format):
-        """Export data in specified format."""
+        """Export data in specified format, only papers matching ``filters`` if given."""
         if format not in ['csv', 'json', 'bibtex']:
             return jsonify({'error': 'Invalid export format'}), 400
 
         data = request.get_json()
         analyzer = ScholarAnalyzer(data)
+        filters = (data or {}).get('filters')
 
         # Create temporary file for export
         output_path = os.path.join(app.instance_path, f'export.{format}')
 
         try:
             if format == 'csv':
-                analyzer.export_to_csv(output_path)
+                analyzer.export_to_csv(output_path, filters)
             elif format == 'json':
-                analyzer.export_to_json(output_path)
+                analyzer.export_to_json(output_path, filters)
             elif format == 'bibtex':
-                analyzer.export_to_bibtex(output_path)
+                analyzer.export_to_bibtex(output_path, filters)
 
             return send_file(
                 output_path,
@@ -92,4 +205,42 @@ def create_app(test_config=None):
             'authors': []  # List of available authors
         })
 
+    @app.route('/api/filters/authors', methods=['GET'])
+    def author_suggestions():
+        """Authors matching the typed prefix ``q`` in the analysis ``analysis``."""
+        analyzer = app.extensions['scholar_analyzer'].get(request.args.get('analysis'))
+        if analyzer is None:
+            return jsonify({'error': 'Unknown or expired analysis'}), 404
+        suggestions = analyzer.author_suggestions(
+            request.args.get('q', ''), limit=request.args.get('limit', 10, type=int))
+        return jsonify({'suggestions': suggestions})
+
+    @app.route('/api/leaderboard/<kind>', methods=['GET'])
+    def leaderboard(kind):
+        """Top venues, authors or terms of the analysis ``analysis``, plus an "Other" entry."""
+        analyzer = app.extensions['scholar_analyzer'].get(request.args.get('analysis'))
+        if analyzer is None:
+            return jsonify({'error': 'Unknown or expired analysis'}), 404
+        try:
+            entries = analyzer.leaderboard(
+                kind, limit=request.args.get('limit', 10, type=int),
+                metric=request.args.get('sort'))
+            return jsonify({'leaderboard': entries})
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
     return app
+
+
+def _analyze_upload(upload, folder: str, **options: Any) -> ScholarAnalyzer:
+    """Load an uploaded corpus file; its suffix selects the parser."""
+    name = secure_filename(upload.filename or '')
+    suffix = ''.join(Path(name).suffixes[-2:]) or '.json'
+    os.makedirs(folder, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=folder)
+    os.close(fd)
+    try:
+        upload.save(path)
+        return ScholarAnalyzer.from_file(path, **options)
+    finally:
+        os.remove(path)
@@ -46,6 +46,7 @@ setup(
             for line in open('requirements-docs.txt')
             if not line.startswith('#')
         ],
+        'fast': ['orjson>=3.6.0'],
     },
     entry_points={
         'console_scripts': [
@@ -0,0 +1,61 @@
+# test_aggregation.py
+import pytest
+from scholar_analyzer.aggregation import PaperAggregator, CITATION_RANGES
+from scholar_analyzer.analyzer import ScholarAnalyzer
+
+
+class TestAggregation:
+    @pytest.fixture
+    def papers(self):
+        """Papers covering every citation bucket boundary."""
+        return [
+            {"year": 2020, "venue": "A", "citations": 0},
+            {"year": 2020, "venue": "A", "citations": 10},
+            {"year": 2021, "venue": "B", "citations": 11},
+            {"year": 2019, "venue": "B", "citations": 100},
+            {"year": 2019, "venue": "B", "citations": 500},
+            {"year": None, "citations": 501},
+            {"title": "No fields"},
+        ]
+
+    def test_results_shape(self, papers):
+        """Test that fused results match the per-analysis output shapes."""
+        results = PaperAggregator.from_papers(papers).results()
+
+        assert list(results["yearly_data"].items()) == [
+            (2019, 2), (2020, 2), (2021, 1)
+        ]
+        assert list(results["citation_data"]) == list(CITATION_RANGES)
+        assert results["citation_data"] == {
+            '0': 2, '1-10': 1, '11-50': 1,
+            '51-100': 1, '101-500': 1, '500+': 1
+        }
+        assert list(results["venue_data"].items()) == [("B", 3), ("A", 2)]
+        assert results["metrics"] == {
+            "total_papers": 7,
+            "total_citations": 1122,
+            "unique_venues": 3
+        }
+
+    def test_incremental_update(self, papers):
+        """Test that updating in pieces matches a single pass."""
+        aggregator = PaperAggregator()
+        aggregator.update(papers[:3])
+        aggregator.update(iter(papers[3:]))
+
+        assert aggregator.results() == PaperAggregator.from_papers(papers).results()
+
+    def test_empty(self):
+        """Test aggregation over no papers."""
+        results = PaperAggregator.from_papers([]).results()
+
+        assert results["yearly_data"] == {}
+        assert sum(results["citation_data"].values()) == 0
+        assert results["metrics"]["total_papers"] == 0
+
+    def test_analyzer_uses_fused_pass(self, sample_data):
+        """Test analyzer output is produced by the aggregator."""
+        analyzer = ScholarAnalyzer(sample_data)
+
+        assert analyzer._perform_analysis() == \
+            PaperAggregator.from_papers(sample_data["papers"]).results()
@@ -0,0 +1,109 @@
+# test_aliases.py
+import pytest
+from scholar_analyzer.aliases import AuthorAliases, parse_name
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.table import PaperTable
+
+
+@pytest.fixture
+def papers():
+    return [
+        {"title": "A", "authors": ["John Smith", "Michael Jordan"], "year": 2020, "citations": 9},
+        {"title": "B", "authors": ["Smith, John", "Jane Doe"], "year": 2021, "citations": 4},
+        {"title": "C", "authors": ["J. Smith", "Micheal Jordan"], "year": 2022, "citations": 2},
+        {"title": "D", "authors": ["John Smith", "Smith, John"], "year": 2022, "citations": 1},
+        {"title": "E", "authors": ["Jane Smith", "José García"], "year": 2023, "citations": 0},
+        {"title": "F", "authors": ["Jose Garcia", "Michael Jordan"], "year": 2023, "citations": 5},
+    ]
+
+
+class TestParseName:
+    @pytest.mark.parametrize("name, expected", [
+        ("John Smith", ("smith", ("john",))),
+        ("Smith, John", ("smith", ("john",))),
+        ("J. A. Smith", ("smith", ("j", "a"))),
+        ("Smith JA", ("smith", ("j", "a"))),
+        ("Ludwig van Beethoven", ("van beethoven", ("ludwig",))),
+        ("José García", ("garcia", ("jose",))),
+        ("Madonna", ("madonna", ())),
+    ])
+    def test_forms(self, name, expected):
+        assert parse_name(name) == expected
+
+
+class TestAuthorAliases:
+    def test_variants_merge(self):
+        """Test reordered, abbreviated, accented and misspelled names merge."""
+        aliases = AuthorAliases()
+        aliases.update(["John Smith", "Smith, John", "J. Smith", "Michael Jordan",
+                        "Micheal Jordan", "José García", "Jose Garcia"],
+                       [5, 2, 1, 9, 1, 1, 2])
+        assert {aliases.canonical(name) for name in
+                ["John Smith", "Smith, John", "J. Smith"]} == {"John Smith"}
+        assert aliases.canonical("Micheal Jordan") == "Michael Jordan"
+        assert aliases.canonical("José García") == "Jose Garcia"
+
+    def test_ambiguous_names_kept_apart(self):
+        """Test different first names, middle initials and ambiguous initials."""
+        aliases = AuthorAliases()
+        aliases.update(["John Smith", "Jane Smith", "J. Smith", "Jon Smith",
+                        "Ann B. Lee", "Ann C. Lee", "Ann Lee"])
+        assert len({aliases.canonical(name) for name in
+                    ["John Smith", "Jane Smith", "J. Smith", "Jon Smith"]}) == 4
+        assert len({aliases.canonical(name) for name in
+                    ["Ann B. Lee", "Ann C. Lee", "Ann Lee"]}) == 3
+
+    @pytest.mark.parametrize("first, second", [
+        ("Christian Smith", "Christina Smith"),
+        ("Daniel Lee", "Daniela Lee"),
+        ("Maria Rossi", "Mario Rossi"),
+    ])
+    def test_distinct_people_one_edit_apart(self, first, second):
+        """Test edits at the end of a first name never merge two people."""
+        aliases = AuthorAliases()
+        aliases.update([first, second])
+        assert aliases.canonical(first) == first
+        assert aliases.canonical(second) == second
+
+    def test_typo_links_do_not_chain(self):
+        """Test a name one typo from two others merges with neither."""
+        aliases = AuthorAliases()
+        aliases.update(["Karen Wu", "Karin Wu", "Karon Wu", "Jonathan Wu", "Jonathon Wu"],
+                       [1, 1, 1, 3, 1])
+        assert len({aliases.canonical(name) for name in
+                    ["Karen Wu", "Karin Wu", "Karon Wu"]}) == 3
+        assert aliases.canonical("Jonathon Wu") == "Jonathan Wu"
+
+    def test_persisted_table(self, tmp_path):
+        """Test a saved table keeps its mapping and absorbs new variants."""
+        path = tmp_path / "aliases.json"
+        aliases = AuthorAliases()
+        aliases.update(["Grace Hopper", "G. Hopper"], [3, 1])
+        aliases.save(path)
+
+        loaded = AuthorAliases.load(path)
+        assert loaded.aliases == aliases.aliases
+        assert loaded.update(["Hopper, Grace", "Grace Hopper"], [50, 1]) == 1
+        assert loaded.canonical("Hopper, Grace") == "Grace Hopper"
+
+    def test_apply_to_table(self, papers):
+        """Test author IDs are remapped and repeated slots dropped."""
+        table = PaperTable.from_papers(papers)
+        assert AuthorAliases().apply(table) == 3
+        assert table.paper_authors(1) == ["John Smith", "Jane Doe"]
+        assert table.paper_authors(3) == ["John Smith"]
+        assert table.paper_authors(5) == ["José García", "Michael Jordan"]
+        # "J. Smith" could be John or Jane Smith.
+        assert table.paper_authors(2) == ["J. Smith", "Michael Jordan"]
+
+
+class TestAnalyzerAliases:
+    def test_network_and_metrics_use_canonical_names(self, papers, tmp_path):
+        """Test the analyzer counts each person once and saves the table."""
+        path = tmp_path / "aliases.json"
+        analyzer = ScholarAnalyzer({"papers": papers}, author_aliases=str(path))
+        metrics = {row["author"]: row for row in analyzer.author_metrics()}
+        assert metrics["John Smith"]["papers"] == 3
+        assert "Smith, John" not in metrics
+        assert path.exists()
+        assert AuthorAliases.load(path).canonical("Smith, John") == "John Smith"
@@ -0,0 +1,76 @@
+# test_authors.py
+import random
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.authors import AuthorIndex
+from scholar_analyzer.table import PaperTable
+
+
+def reference_metrics(citations):
+    """Straightforward per-author definitions to check the bulk pass against."""
+    ranked = sorted(citations, reverse=True)
+    h = sum(1 for rank, c in enumerate(ranked, 1) if c >= rank)
+    g, total = 0, 0
+    for rank, c in enumerate(ranked, 1):
+        total += c
+        if total >= rank * rank:
+            g = rank
+    return {'papers': len(ranked), 'citations': sum(ranked), 'h_index': h,
+            'g_index': g, 'i10_index': sum(1 for c in ranked if c >= 10)}
+
+
+class TestAuthorIndex:
+    def test_matches_reference(self):
+        """Test bulk metrics match per-author computations."""
+        rng = random.Random(7)
+        papers = [
+            {"title": f"Paper {i}",
+             "authors": rng.sample([f"Author {a}" for a in range(30)], rng.randint(1, 5)),
+             "citations": rng.choice([0, 1, 2, 5, 9, 10, 14, 40, 300])}
+            for i in range(300)
+        ]
+        table = PaperTable.from_papers(papers)
+        records = AuthorIndex.from_table(table).records(table.authors.values)
+
+        for record in records:
+            cited = [p["citations"] for p in papers if record["author"] in p["authors"]]
+            expected = reference_metrics(cited)
+            assert {k: v for k, v in record.items() if k != "author"} == expected
+        assert len(records) == 30
+
+    def test_postings_sorted(self):
+        """Test an author's papers come most cited first, once each."""
+        table = PaperTable.from_papers([
+            {"title": "A", "authors": ["Ann"], "citations": 3},
+            {"title": "B", "authors": ["Ann", "Ann"], "citations": 8},
+            {"title": "C", "authors": ["Bob"], "citations": 1},
+        ])
+        index = AuthorIndex.from_table(table)
+        assert index.papers(table.authors.lookup("Ann")).tolist() == [1, 0]
+        assert index.metrics()["papers"].tolist() == [2, 1]
+
+    def test_sorting_and_limit(self, sample_data):
+        """Test records are ranked by the chosen metric and truncated."""
+        analyzer = ScholarAnalyzer(sample_data)
+        records = analyzer.author_metrics(sort_by="citations", limit=2)
+        assert len(records) == 2
+        assert records[0]["citations"] >= records[1]["citations"]
+        with pytest.raises(ValueError):
+            analyzer.author_metrics(sort_by="fame")
+
+    def test_refreshes_after_changes(self, sample_data):
+        """Test metrics follow papers added to the analyzer."""
+        analyzer = ScholarAnalyzer(sample_data)
+        analyzer.author_metrics()
+        analyzer.add_papers([{"title": "New", "authors": ["Newcomer"], "citations": 12}])
+        newcomer = [r for r in analyzer.author_metrics() if r["author"] == "Newcomer"]
+        assert newcomer[0]["i10_index"] == 1
+
+    def test_api_endpoint(self, app, sample_data):
+        """Test the authors endpoint serves the metrics."""
+        response = app.test_client().post("/api/authors?limit=3&sort=g_index",
+                                          json=sample_data)
+        assert response.status_code == 200
+        authors = response.get_json()["authors"]
+        assert 0 < len(authors) <= 3
+        assert all(a["g_index"] >= a["h_index"] for a in authors)
@@ -0,0 +1,85 @@
+# test_autocomplete.py
+import numpy as np
+import pytest
+from scholar_analyzer import autocomplete
+from scholar_analyzer.autocomplete import AuthorPrefixIndex
+from scholar_analyzer.web import AnalysisStore
+
+
+@pytest.fixture
+def names():
+    return ["John Smith", "Jane Smithson", "Ada Lovelace", "Alan Turing",
+            "Smita Patel", "Grace Hopper", "Unused Author"]
+
+
+@pytest.fixture
+def index(names):
+    return AuthorPrefixIndex.from_names(names, np.array([5, 9, 3, 7, 2, 4, 0]))
+
+
+def brute_force(names, counts, prefix, limit):
+    prefix = " ".join(prefix.lower().split())
+    matches = [(-count, name) for name, count in zip(names, counts) if count and any(
+        " ".join(name.lower().split()[i:]).startswith(prefix)
+        for i in range(len(name.split())))]
+    return [name for _, name in sorted(matches, key=lambda m: (m[0], m[1].casefold()))[:limit]]
+
+
+class TestAuthorPrefixIndex:
+    def test_ranked_by_paper_count(self, index):
+        """Test matches on any name word, most papers first."""
+        assert [s["name"] for s in index.suggest("smi")] == [
+            "Jane Smithson", "John Smith", "Smita Patel"]
+        assert index.suggest("SMITH", limit=1) == [{"name": "Jane Smithson", "count": 9}]
+
+    def test_case_whitespace_and_empty(self, index):
+        """Test folding of case and whitespace, and prefixes without matches."""
+        assert [s["name"] for s in index.suggest("  john   s")] == ["John Smith"]
+        assert index.suggest("") == []
+        assert index.suggest("zzz") == []
+        assert index.suggest("unused") == []
+
+    def test_heavy_prefixes_match_brute_force(self, monkeypatch):
+        """Test precomputed and per-query rankings agree with a scan."""
+        monkeypatch.setattr(autocomplete, "HEAVY_RANGE", 8)
+        rng = np.random.default_rng(0)
+        first = ["ann", "andy", "bob", "bea", "carl"]
+        last = ["anders", "baker", "bell", "cole", "andrews"]
+        names = [f"{rng.choice(first)} {rng.choice(last)} {i}" for i in range(300)]
+        counts = rng.integers(0, 40, len(names))
+        index = AuthorPrefixIndex.from_names(names, counts, limit=5)
+        assert len(index._heavy) > 1
+        for prefix in ["a", "an", "and", "b", "be", "bell", "ann a", "1", "c"]:
+            for limit in (3, 5, 12):
+                result = index.suggest(prefix, limit)
+                assert [s["name"] for s in result] == brute_force(names, counts, prefix, limit)
+
+    def test_api_route(self, app, sample_data):
+        """Test suggestions come from the analysis named in the request."""
+        client = app.test_client()
+        first = client.post("/api/analyze", json=sample_data).get_json()["analysis_id"]
+        second = client.post("/api/analyze", json={"papers": [
+            {"title": "Other", "authors": ["Author Tau"], "year": 2020, "venue": "V",
+             "citations": 0}]}).get_json()["analysis_id"]
+
+        response = client.get(f"/api/filters/authors?analysis={first}&q=author%20t")
+        assert response.status_code == 200
+        assert [s["name"] for s in response.get_json()["suggestions"]] == [
+            "Author Three", "Author Two"]
+        response = client.get(f"/api/filters/authors?analysis={second}&q=author%20t")
+        assert [s["name"] for s in response.get_json()["suggestions"]] == ["Author Tau"]
+        assert client.get("/api/filters/authors?q=author").status_code == 404
+
+    def test_index_built_by_analyze(self, app, sample_data):
+        """Test the prefix index exists before the first keystroke."""
+        client = app.test_client()
+        analysis_id = client.post("/api/analyze", json=sample_data).get_json()["analysis_id"]
+        analyzer = app.extensions["scholar_analyzer"].get(analysis_id)
+        assert analyzer._author_prefixes is not None
+
+    def test_store_drops_least_recent(self):
+        store = AnalysisStore(capacity=2)
+        first, second = store.add("a"), store.add("b")
+        store.get(first)
+        store.add("c")
+        assert store.get(first) == "a" and store.get(second) is None
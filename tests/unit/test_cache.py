@@ -0,0 +1,75 @@
+# test_cache.py
+import json
+import time
+import pytest
+from scholar_analyzer import cli
+from scholar_analyzer.cache import AnalysisCache
+from scholar_analyzer.cli import process_query
+
+
+class TestAnalysisCache:
+    @pytest.fixture
+    def cache(self, temp_output_dir):
+        return AnalysisCache(temp_output_dir / "cache")
+
+    def test_key_depends_on_content_and_options(self, cache, workflow_setup):
+        """Test keys change with the input content and the options."""
+        input_file, _ = workflow_setup
+        key = cache.make_key(input_file, {"format": "html"})
+
+        assert key == cache.make_key(input_file, {"format": "html"})
+        assert key != cache.make_key(input_file, {"format": "csv"})
+
+        time.sleep(0.01)
+        input_file.write_text(json.dumps({"papers": []}))
+        assert key != cache.make_key(input_file, {"format": "html"})
+
+    def test_round_trip(self, cache, temp_output_dir):
+        """Test stored files are restored into another directory."""
+        source = temp_output_dir / "analysis.json"
+        source.write_text('{"a": 1}')
+        cache.put("key", [source])
+
+        restored = cache.get("key", temp_output_dir / "restored")
+        assert [path.name for path in restored] == ["analysis.json"]
+        assert restored[0].read_text() == '{"a": 1}'
+        assert cache.get("missing", temp_output_dir) is None
+
+    def test_lru_eviction(self, temp_output_dir):
+        """Test least recently used entries are evicted past the size bound."""
+        cache = AnalysisCache(temp_output_dir / "cache", max_bytes=250)
+        source = temp_output_dir / "payload.txt"
+        source.write_text("x" * 100)
+
+        cache.put("first", [source])
+        time.sleep(0.01)
+        cache.put("second", [source])
+        time.sleep(0.01)
+        assert cache.get("first", temp_output_dir / "out") is not None
+        time.sleep(0.01)
+        cache.put("third", [source])
+
+        assert cache.get("first", temp_output_dir / "out") is not None
+        assert cache.get("second", temp_output_dir / "out") is None
+        assert cache.get("third", temp_output_dir / "out") is not None
+
+    def test_process_query_hit(self, workflow_setup, monkeypatch):
+        """Test an unchanged input is served without re-running the analysis."""
+        input_file, output_dir = workflow_setup
+        cache_dir = output_dir / "cache"
+
+        first = process_query("test query", output_dir / "first", input_file,
+                              cache_dir=cache_dir)
+        assert first["success"] and not first["cached"]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("analysis should not run on a cache hit")
+
+        monkeypatch.setattr(cli, "ScholarAnalyzer", fail)
+        second = process_query("test query", output_dir / "second", input_file,
+                               cache_dir=cache_dir)
+
+        assert second["success"] and second["cached"]
+        for name in ["analysis.json", "report.html", "output.html"]:
+            assert (output_dir / "second" / name).read_bytes() == \
+                (output_dir / "first" / name).read_bytes()
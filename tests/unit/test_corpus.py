@@ -0,0 +1,154 @@
+# test_corpus.py
+import csv
+import json
+import click.testing
+import numpy as np
+import pytest
+from scholar_analyzer.aggregation import PaperAggregator
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.cli import cli
+from scholar_analyzer.corpus import is_corpus, load_corpus, save_corpus
+from scholar_analyzer.filter_index import FilterIndex, FilterPlan, FilterScan
+from scholar_analyzer.reader import read_csv
+from scholar_analyzer.table import JsonColumn, PaperTable
+
+
+@pytest.fixture
+def papers():
+    return [
+        {"title": "Graphs – a survey", "authors": ["Ada", "Bob"], "year": 2020,
+         "venue": "AI", "citations": 7, "url": "https://a", "abstract": "graph methods"},
+        {"title": "B", "authors": [], "citations": 0, "keywords": ["x", {"y": 1}]},
+        {"title": "C", "authors": ["Bob", "Émile"], "year": 2021, "venue": "DB",
+         "citations": 2, "url": None},
+    ]
+
+
+class TestCorpus:
+    def test_round_trip(self, papers, tmp_path):
+        """Test every field, missing extras and the document survive."""
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers), path, {"metadata": {"query": "q"}})
+        assert is_corpus(path) and not is_corpus(tmp_path)
+        table, document = load_corpus(path)
+        assert table.to_records() == papers
+        assert document == {"metadata": {"query": "q"}}
+        assert table.years.dtype == np.int32
+        assert isinstance(table.extra["url"], JsonColumn)
+
+    def test_loaded_table_stays_editable(self, papers, tmp_path):
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers), path)
+        table, _ = load_corpus(path)
+        table.append([{"title": "D", "authors": ["Ada"], "url": "https://d"}])
+        table.delete([0])
+        assert [paper["title"] for paper in table.to_records()] == ["B", "C", "D"]
+        assert table.record(2)["url"] == "https://d"
+        assert list(table.extra["url"])[1] is None
+
+    def test_overwrite(self, papers, tmp_path):
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers), path)
+        with pytest.raises(FileExistsError):
+            save_corpus(PaperTable.from_papers(papers[:1]), path)
+        save_corpus(PaperTable.from_papers(papers[:1]), path, overwrite=True)
+        assert len(load_corpus(path)[0]) == 1
+        (tmp_path / "other").mkdir()
+        with pytest.raises(FileExistsError):
+            save_corpus(PaperTable.from_papers(papers), tmp_path / "other", overwrite=True)
+
+    def test_read_csv(self, tmp_path):
+        """Test exports read back, with ``;`` or ``,`` separated authors."""
+        path = tmp_path / "papers.csv"
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Title", "Authors", "Year", "Venue", "Citations", "DOI"])
+            writer.writerow(["A", "Ada, Bob", "2020", "AI", "3", "10.1/a"])
+            writer.writerow(["B", "Smith, J.; Doe, J.", "", "", "", ""])
+        table = PaperTable.from_stream(read_csv(path))
+        assert table.to_records() == [
+            {"title": "A", "authors": ["Ada", "Bob"], "year": 2020, "venue": "AI",
+             "citations": 3, "doi": "10.1/a"},
+            {"title": "B", "authors": ["Smith, J.", "Doe, J."], "citations": 0}]
+
+
+class TestMappedCorpus:
+    def test_open_is_mapped_and_lazy(self, papers, tmp_path):
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers), path)
+        table, _ = load_corpus(path)
+        assert table.is_mapped and isinstance(table.titles.buffer, np.memmap)
+        assert "values" not in vars(table.authors)
+        assert table.authors.values == ["Ada", "Bob", "Émile"]
+        assert not load_corpus(path, mmap=False)[0].is_mapped
+
+    def test_edits_never_reach_the_files(self, papers, tmp_path):
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers), path)
+        before = {file.name: file.read_bytes() for file in path.iterdir()}
+        table, _ = load_corpus(path)
+        table.citations[:] = 99
+        table.append([{"title": "D", "authors": ["Cy"]}])
+        table.delete([1])
+        assert [paper["citations"] for paper in table.to_records()] == [99, 99, 0]
+        assert {file.name: file.read_bytes() for file in path.iterdir()} == before
+        assert load_corpus(path)[0].to_records() == papers
+
+    @pytest.mark.parametrize("filters", [
+        {"year_range": {"start": 2021}},
+        {"citations": {"min": 1, "max": 5}},
+        {"venues": ["AI", "unknown"]},
+        {"venue_pattern": "^D"},
+        {"authors": "Bob", "keywords": ["c"]},
+        {"author": "é", "citations": {"max": 10}},
+        {"keywords": ["graph"]},
+    ])
+    def test_scan_matches_plan(self, papers, tmp_path, filters):
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers * 3), path)
+        table, _ = load_corpus(path)
+        expected = FilterPlan.from_config(FilterIndex(table), filters).rows()
+        np.testing.assert_array_equal(
+            FilterScan.from_config(table, filters, chunk_size=2).rows(), expected)
+
+    def test_chunked_scans(self, papers):
+        table = PaperTable.from_papers(papers * 5)
+        whole = PaperAggregator().update_table(table).results()
+        assert PaperAggregator().update_table(table, chunk_size=2).results() == whole
+        rows = np.array([0, 4, 5, 9, 14])
+        chunked = PaperAggregator().update_table(table, chunk_size=2)
+        chunked.update_table(table, rows, sign=-1, chunk_size=2)
+        assert chunked.results() == PaperAggregator().update_table(
+            table, np.setdiff1d(np.arange(15), rows)).results()
+        assert list(table.iter_records(rows, chunk_size=2)) == list(table.iter_records(rows))
+        assert list(table.iter_records(chunk_size=4)) == table.to_records()
+
+    def test_analyzer_filters_mapped_corpus(self, papers, tmp_path):
+        path = tmp_path / "corpus"
+        save_corpus(PaperTable.from_papers(papers), path)
+        analyzer = ScholarAnalyzer.from_file(path)
+        assert analyzer.table.is_mapped
+        result = analyzer.analyze(filters={"authors": ["Bob"], "year_range": {"start": 2021}})
+        assert [paper["title"] for paper in result["papers"]] == ["C"]
+        assert result["analysis"]["metrics"]["total_papers"] == 1
+
+
+class TestIngest:
+    def test_ingest_command(self, sample_data, tmp_path):
+        """Test a JSON input ingested once analyzes like the original."""
+        source = tmp_path / "input.json"
+        source.write_text(json.dumps(sample_data))
+        corpus = tmp_path / "corpus"
+        runner = click.testing.CliRunner()
+        result = runner.invoke(cli, ["ingest", str(source), str(corpus)])
+        assert result.exit_code == 0 and "Ingested 2 papers" in result.output
+
+        analyzer = ScholarAnalyzer.from_file(corpus)
+        assert analyzer.metadata == sample_data["metadata"]
+        assert analyzer.analyze()["analysis"] == \
+            ScholarAnalyzer(sample_data).analyze()["analysis"]
+
+        result = runner.invoke(cli, ["analyze", "q", "--input", str(corpus), "--output",
+                                     str(tmp_path / "out"), "--format", "json"])
+        assert result.exit_code == 0
+        assert (tmp_path / "out" / "output.json").exists()
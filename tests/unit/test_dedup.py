@@ -0,0 +1,150 @@
+# test_dedup.py
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.dedup import Deduplicator, normalized_titles, shared_authors, shingles
+from scholar_analyzer.table import PaperTable, StringColumn
+
+
+@pytest.fixture
+def papers():
+    return [
+        {"title": "Graph Neural Networks: A Review of Methods", "authors": ["Ada", "Bob"],
+         "year": 2020, "venue": "AI Open", "citations": 10, "url": "https://a"},
+        {"title": "Deep learning for protein folding", "authors": ["Cy"],
+         "year": 2019, "citations": 3},
+        {"title": "graph neural networks - a review of methods.", "authors": ["Bob", "Dee"],
+         "year": 2021, "citations": 25},
+        {"title": "Graph neural networks: a review of method", "authors": ["Eve", "Ada"],
+         "citations": 1},
+        {"title": "", "authors": ["Fay"], "year": 2020},
+        {"title": "", "authors": ["Gus"], "year": 2020},
+        {"title": "Graph Neural Networks: A Review of Methods", "authors": ["Hal"],
+         "year": 2010, "venue": "AI Open", "citations": 99},
+    ]
+
+
+class TestShingles:
+    def test_normalized_titles(self):
+        """Test case, spaces and ASCII punctuation are folded away."""
+        chars, offsets = normalized_titles(StringColumn.from_strings(
+            ["A B-c!", "", "Über 2"]))
+        assert offsets.tolist() == [0, 3, 3, 9]
+        assert chars[:3].tobytes() == b"abc"
+        assert chars[3:].tobytes().decode("utf-8") == "Über2"
+
+    def test_shingles(self):
+        """Test every k-byte run within a row, one shingle for short rows."""
+        chars = np.frombuffer(b"abcdxy", dtype=np.uint8)
+        values, offsets = shingles(chars, np.array([0, 4, 4, 6]), 3)
+        assert offsets.tolist() == [0, 2, 2, 3]
+        assert values.tolist() == [int.from_bytes(b"abc", "big"),
+                                   int.from_bytes(b"bcd", "big"),
+                                   int.from_bytes(b"xy\0", "big")]
+
+
+class TestDeduplicator:
+    def test_find_duplicates(self, papers):
+        """Test near-identical titles merge; empty titles and distant years do not."""
+        table = PaperTable.from_papers(papers)
+        assert Deduplicator().find_duplicates(table).tolist() == [0, 1, 0, 0, 4, 5, 6]
+        loose = Deduplicator(year_tolerance=None)
+        assert loose.find_duplicates(table).tolist() == [0, 1, 0, 0, 4, 5, 0]
+
+    def test_merge_union(self, papers):
+        """Test the earliest paper keeps max citations and gains all authors."""
+        table = PaperTable.from_papers(papers)
+        assert Deduplicator().deduplicate(table) == 2
+        merged = table.record(0)
+        assert merged["authors"] == ["Ada", "Bob", "Dee", "Eve"]
+        assert merged["citations"] == 25
+        assert merged["url"] == "https://a"
+        assert [paper["title"] for paper in table.to_records()] == [
+            papers[0]["title"], papers[1]["title"], "", "", papers[6]["title"]]
+
+    def test_merge_policies(self, papers):
+        """Test summed citations, first authors and filled in years."""
+        papers[0]["year"] = None
+        papers.pop()
+        table = PaperTable.from_papers(papers)
+        Deduplicator(citations="sum", authors="first").deduplicate(table)
+        merged = table.record(0)
+        assert merged["authors"] == ["Ada", "Bob"]
+        assert merged["citations"] == 36
+        assert merged["year"] == 2021
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            Deduplicator(citations="mean")
+        with pytest.raises(ValueError):
+            Deduplicator(num_perm=64, bands=10)
+
+    def test_matches_planted_duplicates(self):
+        """Test recall on noisy copies among unrelated random titles."""
+        rng = np.random.default_rng(0)
+        words = ["".join(rng.choice(list("abcdefghij"), 6)) for _ in range(500)]
+        titles = [" ".join(rng.choice(words, 8)) for _ in range(400)]
+        copies = [title.upper().replace(" ", ", ", 2) for title in titles[:100]]
+        authors = [[f"Author {i}"] for i in range(400)]
+        table = PaperTable.from_papers(
+            [{"title": title, "authors": names}
+             for title, names in zip(titles + copies, authors + authors[:100])])
+        into = Deduplicator().find_duplicates(table)
+        assert into[:400].tolist() == list(range(400))
+        assert into[400:].tolist() == list(range(100))
+
+    def test_title_alone_never_merges(self):
+        """Test same-title papers by different authors in different venues stay apart."""
+        table = PaperTable.from_papers([
+            {"title": "Editorial", "authors": [f"Editor {i}"], "year": 2020,
+             "venue": f"Journal {i}"} for i in range(5)] + [
+            {"title": "A survey of graph neural network methods", "authors": [f"Author {i}"],
+             "year": 2020, "venue": f"Venue {i}"} for i in range(3)])
+        assert Deduplicator().find_duplicates(table).tolist() == list(range(8))
+        assert Deduplicator().deduplicate(table) == 0
+        assert [len(paper["authors"]) for paper in table.to_records()] == [1] * 8
+
+    def test_generic_and_short_titles(self):
+        """Test generic or very short titles are never matched, even with shared authors."""
+        table = PaperTable.from_papers([
+            {"title": title, "authors": ["Ada"], "venue": "AI"}
+            for title in ("Editorial", "EDITORIAL.", "Preface", "Preface", "Short", "Short")])
+        signatures, present = Deduplicator().signatures(table)
+        assert not present.any()
+        assert Deduplicator().find_duplicates(table).tolist() == list(range(6))
+
+    def test_short_titles_between_duplicates(self):
+        """Test excluded titles next to a paper do not leak into its signature."""
+        title = "Graph neural networks at scale"
+        table = PaperTable.from_papers(
+            [{"title": title, "authors": ["Ada"]}]
+            + [{"title": short, "authors": ["Ada"]}
+               for short in ("Editorial", "Preface", "Short", "Note", "Errata")]
+            + [{"title": title, "authors": ["Ada"]}])
+        signatures, present = Deduplicator().signatures(table)
+        assert present.tolist() == [True] + [False] * 5 + [True]
+        assert (signatures[0] == signatures[6]).all()
+        assert Deduplicator().find_duplicates(table).tolist() == [0, 1, 2, 3, 4, 5, 0]
+
+    def test_no_transitive_merges(self):
+        """Test a paper is only merged into a paper it matches directly."""
+        table = PaperTable.from_papers([
+            {"title": "Graph neural networks for molecules", "authors": ["Ada"]},
+            {"title": "Graph neural networks for molecules", "authors": ["Ada", "Bob"]},
+            {"title": "Graph neural networks for molecules", "authors": ["Bob"]},
+        ])
+        assert Deduplicator().find_duplicates(table).tolist() == [0, 0, 2]
+
+    def test_shared_authors(self):
+        table = PaperTable.from_papers([
+            {"title": "a", "authors": ["Ada", "Bob"]}, {"title": "b", "authors": ["Bob"]},
+            {"title": "c", "authors": []}, {"title": "d", "authors": ["Cy"]}])
+        assert shared_authors(table, np.array([0, 0, 2, 1]),
+                              np.array([1, 3, 3, 0])).tolist() == [True, False, False, True]
+
+    def test_analyzer_load_path(self, papers):
+        """Test the analyzer counts merged papers once."""
+        analyzer = ScholarAnalyzer({"papers": papers}, deduplicate=True)
+        assert analyzer.duplicates_removed == 2
+        assert analyzer.analyze()["analysis"]["metrics"]["total_papers"] == 5
+        assert ScholarAnalyzer({"papers": papers}).duplicates_removed == 0
@@ -0,0 +1,172 @@
+# test_filter_index.py
+import json
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.filter_index import FilterIndex, FilterPlan, intersect
+from scholar_analyzer.static.js.modules.filters import ScholarFilters
+from scholar_analyzer.table import PaperTable
+
+
+@pytest.fixture
+def papers():
+    rng = np.random.default_rng(3)
+    authors = [f"Author {name}" for name in ("Ada", "Bo", "Cy", "Di", "Ed")]
+    venues = ["ICML", "NeurIPS", "Nature", ""]
+    return [
+        {
+            "title": f"Paper {i} on {'Machine Learning' if i % 4 == 0 else 'graphs'}",
+            "authors": list(rng.choice(authors, rng.integers(1, 4), replace=False)),
+            "year": int(rng.integers(2015, 2024)) if i % 10 else None,
+            "venue": venues[i % 4],
+            "citations": int(rng.integers(0, 50)),
+            **({"abstract": "We study machine learning."} if i % 7 == 0 else {}),
+        }
+        for i in range(200)
+    ]
+
+
+@pytest.fixture
+def index(papers):
+    return FilterIndex(PaperTable.from_papers(papers))
+
+
+def rows_where(papers, predicate):
+    return [i for i, paper in enumerate(papers) if predicate(paper)]
+
+
+class TestFilterIndex:
+    def test_ranges(self, papers, index):
+        """Test year and citation ranges against a linear scan."""
+        assert index.year_range(2017, 2019).tolist() == rows_where(
+            papers, lambda p: p["year"] is not None and 2017 <= p["year"] <= 2019)
+        assert index.citation_range(10, None).tolist() == rows_where(
+            papers, lambda p: p["citations"] >= 10)
+        assert index.year_range().tolist() == rows_where(papers, lambda p: p["year"])
+
+    def test_postings(self, papers, index):
+        """Test venue and author postings, including match-all intersections."""
+        assert index.venues(["ICML", "Nature"]).tolist() == rows_where(
+            papers, lambda p: p["venue"] in ("ICML", "Nature"))
+        assert index.venue_pattern("^N").tolist() == rows_where(
+            papers, lambda p: p["venue"].startswith("N"))
+        both = ["Author Ada", "Author Bo"]
+        assert index.authors(both, match_all=True).tolist() == rows_where(
+            papers, lambda p: all(name in p["authors"] for name in both))
+        assert index.author_substring("ada").tolist() == rows_where(
+            papers, lambda p: "Author Ada" in p["authors"])
+        assert len(index.authors(["Nobody"], match_all=True)) == 0
+
+    def test_keyword(self, papers, index):
+        """Test case-insensitive search over titles and abstracts."""
+        assert index.keyword("MACHINE learning").tolist() == rows_where(
+            papers, lambda p: "machine learning" in (p["title"] + " " + p.get("abstract", "")).lower())
+        assert len(index.keyword("learning.\x00paper")) == 0
+
+    def test_intersect(self):
+        """Test intersection of sorted row arrays."""
+        assert intersect(np.array([1, 3, 5]), np.array([3, 4, 5]), np.array([5])).tolist() == [5]
+
+
+class TestFilterPlan:
+    CONFIGS = [
+        {"year_range": {"start": 2016, "end": 2018}, "venues": ["Nature"]},
+        {"citations": {"min": 48}, "author": "ada", "keywords": ["graphs"]},
+        {"keywords": ["machine"], "year": {"start": 2015, "end": 2023},
+         "citations": {"max": 40}},
+        {"authors": ["Author Cy", "Author Di"], "venue_pattern": "^(ICML|Nature)$"},
+    ]
+
+    @staticmethod
+    def matches(paper, config):
+        text = (paper["title"] + " " + paper.get("abstract", "")).lower()
+        years = config.get("year_range") or config.get("year")
+        citations = config.get("citations", {})
+        return all([
+            not years or (paper["year"] is not None
+                          and years["start"] <= paper["year"] <= years["end"]),
+            citations.get("min", 0) <= paper["citations"] <= citations.get("max", 10 ** 9),
+            "venues" not in config or paper["venue"] in config["venues"],
+            "venue_pattern" not in config or paper["venue"] in ("ICML", "Nature"),
+            "authors" not in config or set(config["authors"]) & set(paper["authors"]),
+            "author" not in config or any(config["author"] in name.lower()
+                                          for name in paper["authors"]),
+            "keywords" not in config or any(keyword in text for keyword in config["keywords"]),
+        ])
+
+    @pytest.mark.parametrize("config", CONFIGS)
+    def test_plans_match_scan(self, papers, index, config):
+        """Test every plan, sparse or dense, selects what a scan would."""
+        plan = FilterPlan.from_config(index, config)
+        expected = rows_where(papers, lambda p: self.matches(p, config))
+        assert plan.rows().tolist() == expected
+        assert np.flatnonzero(plan.mask()).tolist() == expected
+
+    def test_order_by_selectivity(self, index):
+        """Test predicates run most selective first, keywords last."""
+        plan = FilterPlan.from_config(index, {"keywords": ["graphs"],
+                                              "year_range": {"start": 2015, "end": 2023},
+                                              "citations": {"min": 48}})
+        names = [step["filter"] for step in plan.explain()]
+        assert names == ["citations", "years", "keywords"]
+
+    def test_invalid_config(self, index):
+        """Test unknown filter types and malformed values are rejected."""
+        with pytest.raises(ValueError):
+            FilterPlan.from_config(index, {"language": "en"})
+        with pytest.raises(TypeError):
+            FilterPlan.from_config(index, {"venues": 3})
+
+    def test_analyzer_and_api_filters(self, app, papers):
+        """Test filtered analysis aggregates and returns only matching papers."""
+        config = {"venues": ["ICML"], "citations": {"min": 20}}
+        expected = [p for p in papers if self.matches(p, config)]
+        result = ScholarAnalyzer({"papers": papers}).analyze(config)
+        assert [p["title"] for p in result["papers"]] == [p["title"] for p in expected]
+        assert result["analysis"]["venue_data"] == {"ICML": len(expected)}
+
+        response = app.test_client().post("/api/analyze",
+                                          json={"papers": papers, "filters": config})
+        assert len(response.get_json()["papers"]) == len(expected)
+
+
+    def test_filtered_export_keeps_analysis(self, papers, tmp_path):
+        """Test a filtered export does not leak into a later unfiltered one."""
+        analyzer = ScholarAnalyzer({"papers": papers})
+        analyzer.export_to_json(tmp_path / "icml.json", {"venues": ["ICML"]})
+        analyzer.export_to_json(tmp_path / "all.json")
+
+        filtered = json.loads((tmp_path / "icml.json").read_text())
+        exported = json.loads((tmp_path / "all.json").read_text())
+        assert filtered["analysis"]["metrics"]["total_papers"] == len(filtered["papers"]) == 50
+        assert exported["analysis"]["metrics"]["total_papers"] == len(papers)
+        assert analyzer.analysis_results["metrics"]["total_papers"] == len(papers)
+
+class TestScholarFilters:
+    def test_chaining_matches_scan(self, papers):
+        """Test chained filters select exactly the papers a scan would."""
+        filters = ScholarFilters({"papers": papers})
+        result = (filters.filterByYearRange(2016, 2020)
+                  .filterByCitations(min_citations=5, max_citations=40)
+                  .filterByAuthor("author bo"))
+        expected = rows_where(papers, lambda p: p["year"] and 2016 <= p["year"] <= 2020
+                              and 5 <= p["citations"] <= 40 and "Author Bo" in p["authors"])
+        assert result.getPaperIds().tolist() == expected
+        assert [paper["title"] for paper in result.getResults()] == [
+            papers[i]["title"] for i in expected]
+
+    def test_apply_active_filters(self, papers):
+        """Test stored filters combine like the chained calls."""
+        filters = ScholarFilters({"papers": papers})
+        filters.addFilter("venues", ["ICML"]).addFilter("keywords", ["machine learning"])
+        assert len(filters.applyFilters()) == len(rows_where(
+            papers, lambda p: p["venue"] == "ICML" and "machine learning"
+            in (p["title"] + p.get("abstract", "")).lower()))
+        assert len(filters.applyFilters({})) == len(papers)
+
+    def test_suggestions_ranked_by_count(self, papers):
+        """Test suggestions list the most frequent matches first."""
+        suggestions = ScholarFilters({"papers": papers}).getVenueSuggestions("n")
+        counts = [suggestion["count"] for suggestion in suggestions]
+        assert {s["name"] for s in suggestions} == {"NeurIPS", "Nature"}
+        assert counts == sorted(counts, reverse=True) and counts[0] == 50
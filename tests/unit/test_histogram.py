@@ -0,0 +1,85 @@
+# test_histogram.py
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.histogram import Binning, CITATION_RANGES
+from scholar_analyzer.visualization.chart_generator import ChartGenerator
+
+
+class TestHistogram:
+    @pytest.fixture
+    def citations(self):
+        """Citation counts covering every default bucket boundary."""
+        return np.array([0, 0, 1, 10, 11, 50, 51, 100, 101, 500, 501, 10000])
+
+    def test_default_binning(self, citations):
+        """Test the default buckets match the historical citation ranges."""
+        histogram = Binning.default().histogram(citations)
+
+        assert tuple(histogram) == CITATION_RANGES
+        assert list(histogram.values()) == [2, 2, 2, 2, 2, 2]
+
+    def test_negative_citations(self):
+        """Test negative counts land in the first bucket instead of vanishing."""
+        counts = Binning.default().counts(np.array([-3, 0, 5]), weights=np.array([2, 1, 1]))
+        assert counts.tolist() == [3, 1, 0, 0, 0, 0]
+
+        analyzer = ScholarAnalyzer({"papers": [
+            {"title": "A", "authors": [], "citations": -1},
+            {"title": "B", "authors": [], "citations": 4}]})
+        citation_data = analyzer._perform_analysis()["citation_data"]
+        assert citation_data["0"] == 1 and sum(citation_data.values()) == 2
+
+    def test_custom_edges(self, citations):
+        """Test arbitrary edges and generated labels."""
+        binning = Binning([0, 1, 100])
+        assert binning.labels == ('0', '1-99', '100+')
+        assert binning.histogram(citations) == {'0': 2, '1-99': 5, '100+': 5}
+
+        assert Binning([5, 10]).histogram(citations) == {'5-9': 0, '10+': 9}
+
+    def test_weighted_counts(self):
+        """Test binning distinct values with their multiplicities."""
+        counts = Binning.default().counts(np.array([0, 7, 900]),
+                                          weights=np.array([3, 2, 1]))
+        assert counts.tolist() == [3, 2, 0, 0, 0, 1]
+
+    def test_log_binning(self, citations):
+        """Test logarithmic bins."""
+        binning = Binning.log(1000)
+        assert binning.edges.tolist() == [0, 1, 10, 100, 1000]
+
+        finer = Binning.resolve('log', citations, per_decade=4)
+        assert len(finer.edges) > len(Binning.resolve('log', citations).edges)
+        assert finer.counts(citations).sum() == len(citations)
+
+    def test_quantile_binning(self):
+        """Test quantile bins split values evenly."""
+        values = np.arange(100)
+        binning = Binning.quantile(values, n_bins=4)
+
+        assert binning.edges.tolist() == [0, 25, 50, 75]
+        assert binning.counts(values).tolist() == [25, 25, 25, 25]
+
+    def test_invalid_binning(self):
+        """Test rejection of malformed bins."""
+        with pytest.raises(ValueError):
+            Binning([10, 5])
+        with pytest.raises(ValueError):
+            Binning([0, 1], labels=['only one'])
+        with pytest.raises(ValueError):
+            Binning.resolve('cubic')
+
+    def test_analyzer_binning(self, sample_data):
+        """Test analyzer citation analysis with configurable bins."""
+        analyzer = ScholarAnalyzer(sample_data, citation_bins=[0, 6])
+
+        assert analyzer._perform_analysis()["citation_data"] == {'0-5': 1, '6+': 1}
+        assert analyzer._analyze_citations(bins='log') == {'0': 0, '1-9': 1, '10+': 1}
+        assert analyzer._analyze_citations(bins=None) == {'0-5': 1, '6+': 1}
+
+    def test_chart_accepts_raw_citations(self, citations):
+        """Test citation charts bin raw values."""
+        chart = ChartGenerator().generate_citation_chart(
+            citations, bins='log', log_scale=True)
+        assert '10000+' in chart
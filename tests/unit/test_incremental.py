@@ -0,0 +1,112 @@
+# test_incremental.py
+import random
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.table import PaperTable
+
+
+def make_papers(start, count, seed):
+    """Generate papers with unique titles and overlapping authors/venues."""
+    rng = random.Random(seed)
+    papers = [
+        {
+            "title": f"Paper {i}",
+            "authors": rng.sample([f"Author {a}" for a in range(12)], rng.randint(0, 4)),
+            "year": rng.choice([0, 2018, 2019, 2020, 2021]),
+            "venue": rng.choice(["", "Venue A", "Venue B", "Venue C"]),
+            "citations": rng.choice([0, 3, 10, 11, 60, 700]),
+            "url": f"https://example.com/{i}",
+        }
+        for i in range(start, start + count)
+    ]
+    # Absent years and venues are stored as 0 and '', so drop them from the
+    # input to keep records round-tripping exactly.
+    for paper in papers:
+        for key in ("year", "venue"):
+            if not paper[key]:
+                del paper[key]
+    return papers
+
+
+def snapshot(analyzer):
+    """Everything the incremental API has to keep consistent."""
+    links = sorted((l['source'], l['target'], l['value'])
+                   for l in analyzer._extract_network_links())
+    nodes = sorted((n['name'], n['value'], n['symbolSize'])
+                   for n in analyzer._extract_network_nodes())
+    return analyzer._perform_analysis(), nodes, links, analyzer.data["papers"]
+
+
+class TestIncrementalAnalysis:
+    @pytest.fixture
+    def base(self):
+        return make_papers(0, 200, seed=1)
+
+    @pytest.mark.parametrize("bins", [None, "log", "quantile"])
+    def test_matches_full_recompute(self, base, bins):
+        """Test add/remove gives the same results as analyzing from scratch."""
+        analyzer = ScholarAnalyzer({"papers": base}, citation_bins=bins)
+        snapshot(analyzer)  # build the maintained aggregates first
+
+        added = make_papers(200, 50, seed=2)
+        removed = base[10:60] + added[:5]
+        analyzer.add_papers(added)
+        assert analyzer.remove_papers(removed) == len(removed)
+
+        expected = ScholarAnalyzer(
+            {"papers": base[:10] + base[60:] + added[5:]}, citation_bins=bins)
+        assert snapshot(analyzer) == snapshot(expected)
+        result, expected_result = analyzer.analyze(), expected.analyze()
+        assert result["analysis"] == expected_result["analysis"]
+        assert result["papers"] == expected_result["papers"]
+
+    def test_remove_everything(self, base):
+        """Test aggregates return to their empty state."""
+        analyzer = ScholarAnalyzer({"papers": base})
+        snapshot(analyzer)
+        analyzer.remove_papers(base)
+
+        assert snapshot(analyzer) == snapshot(ScholarAnalyzer({"papers": []}))
+
+    def test_remove_missing_and_duplicates(self, base):
+        """Test unknown papers are ignored and duplicates removed one at a time."""
+        analyzer = ScholarAnalyzer({"papers": base + base[:1]})
+
+        assert analyzer.remove_papers([{"title": "Unknown", "year": 2020}]) == 0
+        assert analyzer.remove_papers(base[:1]) == 1
+        assert analyzer.remove_papers(base[:1]) == 1
+        assert analyzer.remove_papers(base[:1]) == 0
+        assert analyzer.data["papers"] == base[1:]
+
+    def test_interleaved_updates_before_first_analysis(self, base):
+        """Test updates applied before any aggregate has been built."""
+        analyzer = ScholarAnalyzer({"papers": base[:100]})
+        analyzer.remove_papers(base[:20])
+        analyzer.add_papers(base[100:])
+        analyzer.remove_papers(base[150:])
+
+        assert snapshot(analyzer) == snapshot(
+            ScholarAnalyzer({"papers": base[20:150]}))
+
+
+class TestTableAppend:
+    def test_append_reuses_buffers(self):
+        """Test appends grow columns in place instead of copying."""
+        table = PaperTable.from_papers(make_papers(0, 10, seed=3))
+        table.append(make_papers(10, 1, seed=4))
+        buffer = table.years.base
+
+        rows = table.append(make_papers(11, 5, seed=5))
+        assert rows.tolist() == list(range(11, 16))
+        assert table.years.base is buffer
+        assert table.to_records() == make_papers(0, 10, seed=3) + \
+            make_papers(10, 1, seed=4) + make_papers(11, 5, seed=5)
+
+    def test_delete_compacts(self):
+        """Test deleting rows keeps the remaining records intact."""
+        papers = make_papers(0, 20, seed=6)
+        table = PaperTable.from_papers(papers)
+        table.delete([0, 5, 19])
+
+        assert table.to_records() == papers[1:5] + papers[6:19]
+        assert len(table.author_offsets) == len(table) + 1
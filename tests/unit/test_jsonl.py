@@ -0,0 +1,96 @@
+# test_jsonl.py
+import gzip
+import io
+import json
+import pytest
+from scholar_analyzer.aggregation import PaperAggregator
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.cli import process_query
+from scholar_analyzer.jsonl import block_ranges, is_jsonl, load_jsonl, parse_block
+from scholar_analyzer.table import PaperTable
+
+
+@pytest.fixture
+def papers():
+    venues = ["AI", "DB", ""]
+    return [
+        {"title": f"Paper {i}", "authors": [f"Author {i % 7}", f"Author {i % 3}"],
+         "year": 2000 + i % 5, "venue": venues[i % 3], "citations": i,
+         **({"doi": f"10.1/{i}"} if i % 4 == 0 else {})}
+        for i in range(60)
+    ]
+
+
+def write_jsonl(path, papers):
+    lines = "".join(json.dumps(paper) + "\n" + ("\n" if i % 9 == 0 else "")
+                    for i, paper in enumerate(papers))
+    if path.suffix == ".gz":
+        with gzip.open(path, "wt") as f:
+            f.write(lines)
+    else:
+        path.write_text(lines)
+    return path
+
+
+class TestJsonLines:
+    def test_is_jsonl(self):
+        assert is_jsonl("corpus.jsonl") and is_jsonl("corpus.JSONL.gz")
+        assert not is_jsonl("corpus.json")
+
+    def test_block_ranges_end_on_lines(self, papers, tmp_path):
+        """Test ranges cover the file and only split between lines."""
+        path = write_jsonl(tmp_path / "papers.jsonl", papers)
+        data = path.read_bytes()
+        ranges = block_ranges(path, 100)
+        assert len(ranges) > 1
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and data[end - 1:end] == b"\n"
+
+    def test_parse_block_reports_bad_line(self):
+        table, aggregator = parse_block(b'{"title": "A", "year": 2020}\n\n')
+        assert table.to_records() == [{"title": "A", "authors": [], "year": 2020,
+                                       "citations": 0}]
+        assert aggregator.yearly_counts == {2020: 1}
+        with pytest.raises(ValueError, match="line 2"):
+            parse_block(b'{"title": "A"}\n{"title": \n')
+
+    @pytest.mark.parametrize("name, workers", [
+        ("papers.jsonl", 1), ("papers.jsonl", 3), ("papers.jsonl.gz", 2)])
+    def test_matches_sequential_load(self, papers, tmp_path, name, workers):
+        """Test merged partial tables and aggregates equal a single pass."""
+        path = write_jsonl(tmp_path / name, papers)
+        table, aggregator = load_jsonl(path, workers=workers, block_bytes=256)
+        expected = PaperTable.from_papers(papers)
+        assert table.to_records() == expected.to_records()
+        assert aggregator.results() == PaperAggregator.from_table(expected).results()
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        table, aggregator = load_jsonl(path)
+        assert len(table) == 0 and aggregator.total_papers == 0
+
+
+class TestJsonLinesInput:
+    def test_analyzer_and_cli(self, papers, tmp_path):
+        """Test .jsonl input gives the analysis of the same JSON document."""
+        path = write_jsonl(tmp_path / "papers.jsonl", papers)
+        expected = ScholarAnalyzer({"papers": papers}).analyze()["analysis"]
+        assert ScholarAnalyzer.from_file(path, workers=2).analyze()["analysis"] == expected
+
+        result = process_query("q", tmp_path / "out", input_file=path, format="json",
+                               workers=1)
+        assert result["success"]
+        written = json.loads((tmp_path / "out" / "analysis.json").read_text())
+        assert len(written["papers"]) == len(papers)
+
+    def test_web_upload(self, app, papers):
+        """Test /api/analyze accepts an uploaded JSON Lines file."""
+        data = "".join(json.dumps(paper) + "\n" for paper in papers).encode()
+        response = app.test_client().post("/api/analyze", data={
+            "file": (io.BytesIO(gzip.compress(data)), "corpus.jsonl.gz"),
+            "filters": json.dumps({"venues": ["AI"]}),
+        })
+        assert response.status_code == 200
+        assert response.get_json()["analysis"]["metrics"]["total_papers"] == 20
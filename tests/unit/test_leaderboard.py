@@ -0,0 +1,103 @@
+# test_leaderboard.py
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.leaderboard import leaderboard, top_k
+
+
+@pytest.fixture
+def papers():
+    return [
+        {"title": "Graph neural networks", "authors": ["Ada", "Bob"],
+         "year": 2020, "venue": "NeurIPS", "citations": 30},
+        {"title": "Graph kernels", "authors": ["Ada"],
+         "year": 2021, "venue": "ICML", "citations": 5},
+        {"title": "Neural ranking", "authors": ["Cy", "Bob"],
+         "year": 2021, "venue": "NeurIPS", "citations": 12},
+        {"title": "Sparse graph methods", "authors": ["Dee"],
+         "year": 2022, "venue": "KDD", "citations": 1},
+        {"title": "Untitled draft", "authors": ["Dee"], "year": 2022, "citations": 0},
+    ]
+
+
+class TestTopK:
+    def test_matches_full_sort(self):
+        """Test partial selection agrees with a full sort, ties by index."""
+        rng = np.random.default_rng(0)
+        scores = rng.integers(0, 20, 1000)
+        expected = np.lexsort((np.arange(1000), -scores))
+        for k in (0, 1, 7, 50, 999, 1000, 2000, None):
+            assert top_k(scores, k).tolist() == expected[:k].tolist()
+
+    def test_secondary_ties(self):
+        """Test equal scores are ranked by the larger tie-break value."""
+        scores = np.array([3, 5, 3, 3, 1])
+        ties = np.array([1, 0, 9, 1, 0])
+        assert top_k(scores, 3, ties).tolist() == [1, 2, 0]
+
+
+class TestLeaderboard:
+    def test_other_bucket(self):
+        """Test entries past ``k`` are summed into a final bucket."""
+        names = ["a", "b", "c", "d"]
+        result = leaderboard(names, np.array([4, 9, 1, 2]), k=2)
+        assert result == [
+            {"name": "b", "count": 9},
+            {"name": "a", "count": 4},
+            {"name": "Other", "count": 3, "members": 2, "other": True},
+        ]
+        assert leaderboard(names, np.array([4, 9, 1, 2]), k=4)[-1] == {"name": "c", "count": 1}
+        assert len(leaderboard(names, np.array([4, 9, 1, 2]), k=2, other=None)) == 2
+
+    def test_keep_mask(self):
+        """Test masked out entries are neither ranked nor counted as other."""
+        result = leaderboard(["a", "b", "c"], np.array([9, 5, 1]), k=1,
+                             keep=np.array([False, True, True]))
+        assert result[0] == {"name": "b", "count": 5}
+        assert result[1]["members"] == 1
+
+
+class TestAnalyzerLeaderboard:
+    def test_venues(self, papers):
+        """Test venue leaderboards skip papers without a venue."""
+        analyzer = ScholarAnalyzer({"papers": papers})
+        assert analyzer.leaderboard("venues", limit=1) == [
+            {"name": "NeurIPS", "papers": 2},
+            {"name": "Other", "papers": 2, "members": 2, "other": True},
+        ]
+        top = analyzer.leaderboard("venues", limit=2, metric="citations")
+        assert [(e["name"], e["citations"]) for e in top] == [
+            ("NeurIPS", 42), ("ICML", 5), ("Other", 1)]
+
+    def test_authors_and_terms(self, papers):
+        """Test author and term leaderboards, without other for h-index."""
+        analyzer = ScholarAnalyzer({"papers": papers})
+        authors = analyzer.leaderboard("authors", limit=2)
+        assert [e["name"] for e in authors] == ["Bob", "Ada", "Other"]
+        h_index = analyzer.leaderboard("authors", limit=2, metric="h_index")
+        assert [e["name"] for e in h_index] == ["Bob", "Ada"]
+        terms = analyzer.leaderboard("terms", limit=1)
+        assert terms[0] == {"name": "graph", "frequency": 3}
+
+    def test_invalid(self, papers):
+        analyzer = ScholarAnalyzer({"papers": papers})
+        with pytest.raises(ValueError):
+            analyzer.leaderboard("journals")
+        with pytest.raises(ValueError):
+            analyzer.leaderboard("venues", metric="h_index")
+
+    def test_api_route(self, app, sample_data):
+        """Test leaderboards come from the analysis named in the request."""
+        client = app.test_client()
+        analysis_id = client.post("/api/analyze", json=sample_data).get_json()["analysis_id"]
+        client.post("/api/analyze", json={"papers": [
+            {"title": "Other", "authors": ["Author Tau"], "year": 2020, "venue": "V",
+             "citations": 99}]})
+        response = client.get(
+            f"/api/leaderboard/authors?analysis={analysis_id}&limit=1&sort=citations")
+        assert response.status_code == 200
+        assert response.get_json()["leaderboard"][0] == {
+            "name": "Author One", "citations": 10}
+        assert client.get(
+            f"/api/leaderboard/journals?analysis={analysis_id}").status_code == 400
+        assert client.get("/api/leaderboard/authors").status_code == 404
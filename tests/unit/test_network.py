@@ -0,0 +1,151 @@
+# test_network.py
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.network import CollaborationGraph, node_sizes
+from scholar_analyzer.network_metrics import NetworkMetrics
+from scholar_analyzer.table import PaperTable
+
+
+@pytest.fixture
+def table():
+    return PaperTable.from_papers([
+        {"title": "A", "authors": ["Ann", "Bob", "Cid"]},
+        {"title": "B", "authors": ["Bob", "Ann"]},
+        {"title": "C", "authors": ["Dee"]},
+        {"title": "D", "authors": ["Ann", "Bob", "Cid", "Dee", "Eve"]},
+    ])
+
+
+def weights(graph, table):
+    """Edge weights keyed by sorted name pairs."""
+    names = table.authors.values
+    return {tuple(sorted((names[a], names[b]))): w for a, b, w in graph.edges()}
+
+
+class TestCollaborationGraph:
+    def test_full_counting(self, table):
+        """Test edges count shared papers and nodes count papers."""
+        graph = CollaborationGraph.from_table(table)
+        edges = weights(graph, table)
+        assert edges[("Ann", "Bob")] == 3
+        assert edges[("Ann", "Cid")] == 2
+        assert edges[("Dee", "Eve")] == 1
+        assert len(edges) == 10
+        counts = dict(zip(table.authors.values, graph.paper_counts.tolist()))
+        assert counts == {"Ann": 3, "Bob": 3, "Cid": 2, "Dee": 2, "Eve": 1}
+
+    def test_author_cap(self, table):
+        """Test papers above the cap add no edges but still count as papers."""
+        graph = CollaborationGraph.from_table(table, max_authors=3)
+        edges = weights(graph, table)
+        assert edges == {("Ann", "Bob"): 2, ("Ann", "Cid"): 1, ("Bob", "Cid"): 1}
+        assert graph.paper_counts.sum() == 11
+
+    def test_fractional_counting(self, table):
+        """Test each author spreads one unit of weight per paper."""
+        graph = CollaborationGraph.from_table(table, counting="fractional")
+        edges = weights(graph, table)
+        assert edges[("Ann", "Bob")] == pytest.approx(1 + 0.5 + 0.25)
+        strength = np.asarray(graph.adjacency.sum(axis=1)).ravel()
+        papers_with_coauthors = graph.paper_counts - np.isin(
+            np.arange(graph.n_authors), [table.authors.lookup("Dee")])
+        np.testing.assert_allclose(strength, papers_with_coauthors)
+
+    def test_chunked_build_matches(self, table):
+        """Test a tiny pair budget yields the same matrix."""
+        full = CollaborationGraph.from_table(table)
+        chunked = CollaborationGraph.from_table(table, chunk_pairs=1)
+        assert len(chunked._pending) == 1
+        assert (full.upper != chunked.upper).nnz == 0
+
+    def test_repeated_author_ignored(self):
+        """Test an author listed twice on a paper forms no self-loop."""
+        table = PaperTable.from_papers([{"title": "A", "authors": ["Ann", "Ann", "Bob"]}])
+        graph = CollaborationGraph.from_table(table)
+        assert graph.upper.diagonal().sum() == 0
+        assert graph.paper_counts.tolist() == [1, 1]
+
+    def test_invalid_options(self):
+        """Test unknown counting modes and tiny caps are rejected."""
+        with pytest.raises(ValueError):
+            CollaborationGraph(counting="harmonic")
+        with pytest.raises(ValueError):
+            CollaborationGraph(max_authors=1)
+
+
+class TestNetworkOutput:
+    def test_node_sizes_scale(self):
+        """Test node sizes grow with paper counts within bounds."""
+        sizes = node_sizes(np.array([1, 4, 16]))
+        assert sizes[0] < sizes[1] < sizes[2] == 40
+        assert node_sizes(np.zeros(2)).tolist() == [10, 10]
+
+    def test_analyzer_nodes_and_links(self, sample_data):
+        """Test analyzer nodes carry paper counts and links are name-ordered."""
+        analyzer = ScholarAnalyzer(sample_data, max_authors=10)
+        nodes = analyzer._extract_network_nodes()
+        assert all(node["value"] >= 1 for node in nodes)
+        assert {node["name"] for node in nodes} == {
+            author for paper in sample_data["papers"] for author in paper["authors"]}
+        for link in analyzer._extract_network_links():
+            assert link["source"] < link["target"]
+
+
+class TestNetworkMetrics:
+    @pytest.fixture
+    def path(self):
+        """Ann - Bob - Cid - Dee, plus Eve who only writes alone."""
+        return PaperTable.from_papers([
+            {"title": "1", "authors": ["Ann", "Bob"]},
+            {"title": "2", "authors": ["Bob", "Cid"]},
+            {"title": "3", "authors": ["Cid", "Dee"]},
+            {"title": "4", "authors": ["Eve"]},
+        ])
+
+    def test_structure(self, path):
+        """Test degrees, components and density of a path plus an isolate."""
+        metrics = NetworkMetrics(CollaborationGraph.from_table(path))
+        assert metrics.degree.tolist() == [1, 2, 2, 1, 0]
+        assert metrics.degree_distribution() == {0: 1, 1: 2, 2: 2}
+        assert metrics.n_components == 2
+        assert metrics.component_sizes().tolist() == [4, 1]
+        assert metrics.density == pytest.approx(3 / 10)
+
+    def test_exact_betweenness(self, path):
+        """Test sampling every source gives exact betweenness."""
+        metrics = NetworkMetrics(CollaborationGraph.from_table(path))
+        np.testing.assert_allclose(metrics.betweenness, [0, 2, 2, 0, 0])
+
+    def test_pagerank(self, path):
+        """Test PageRank sums to one and favours the path's middle."""
+        rank = NetworkMetrics(CollaborationGraph.from_table(path)).pagerank
+        assert rank.sum() == pytest.approx(1, abs=1e-5)
+        assert rank[1] > rank[0] and rank[1] == pytest.approx(rank[2], rel=1e-5)
+
+    def test_weighted_pagerank(self):
+        """Test heavier collaborations attract more rank."""
+        table = PaperTable.from_papers(
+            [{"title": str(i), "authors": ["Hub", "Close"]} for i in range(5)]
+            + [{"title": "x", "authors": ["Hub", "Far"]}])
+        rank = NetworkMetrics(CollaborationGraph.from_table(table)).pagerank
+        assert rank[table.authors.lookup("Close")] > rank[table.authors.lookup("Far")]
+
+    def test_inactive_authors_excluded(self, path):
+        """Test authors whose papers were all removed drop out of the metrics."""
+        graph = CollaborationGraph.from_table(path)
+        graph.update_table(path, np.array([2]), sign=-1)
+        metrics = NetworkMetrics(graph)
+        assert metrics.n_nodes == 4
+        assert metrics.n_components == 2
+        assert metrics.pagerank[path.authors.lookup("Dee")] == 0
+
+    def test_analyzer_network(self, sample_data):
+        """Test the analyzer sizes nodes by the chosen metric and renders a chart."""
+        analyzer = ScholarAnalyzer(sample_data)
+        result = analyzer.analyze_network(size_by="betweenness")
+        assert {"nodes", "links", "metrics", "chart"} <= set(result)
+        assert result["metrics"]["nodes"] == len(result["nodes"])
+        assert all(10 <= node["symbolSize"] <= 40 for node in result["nodes"])
+        with pytest.raises(ValueError):
+            analyzer.analyze_network(size_by="fame")
@@ -0,0 +1,78 @@
+# test_reader.py
+import io
+import json
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.reader import JsonCorpusReader
+from scholar_analyzer.table import PaperTable
+
+
+@pytest.fixture
+def papers():
+    return [
+        {"title": "Résumé of \"graphs\"", "authors": ["Ada", "Bob"], "year": 2020,
+         "venue": "AI", "citations": 12345678901},
+        {"title": "B", "authors": [], "year": 2021, "citations": 0, "doi": "10.1/b"},
+        {"title": "C", "authors": ["Cy"], "year": None, "citations": 3,
+         "keywords": ["x", "y"]},
+    ]
+
+
+def read(text, chunk_size=3):
+    reader = JsonCorpusReader(io.StringIO(text), chunk_size=chunk_size)
+    return list(reader), reader
+
+
+class TestJsonCorpusReader:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 20])
+    def test_papers_and_metadata(self, papers, chunk_size):
+        """Test records stream out and the other keys are kept, whatever the chunking."""
+        text = json.dumps({"metadata": {"query": "q"}, "papers": papers, "total": 3},
+                          indent=2)
+        records, reader = read(text, chunk_size)
+        assert records == papers
+        assert reader.metadata == {"query": "q"}
+        assert reader.document == {"metadata": {"query": "q"}, "total": 3}
+
+    def test_top_level_array_and_empty(self, papers):
+        assert read(json.dumps(papers))[0] == papers
+        assert read('{"papers": []}')[0] == []
+        assert read(' {} ')[0] == []
+
+    @pytest.mark.parametrize("text", [
+        '{"papers": [{"title": "A"} {"title": "B"}]}',
+        '{"papers": [{"title": "A"}',
+        '{"papers": []} []',
+        '"papers"',
+    ])
+    def test_invalid_json(self, text):
+        with pytest.raises(json.JSONDecodeError):
+            read(text)
+
+
+class TestStreamingLoad:
+    def test_from_stream_matches_from_papers(self, papers):
+        """Test chunked appends keep extra fields that start in later chunks."""
+        streamed = PaperTable.from_stream(iter(papers * 3), chunk_size=2)
+        assert streamed.to_records() == PaperTable.from_papers(papers * 3).to_records()
+
+    def test_from_file(self, papers, tmp_path):
+        """Test the analyzer loads a file and writes the analysis without json.load."""
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"papers": papers, "metadata": {"query": "graphs"}}))
+        analyzer = ScholarAnalyzer.from_file(path)
+        assert analyzer.metadata == {"query": "graphs"}
+        assert analyzer.data["papers"] == ScholarAnalyzer({"papers": papers}).data["papers"]
+
+        output = tmp_path / "analysis.json"
+        analyzer.write_analysis(output)
+        written = json.loads(output.read_text())
+        expected = json.loads(json.dumps(analyzer.analyze()))
+        assert written.keys() == expected.keys()
+        # Charts embed random element IDs.
+        assert written["papers"] == expected["papers"]
+        assert written["analysis"] == expected["analysis"]
+
+        analyzer.export_to_json(tmp_path / "export.json", {"year_range": {"start": 2021, "end": 2021}})
+        exported = json.loads((tmp_path / "export.json").read_text())
+        assert [paper["title"] for paper in exported["papers"]] == ["B"]
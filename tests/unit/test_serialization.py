@@ -0,0 +1,82 @@
+# test_serialization.py
+import io
+import json
+import numpy as np
+import pytest
+from scholar_analyzer import serialization
+from scholar_analyzer.analyzer import ScholarAnalyzer
+
+
+@pytest.fixture(params=[b for b in serialization.BACKENDS
+                        if b == "json" or serialization.orjson is not None])
+def backend(request):
+    previous = serialization.get_backend()
+    serialization.set_backend(request.param)
+    yield request.param
+    serialization.set_backend(previous)
+
+
+class TestSerialization:
+    def test_compact_by_default(self, backend):
+        value = {"title": "Über", "years": {2020: 1}, "ok": True}
+        assert serialization.dumpb(value) == '{"title":"Über","years":{"2020":1},"ok":true}'.encode()
+        pretty = serialization.dumps(value, indent=2)
+        assert pretty.startswith('{\n  "title"')
+        assert json.loads(pretty) == {"title": "Über", "years": {"2020": 1}, "ok": True}
+
+    def test_numpy_values(self, backend):
+        """Test arrays, strided views and scalars encode as plain JSON."""
+        value = {"counts": np.arange(6, dtype=np.int64)[::2], "mean": np.float64(1.5),
+                 "matrix": np.eye(2, dtype=np.int32), "n": np.int32(3)}
+        assert json.loads(serialization.dumps(value)) == {
+            "counts": [0, 2, 4], "mean": 1.5, "matrix": [[1, 0], [0, 1]], "n": 3}
+        with pytest.raises(TypeError):
+            serialization.dumps({"bad": object()})
+
+    def test_fallbacks(self, backend):
+        """Test values orjson cannot encode still round-trip."""
+        value = {"big": 2 ** 70, "b": 1, "a": [1]}
+        assert serialization.loads(serialization.dumpb(value)) == value
+        assert serialization.dumps(value, indent=4, sort_keys=True).startswith(
+            '{\n    "a"')
+
+    def test_non_finite_floats(self, backend):
+        """Test NaN and infinities are written as null by either backend."""
+        value = {"a": float("nan"), "b": [np.float64("inf"), 1.5],
+                 "c": np.array([np.nan, 2.0])}
+        expected = '{"a":null,"b":[null,1.5],"c":[null,2.0]}'
+        assert serialization.dumps(value) == expected
+        assert serialization.dumpb(value) == expected.encode()
+        assert json.loads(serialization.dumps(value, indent=4)) == {
+            "a": None, "b": [None, 1.5], "c": [None, 2.0]}
+
+    def test_files_and_errors(self, backend):
+        text, binary = io.StringIO(), io.BytesIO()
+        serialization.dump([1], text)
+        serialization.dump([1], binary)
+        assert text.getvalue() == "[1]" and binary.getvalue() == b"[1]"
+        assert serialization.load(io.BytesIO(b'{"a": 1}')) == {"a": 1}
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b'{"a": }')
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            serialization.set_backend("simplejson")
+
+
+class TestOutputs:
+    def test_exports_compact_unless_indented(self, backend, sample_data, tmp_path):
+        analyzer = ScholarAnalyzer(sample_data)
+        analyzer.export_to_json(tmp_path / "compact.json")
+        analyzer.export_to_json(tmp_path / "pretty.json", indent=2)
+        compact = (tmp_path / "compact.json").read_text()
+        pretty = (tmp_path / "pretty.json").read_text()
+        assert "\n" not in compact.strip() and "\n  " in pretty
+        assert json.loads(compact) == json.loads(pretty)
+        assert json.loads(compact)["analysis"]["yearly_data"] == {"2022": 1, "2023": 1}
+
+    def test_flask_responses(self, app, sample_data):
+        response = app.test_client().post("/api/analyze", json=sample_data)
+        assert response.status_code == 200
+        assert b"\n" not in response.data.strip()
+        assert response.get_json()["analysis"]["metrics"]["total_papers"] == 2
@@ -1,5 +1,7 @@
 # test_statistics.py
+import numpy as np
 import pytest
+from scipy import stats as sps
 from scholar_analyzer.static.js.modules.statistics import ScholarStatistics
 
 
@@ -9,6 +11,16 @@ class TestStatistics:
         """Initialize statistics instance for testing."""
         return ScholarStatistics(sample_data)
 
+    @pytest.fixture
+    def corpus_statistics(self, sample_data):
+        """Statistics over the sample papers plus enough others to fit 5 folds."""
+        papers = sample_data["papers"] + [
+            {"title": f"Paper {i}", "authors": ["Author One"], "year": 2010 + i,
+             "citations": (i * 7) % 13}
+            for i in range(10)
+        ]
+        return ScholarStatistics({"papers": papers})
+
     def test_basic_statistics(self, statistics):
         """Test basic statistical calculations."""
         stats = statistics.calculateBasicStats()
@@ -96,9 +108,9 @@ class TestStatistics:
         )
         assert len(poly_regression['coefficients']) == 3  # degree + 1
 
-    def test_clustering_analysis(self, statistics):
+    def test_clustering_analysis(self, corpus_statistics):
         """Test clustering analysis."""
-        clusters = statistics.performClustering(
+        clusters = corpus_statistics.performClustering(
             features=['citations', 'year'],
             n_clusters=3
         )
@@ -112,6 +124,15 @@ class TestStatistics:
         assert all(label >= 0 for label in clusters['labels'])
         assert max(clusters['labels']) == 2  # 3 clusters (0-2)
 
+    def test_capped_clusters_and_folds(self, statistics):
+        """Test clusters and folds are capped at the number of papers."""
+        clusters = statistics.performClustering(features=['citations', 'year'], n_clusters=3)
+        assert sorted(clusters['labels']) == [0, 1]
+        assert len(clusters['centroids']) == 2
+
+        cv_results = statistics.performCrossValidation(x_var='year', y_var='citations', folds=5)
+        assert len(cv_results['scores']) == 2
+
     def test_outlier_detection(self, statistics):
         """Test outlier detection methods."""
         outliers = statistics.detectOutliers(
@@ -176,7 +197,7 @@ class TestStatistics:
         )
 
         assert isinstance(windows, dict)
-        for window in windows:
+        for window in windows.values():
             assert 'start_year' in window
             assert 'end_year' in window
             assert 'metrics' in window
@@ -246,9 +267,9 @@ class TestStatistics:
                 group2_data=[2]
             )
 
-    def test_cross_validation(self, statistics):
+    def test_cross_validation(self, corpus_statistics):
         """Test cross-validation procedures."""
-        cv_results = statistics.performCrossValidation(
+        cv_results = corpus_statistics.performCrossValidation(
             model_type='regression',
             x_var='year',
             y_var='citations',
@@ -273,3 +294,209 @@ class TestStatistics:
         assert 'confidence_interval' in bootstrap
         assert 'standard_error' in bootstrap
         assert len(bootstrap['confidence_interval']) == 2
+
+
+class TestStatisticsAccuracy:
+    @pytest.fixture
+    def statistics(self):
+        """Statistics over a skewed synthetic corpus."""
+        rng = np.random.default_rng(0)
+        papers = [
+            {"title": f"Paper {i}", "authors": ["A"] * int(rng.integers(1, 5)),
+             "year": int(rng.integers(2000, 2020)) if i % 10 else 0,
+             "citations": int(rng.pareto(1.5) * 10)}
+            for i in range(500)
+        ]
+        return ScholarStatistics({"papers": papers}), papers
+
+    def test_moments_match_scipy(self, statistics):
+        """Test vectorized moments and percentiles against NumPy and SciPy."""
+        statistics, papers = statistics
+        citations = np.array([p["citations"] for p in papers], dtype=float)
+        basic = statistics.calculateBasicStats()
+        distribution = statistics.analyzeDistribution(bins=5)
+
+        assert basic["median"] == np.median(citations)
+        assert basic["mode"] == sps.mode(citations).mode
+        assert basic["variance"] == pytest.approx(citations.var())
+        assert distribution["skewness"] == pytest.approx(sps.skew(citations))
+        assert distribution["kurtosis"] == pytest.approx(sps.kurtosis(citations))
+        assert distribution["percentiles"]["p90"] == pytest.approx(
+            np.percentile(citations, 90))
+
+    def test_missing_years(self, statistics):
+        """Test papers without a year count as missing, not as year 0."""
+        statistics, papers = statistics
+        summary = statistics.generateSummary(["year"])["year"]
+        assert summary["missing"] == 50
+        assert summary["min"] >= 2000
+
+    def test_correlations_match_numpy(self, statistics):
+        """Test the correlation matrix over rows with complete values."""
+        statistics, papers = statistics
+        dated = [p for p in papers if p.get("year")]
+        expected = np.corrcoef([p["citations"] for p in dated], [p["year"] for p in dated])
+        correlations = statistics.calculateCorrelations(["citations", "year"])
+        assert correlations["citations"]["year"] == pytest.approx(expected[0, 1])
+
+    def test_bootstrap_reproducible(self, statistics):
+        """Test a seeded bootstrap is reproducible and brackets the estimate."""
+        statistics, _ = statistics
+        data = np.arange(100)
+        first = statistics.performBootstrap(data, n_iterations=200, seed=3)
+        assert first == statistics.performBootstrap(data, n_iterations=200, seed=3)
+        low, high = first["confidence_interval"]
+        assert low <= first["estimate"] <= high
+
+    def test_regression_matches_numpy(self, statistics):
+        """Test least-squares fits against polyfit and linregress."""
+        statistics, papers = statistics
+        dated = [p for p in papers if p.get("year")]
+        x = np.array([p["year"] for p in dated], dtype=float)
+        y = np.array([p["citations"] for p in dated], dtype=float)
+
+        linear = statistics.performRegression("year", "citations")
+        reference = sps.linregress(x, y)
+        assert linear["coefficients"] == pytest.approx([reference.intercept, reference.slope])
+        assert linear["p_values"][1] == pytest.approx(reference.pvalue)
+        assert linear["r_squared"] == pytest.approx(reference.rvalue ** 2)
+
+        cubic = statistics.performRegression("year", "citations", "polynomial", degree=3)
+        assert cubic["coefficients"][::-1] == pytest.approx(np.polyfit(x, y, 3))
+        assert len(cubic["predictions"]) == len(np.unique(x))
+
+    def test_cross_validation_folds(self, statistics):
+        """Test each fold gets a score and seeds make folds reproducible."""
+        statistics, _ = statistics
+        first = statistics.performCrossValidation(folds=4, seed=1)
+        assert len(first["scores"]) == 4
+        assert first == statistics.performCrossValidation(folds=4, seed=1)
+
+    @pytest.mark.parametrize("method", ["kmeans", "minibatch"])
+    def test_clustering_separates_groups(self, method):
+        """Test both k-means modes recover well separated groups."""
+        papers = [{"title": f"{i}", "year": 2000 + 10 * (i % 3), "citations": 100 * (i % 3)}
+                  for i in range(300)]
+        papers.append({"title": "undated", "citations": 5})
+        result = ScholarStatistics({"papers": papers}).performClustering(
+            ["citations", "year"], n_clusters=3, method=method, batch_size=32, seed=0)
+
+        labels = np.array(result["labels"])
+        assert labels[-1] == -1
+        for group in range(3):
+            assert len(set(labels[group:300:3])) == 1
+        assert sorted(result["sizes"]) == [100, 100, 100]
+        assert result["inertia"] == pytest.approx(0, abs=1e-3)  # float32 features
+        assert result["silhouette_score"] > 0.9
+
+
+class TestOutlierDetection:
+    @pytest.fixture
+    def statistics(self):
+        """Two venues with different citation levels and one anomaly each."""
+        papers = [{"title": f"A{i}", "venue": "A", "year": 2020, "citations": 10 + i % 3}
+                  for i in range(30)]
+        papers += [{"title": f"B{i}", "venue": "B", "year": 2021, "citations": 1000 + i % 3}
+                   for i in range(30)]
+        papers[5]["citations"] = 60     # high for venue A only
+        papers[40]["citations"] = 900   # low for venue B only
+        return ScholarStatistics({"papers": papers})
+
+    def test_grouped_zscores(self, statistics):
+        """Test per-venue z-scores flag values anomalous within their venue."""
+        result = statistics.detectOutliers("citations", "zscore", 3, group_by="venue")
+        assert result["indices"] == [5, 40]
+        assert all(score > 3 for score in result["scores"])
+        assert statistics.detectOutliers("citations", "zscore", 3)["indices"] == []
+
+    def test_grouped_iqr(self, statistics):
+        """Test per-year IQR fences match the venue split here."""
+        result = statistics.detectOutliers("citations", "iqr", 1.5, group_by="year",
+                                           as_array=True)
+        assert isinstance(result["indices"], np.ndarray)
+        assert result["indices"].tolist() == [5, 40]
+
+    def test_small_groups_skipped(self, statistics):
+        """Test groups below the minimum size are not scored."""
+        result = statistics.detectOutliers("citations", group_by="venue", min_group_size=31)
+        assert result["indices"] == []
+
+    def test_citations_per_year(self, statistics):
+        """Test the derived rate counts years up to the latest in the data."""
+        rates = statistics.columns["citations_per_year"]
+        assert rates[0] == pytest.approx(10 / 2)
+        assert rates[30] == pytest.approx(1000 / 1)
+
+    def test_invalid_options(self, statistics):
+        """Test unknown methods, variables and groupings are rejected."""
+        for kwargs in ({"method": "mad"}, {"variable": "h_index"}, {"group_by": "author"}):
+            with pytest.raises(ValueError):
+                statistics.detectOutliers(**kwargs)
+
+
+class TestGroupTests:
+    @pytest.fixture
+    def statistics(self):
+        rng = np.random.default_rng(0)
+        papers = [{"title": f"P{i}", "venue": "ABC"[i % 3], "year": 2018 + i % 4,
+                   "citations": int(rng.poisson(20 + 15 * (i % 3 == 2)))}
+                  for i in range(300)]
+        return ScholarStatistics({"papers": papers})
+
+    def split(self, statistics, venue):
+        groups, names = statistics.partition("venue")
+        values = statistics.columns["citations"]
+        inside = groups == names.index(venue)
+        return values[inside], values[~inside]
+
+    def test_single_tests_match_scipy(self, statistics):
+        """Test the one-off tests agree with scipy."""
+        first, second = [1.0, 2, 3, 5], [2.0, 3, 4, 9, 7]
+        expected = sps.ttest_ind(first, second, equal_var=False)
+        assert statistics.performTTest(first, second)["p_value"] == pytest.approx(expected.pvalue)
+        expected = sps.f_oneway([1, 2, 3], [2, 3, 4], [3, 4, 6])
+        result = statistics.performANOVA({"a": [1, 2, 3], "b": [2, 3, 4], "c": [3, 4, 6]})
+        assert result["f_statistic"] == pytest.approx(expected.statistic)
+        assert result["p_value"] == pytest.approx(expected.pvalue)
+        expected = sps.chisquare([10, 20, 30], [12, 18, 30])
+        result = statistics.performChiSquareTest([10, 20, 30], [12, 18, 30])
+        assert result["p_value"] == pytest.approx(expected.pvalue)
+
+    @pytest.mark.parametrize("test", ["t_test", "mann_whitney", "ks"])
+    def test_batch_matches_scipy(self, statistics, test):
+        """Test each group-vs-rest statistic matches scipy on the same split."""
+        result = statistics.testAllGroups("citations", "venue", test, correction=None)
+        for record in result["groups"]:
+            inside, rest = self.split(statistics, record["group"])
+            if test == "t_test":
+                expected = sps.ttest_ind(inside, rest, equal_var=False)
+            elif test == "mann_whitney":
+                expected = sps.mannwhitneyu(inside, rest, use_continuity=False,
+                                            method="asymptotic")
+            else:
+                expected = sps.ks_2samp(inside, rest, method="asymp")
+                assert record["statistic"] == pytest.approx(expected.statistic)
+            assert record["statistic"] == pytest.approx(expected.statistic)
+            assert record["p_value"] == pytest.approx(expected.pvalue)
+
+    def test_anova_and_significance(self, statistics):
+        """Test the corpus-wide ANOVA and that the shifted venue stands out."""
+        groups = {venue: self.split(statistics, venue)[0] for venue in "ABC"}
+        expected = sps.f_oneway(*groups.values())
+        result = statistics.testAllGroups(test="anova")
+        assert result["f_statistic"] == pytest.approx(expected.statistic)
+        records = {record["group"]: record for record in statistics.testAllGroups()["groups"]}
+        assert records["C"]["significant"] and records["C"]["statistic"] > 0
+        assert records["A"]["statistic"] < 0
+        chi_square = statistics.testAllGroups(test="chi_square")["groups"]
+        assert all(0 <= record["p_value"] <= 1 for record in chi_square)
+
+    def test_corrections(self, statistics):
+        """Test Bonferroni, Holm and BH adjustments against hand-computed values."""
+        from scholar_analyzer.static.js.modules.statistics import _adjust_p_values
+        p_values = np.array([0.01, 0.04, 0.03])
+        assert _adjust_p_values(p_values, "bonferroni") == pytest.approx([0.03, 0.12, 0.09])
+        assert _adjust_p_values(p_values, "holm") == pytest.approx([0.03, 0.06, 0.06])
+        assert _adjust_p_values(p_values, "fdr_bh") == pytest.approx([0.03, 0.04, 0.04])
+        with pytest.raises(ValueError):
+            statistics.testAllGroups(test="wilcoxon")
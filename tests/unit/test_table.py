@@ -0,0 +1,100 @@
+# test_table.py
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.aggregation import PaperAggregator
+from scholar_analyzer.table import PaperTable, StringPool, StringColumn
+from scholar_analyzer.static.js.modules.export import ScholarExport
+
+
+class TestPaperTable:
+    @pytest.fixture
+    def table(self, sample_data):
+        """Build a table from the sample papers."""
+        return PaperTable.from_papers(sample_data["papers"])
+
+    def test_columns(self, table):
+        """Test typed columns and interned dictionaries."""
+        assert len(table) == 2
+        assert table.years.tolist() == [2023, 2022]
+        assert table.citations.tolist() == [10, 5]
+        assert [table.venues[i] for i in table.venue_ids] == [
+            "Test Conference", "Test Journal"
+        ]
+        assert table.author_offsets.tolist() == [0, 2, 3]
+        assert table.author_counts.tolist() == [2, 1]
+        assert table.paper_authors(0) == ["Author One", "Author Two"]
+
+    def test_round_trip(self, table, sample_data):
+        """Test that records rebuild the original paper dicts."""
+        assert table.to_records() == sample_data["papers"]
+        assert table.record(1) == sample_data["papers"][1]
+        assert list(table.iter_records(np.array([1]))) == sample_data["papers"][1:]
+
+    def test_missing_fields(self):
+        """Test papers with absent or sparse fields."""
+        papers = [
+            {"title": "A"},
+            {"title": "B", "authors": ["X"], "abstract": "text"},
+        ]
+        table = PaperTable.from_papers(papers)
+
+        assert table.to_records() == [
+            {"title": "A", "authors": [], "citations": 0},
+            {"title": "B", "authors": ["X"], "citations": 0, "abstract": "text"},
+        ]
+
+    def test_interning(self):
+        """Test repeated strings share one ID."""
+        papers = [
+            {"title": "A", "authors": ["X", "Y"], "venue": "V"},
+            {"title": "B", "authors": ["Y", "X"], "venue": "V"},
+        ]
+        table = PaperTable.from_papers(papers)
+
+        assert len(table.authors) == 2
+        assert table.author_ids.tolist() == [0, 1, 1, 0]
+        assert table.venue_ids[0] == table.venue_ids[1]
+
+    def test_string_structures(self):
+        """Test the string pool and column helpers."""
+        pool = StringPool(["a", "b", "a"])
+        assert len(pool) == 2
+        assert pool.lookup("b") == 1
+        assert pool.lookup("c") is None
+
+        column = StringColumn.from_strings(["α", "", "beta"])
+        assert len(column) == 3
+        assert list(column) == ["α", "", "beta"]
+        assert column[2] == "beta"
+
+    def test_analyzer_reads_table(self, sample_data):
+        """Test analyzer results come from the table."""
+        analyzer = ScholarAnalyzer(sample_data)
+
+        assert analyzer._perform_analysis() == \
+            PaperAggregator.from_papers(sample_data["papers"]).results()
+        assert analyzer.data["papers"] == sample_data["papers"]
+        assert analyzer.metadata == sample_data["metadata"]
+
+    def test_data_view(self, sample_data):
+        """Test ``data`` is cached until papers change and can be assigned."""
+        analyzer = ScholarAnalyzer(sample_data)
+        assert analyzer.data is analyzer.data
+        analyzer.add_papers([{"title": "New", "authors": [], "citations": 0}])
+        assert len(analyzer.data["papers"]) == 3
+
+        analyzer.data = {"metadata": {"query": "q"}, "papers": sample_data["papers"][:1]}
+        assert analyzer.data["papers"] == sample_data["papers"][:1]
+        assert analyzer.metadata == {"query": "q"}
+        assert analyzer.analyze()["analysis"]["metrics"]["total_papers"] == 1
+
+    def test_from_table(self, table, sample_data, temp_output_dir):
+        """Test analyzer and exporter built directly on a table."""
+        analyzer = ScholarAnalyzer.from_table(table, sample_data["metadata"])
+        assert analyzer.analyze()["papers"] == sample_data["papers"]
+
+        exporter = ScholarExport.from_table(table, sample_data["metadata"])
+        output_file = temp_output_dir / "export.csv"
+        exporter.exportToCSV(output_file)
+        assert "Test Paper 2" in output_file.read_text()
@@ -0,0 +1,87 @@
+# test_time_windows.py
+import numpy as np
+import pytest
+from scholar_analyzer.table import PaperTable
+from scholar_analyzer.time_windows import TimeWindowIndex
+
+
+def brute_h_index(citations):
+    ranked = sorted(citations, reverse=True)
+    return sum(1 for rank, count in enumerate(ranked, 1) if count >= rank)
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(1)
+    years = rng.integers(2000, 2012, 500)
+    years[:20] = 0  # undated
+    citations = rng.zipf(1.8, 500) % 400
+    return years, citations
+
+
+class TestTimeWindowIndex:
+    def test_rolling_windows_match_brute_force(self, corpus):
+        """Test counts, sums, means and h-index of every window by brute force."""
+        years, citations = corpus
+        index = TimeWindowIndex.from_periods(years, citations)
+        windows = index.windows(3)
+        assert len(windows) == 10
+        for window in windows:
+            inside = (years >= window["start_year"]) & (years <= window["end_year"])
+            metrics = window["metrics"]
+            assert metrics["paper_count"] == inside.sum()
+            assert metrics["citations"] == citations[inside].sum()
+            assert metrics["mean_citations"] == pytest.approx(citations[inside].mean())
+            assert metrics["h_index"] == brute_h_index(citations[inside].tolist())
+
+    def test_growth_against_previous_window(self, corpus):
+        """Test growth compares with the adjacent earlier window."""
+        years, citations = corpus
+        windows = TimeWindowIndex.from_periods(years, citations).windows(2, step=2)
+        assert [window["label"] for window in windows[:2]] == ["2000-2001", "2002-2003"]
+        assert windows[0]["metrics"]["growth_rate"] is None
+        before, after = (window["metrics"]["paper_count"] for window in windows[:2])
+        assert windows[1]["metrics"]["growth_rate"] == pytest.approx(after / before - 1)
+
+    def test_h_index_beyond_exact_bins(self):
+        """Test the h-index stays a close lower bound for highly cited sets."""
+        citations = np.full(1000, 700)
+        index = TimeWindowIndex.from_periods(np.full(1000, 2020), citations)
+        h = index.windows(1)[0]["metrics"]["h_index"]
+        assert 700 / 1.1 <= h <= 700
+
+    def test_negative_citations(self):
+        """Test negative counts fall in the zero bin of their own period."""
+        first = TimeWindowIndex.from_periods(np.array([2020, 2021]), np.array([-1, 3]))
+        assert [window["metrics"]["h_index"] for window in first.windows(1)] == [0, 1]
+
+        later = TimeWindowIndex.from_periods(np.array([2020, 2021]), np.array([3, -1]))
+        assert [window["metrics"]["h_index"] for window in later.windows(1)] == [1, 0]
+        assert [window["metrics"]["paper_count"] for window in later.windows(1)] == [1, 1]
+
+    def test_monthly_windows_from_dates(self):
+        """Test sub-year windows use publication dates and skip undated papers."""
+        table = PaperTable.from_papers([
+            {"title": "A", "year": 2021, "publication_date": "2021-01-15"},
+            {"title": "B", "year": 2021, "publication_date": "2021-03"},
+            {"title": "C", "year": 2021, "publication_date": "2021-04-02"},
+            {"title": "D", "year": 2021},
+        ])
+        index = TimeWindowIndex.from_table(table, "month")
+        windows = index.windows(2, metrics=["paper_count"])
+        assert [window["label"] for window in windows] == [
+            "2021-01/2021-02", "2021-02/2021-03", "2021-03/2021-04"]
+        assert [window["metrics"]["paper_count"] for window in windows] == [1, 1, 2]
+        quarters = TimeWindowIndex.from_table(table, "quarter").windows(1)
+        assert [window["label"] for window in quarters] == ["2021-Q1", "2021-Q2"]
+
+    def test_invalid_arguments(self, corpus):
+        """Test unknown granularities and metrics and empty windows are rejected."""
+        index = TimeWindowIndex.from_periods(*corpus)
+        with pytest.raises(ValueError):
+            index.windows(0)
+        with pytest.raises(ValueError):
+            index.windows(2, metrics=["impact"])
+        with pytest.raises(ValueError):
+            TimeWindowIndex.from_table(PaperTable.from_papers([]), "week")
+        assert TimeWindowIndex.from_periods([0], [3]).windows(2) == []
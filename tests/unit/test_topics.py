@@ -0,0 +1,81 @@
+# test_topics.py
+import numpy as np
+import pytest
+from scholar_analyzer.analyzer import ScholarAnalyzer
+from scholar_analyzer.topics import TopicIndex
+
+
+@pytest.fixture
+def index():
+    titles = [
+        "Deep Learning for Graphs",
+        "Graph neural networks: deep learning on graphs",
+        "Learning to rank",
+        "A survey of ranking",
+    ]
+    return TopicIndex.from_texts(titles, np.array([10, 30, 5, 0]),
+                                 np.array([2020, 2021, 2021, 0]))
+
+
+def by_term(records):
+    return {record["term"]: record for record in records}
+
+
+class TestTopicIndex:
+    def test_tokenization(self, index):
+        """Test case folding, punctuation, stop words and short words."""
+        assert set(index.terms) == {
+            "deep", "learning", "graphs", "graph", "neural", "networks",
+            "rank", "survey", "ranking"}
+        assert index.counts.shape == (4, 9)
+
+    def test_term_stats(self, index):
+        """Test frequency, paper counts and citation-weighted impact."""
+        terms = by_term(index.top_terms(20))
+        assert terms["learning"]["frequency"] == 3
+        assert terms["graphs"] == {"term": "graphs", "frequency": 2, "papers": 2,
+                                   "citations": 40, "impact": 20.0}
+        assert index.top_terms(1, sort_by="citations")[0]["citations"] == 45
+
+    def test_cooccurrence(self, index):
+        """Test co-occurrence counts papers sharing both terms."""
+        ids = index.top_term_ids(20)
+        pairs = {(link["source"], link["target"]): link["value"]
+                 for link in index.cooccurrence(ids)}
+        key = ("deep", "graphs") if ("deep", "graphs") in pairs else ("graphs", "deep")
+        assert pairs[key] == 2
+        assert all(value >= 1 for value in pairs.values())
+        assert not any(source == target for source, target in pairs)
+
+    def test_trends(self, index):
+        """Test per-year counts skip undated papers."""
+        trends = index.trends(index.top_term_ids(20))
+        assert trends["learning"] == {2020: 1, 2021: 2}
+        assert trends["survey"] == {}
+
+    def test_document_mark_in_text(self):
+        """Test texts containing the internal separator are still split per paper."""
+        index = TopicIndex.from_texts(["alpha\x00beta", "gamma"], np.zeros(2), np.zeros(2))
+        assert index.counts.shape == (2, 3)
+        assert index.counts[1].nnz == 1
+
+    def test_invalid_metric(self, index):
+        """Test unknown ranking metrics are rejected."""
+        with pytest.raises(ValueError):
+            index.top_terms(sort_by="novelty")
+
+    def test_analyzer_uses_abstracts(self):
+        """Test abstracts contribute terms and results follow added papers."""
+        analyzer = ScholarAnalyzer({"papers": [
+            {"title": "Sparse matrices", "abstract": "Compressed storage", "year": 2020}]})
+        assert "compressed" in by_term(analyzer.analyze_topics()["top_terms"])
+        analyzer.add_papers([{"title": "Sparse solvers", "year": 2021}])
+        assert by_term(analyzer.analyze_topics()["top_terms"])["sparse"]["papers"] == 2
+
+    def test_api_endpoint(self, app, sample_data):
+        """Test the topics endpoint serves terms, links and trends."""
+        response = app.test_client().post("/api/topics?limit=5", json=sample_data)
+        assert response.status_code == 200
+        result = response.get_json()
+        assert set(result) == {"top_terms", "cooccurrence", "trends"}
+        assert len(result["top_terms"]) <= 5